@@ -0,0 +1,146 @@
+"""asyncio API for embedding gesture steering in other applications.
+
+    from gesture_racer.aio import GesturePipeline
+
+    async with GesturePipeline() as pipeline:
+        async for output in pipeline:
+            print(output.timestamp, output.move, output.turn, output.steering_angle)
+
+Capture, MediaPipe inference and gesture decisions run on a single worker
+thread, so the event loop never blocks on the camera. One worker keeps camera
+reads, graph calls (one at a time; which thread does not matter) and filter
+updates in frame order, and lets shutdown run after any in-flight read.
+Results go into a single newest-value slot: a slow consumer skips stale
+frames instead of queueing them, and ``dropped`` counts how many were skipped.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.gestures import GestureOutput
+from gesture_racer.pipeline import PlayerPipeline
+from gesture_racer.players import group_hands
+
+
+class GesturePipeline:
+    def __init__(self, cfg=None, source=None, apply_input: bool = False):
+        """
+        cfg: AppConfig (defaults to DEFAULT_CONFIG).
+        source: object with ``read() -> (frame, t, hands)`` usable as a context
+            manager; defaults to ``sources.open_tracking(cfg)``.
+        apply_input: also press keys like the desktop app. Off by default, in
+            which case the null input backend is used.
+        """
+        cfg = cfg or DEFAULT_CONFIG
+        if not apply_input:
+            cfg = replace(cfg, input_backend="null", async_input_dispatch=False, pwm_steering=False)
+        self.cfg = cfg
+        self._source = source
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gesture-pipeline")
+        num_players = max(1, cfg.num_players)
+        keys = [cfg.movement_keys] if num_players == 1 else [
+            cfg.player_key_maps[i % len(cfg.player_key_maps)] for i in range(num_players)
+        ]
+        self.players = [PlayerPipeline(cfg, k, name=f"P{i + 1}") for i, k in enumerate(keys)]
+        self.max_num_hands = max(cfg.max_num_hands, 2 * num_players) if num_players > 1 else cfg.max_num_hands
+
+        self.latest_outputs: list[GestureOutput] = []  # every player's output for the newest frame
+        self.produced = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._latest = None
+        self._ready = None
+        self._task = None
+        self._error = None
+        self._closed = False
+
+    # --- worker thread -------------------------------------------------
+    def _open(self):
+        if self._source is None:
+            from gesture_racer.sources import open_tracking
+
+            self._source = open_tracking(self.cfg, self.max_num_hands)
+        self._source.__enter__()
+
+    def _step(self) -> list[GestureOutput]:
+        frame, t, hands = self._source.read()
+        w, h = frame.shape[1], frame.shape[0]
+        groups = group_hands(hands, len(self.players), w, self.cfg.player_grouping)
+        outputs = []
+        for player, player_hands in zip(self.players, groups):
+            out = player.process(player_hands, t, w, h, self.cfg.steering_gain, self.cfg.turn_deadband_deg)
+            outputs.append(replace(out, timestamp=t))
+        return outputs
+
+    def _shutdown(self):
+        for player in self.players:
+            player.close()
+        if self._source is not None:
+            self._source.__exit__(None, None, None)
+
+    # --- event loop side ----------------------------------------------
+    async def _produce(self):
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._open)
+            while not self._closed:
+                outputs = await loop.run_in_executor(self._executor, self._step)
+                if self._latest is not None:
+                    self.dropped += 1
+                self._latest = outputs
+                self.latest_outputs = outputs
+                self.produced += 1
+                self._ready.set()
+        except Exception as exc:
+            self._error = exc
+        finally:
+            # wake consumers on error and on cancellation, so they see _error or _closed
+            self._ready.set()
+
+    async def start(self):
+        if self._task is None:
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._produce())
+        return self
+
+    async def aclose(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._ready is not None:
+            self._ready.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        loop = asyncio.get_running_loop()
+        # runs after any in-flight read on the same worker thread
+        await loop.run_in_executor(self._executor, self._shutdown)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> GestureOutput:
+        """Newest player-1 output; see ``latest_outputs`` for every player."""
+        await self.start()
+        while self._latest is None:
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        outputs, self._latest = self._latest, None
+        self.delivered += 1
+        return outputs[0]
@@ -0,0 +1,5 @@
+"""Benchmarks for Gesture Racer.
+
+Each module is runnable with ``python -m gesture_racer.bench.<name>`` and
+returns :class:`~gesture_racer.bench.common.BenchResult` objects from ``run()``.
+"""
@@ -0,0 +1,122 @@
+"""Probe which capture modes a camera really delivers, and how fast.
+
+    python -m gesture_racer.bench.camera                       # camera 0, common modes
+    python -m gesture_racer.bench.camera --source 1 --modes 1280x720@60/MJPG,1280x720@60/MJPG/1
+    python -m gesture_racer.bench.camera --source clip.mp4 --frames 120
+
+A mode is ``WIDTHxHEIGHT@FPS[/FOURCC[/BUFFER]]``. Each one is requested with
+the same ``Camera`` settings the app uses (``camera_width``...), then the
+reported properties, the size of delivered frames, the measured FPS and the
+read-to-read interval are listed. Pick the fastest mode whose "ok" column is
+yes and put it in ``AppConfig``. With a video file the device settings are
+ignored (expect "no"), but the read timing pipeline is exercised the same way.
+"""
+
+import argparse
+import time
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.camera import Camera
+
+DEFAULT_MODES = [
+    "640x480@30",
+    "640x480@30/YUYV",
+    "640x480@30/MJPG/1",
+    "1280x720@30/MJPG/1",
+    "1280x720@60/MJPG/1",
+    "1920x1080@30/MJPG/1",
+]
+
+
+def parse_mode(mode: str) -> dict:
+    size, _, rest = mode.partition("@")
+    w, _, h = size.lower().partition("x")
+    parts = rest.split("/") if rest else [""]
+    return {
+        "width": int(w),
+        "height": int(h),
+        "fps": float(parts[0]) if parts[0] else 0.0,
+        "fourcc": parts[1] if len(parts) > 1 else "",
+        "buffer_size": int(parts[2]) if len(parts) > 2 else 0,
+    }
+
+
+def _source(value: str):
+    return int(value) if value.isdigit() else value
+
+
+def probe_mode(source, mode: str, frames: int = 90, warmup: int = 10):
+    settings = parse_mode(mode)
+    camera = Camera(index=source, flip=False, **settings)
+    try:
+        for _ in range(warmup):
+            frame = camera.read()
+        problems = camera.mismatches + camera.check_frame(frame)
+        intervals, blocking = [], []
+        last = None
+        t_start = time.perf_counter()
+        for _ in range(frames):
+            t0 = time.perf_counter()
+            camera.read()
+            t1 = time.perf_counter()
+            blocking.append(t1 - t0)
+            if last is not None:
+                intervals.append(t1 - last)
+            last = t1
+        elapsed = time.perf_counter() - t_start
+    finally:
+        camera.release()
+    h, w = frame.shape[:2]
+    a = camera.actual
+    row = {
+        "mode": mode,
+        "reported": f"{a['width']}x{a['height']}@{a['fps']:.0f}/{a['fourcc'] or '-'}/{a['buffer_size']}",
+        "delivered": f"{w}x{h}",
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "ok": not problems,
+        "problems": problems,
+    }
+    params = {"source": str(source), **settings}
+    return row, [
+        BenchResult(f"{mode}.read_to_read", intervals, params=params),
+        BenchResult(f"{mode}.read_blocking", blocking, params=params),
+    ]
+
+
+def run(source=0, modes=None, frames: int = 90):
+    rows, results = [], []
+    for mode in modes or DEFAULT_MODES:
+        try:
+            row, r = probe_mode(source, mode, frames)
+        except RuntimeError as exc:
+            rows.append({"mode": mode, "reported": "-", "delivered": "-", "fps": 0.0, "ok": False, "problems": [str(exc)]})
+            continue
+        rows.append(row)
+        results += r
+    return rows, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="0", help="camera index or video path")
+    parser.add_argument("--modes", help="comma-separated WxH@FPS[/FOURCC[/BUFFER]] (default: common modes)")
+    parser.add_argument("--frames", type=int, default=90)
+    args = parser.parse_args(argv)
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()] if args.modes else None
+    rows, results = run(_source(args.source), modes, args.frames)
+
+    table = [("mode", "reported", "delivered", "fps", "ok")]
+    table += [(r["mode"], r["reported"], r["delivered"], f"{r['fps']:.1f}", "yes" if r["ok"] else "no") for r in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(table[0]))]
+    for row in table:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
+    for r in rows:
+        for msg in r["problems"]:
+            print(f"  {r['mode']}: {msg}")
+    print()
+    print_table(results)
+    return rows, results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Key chatter with and without the hysteresis state machine.
+
+    python -m gesture_racer.bench.chatter
+    python -m gesture_racer.bench.chatter --session recorded.jsonl
+
+Replays a recorded session (``main.py --record-session``) or a synthetic one
+where the hands hover around the steering deadband and the brake distance,
+through the same filter/decide path as the live loop, and counts the key
+events each variant sends to the OS.
+"""
+
+import argparse
+import math
+import random
+from types import SimpleNamespace
+
+import numpy as np
+
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.gestures import decide_actions
+from gesture_racer.input_backends import RecordingBackend
+from gesture_racer.input_controller import InputController
+from gesture_racer.landmark_filter import LandmarkFilterBank
+from gesture_racer.session import read_session
+from gesture_racer.smoothing import make_steering_filter
+from gesture_racer.state_machine import GestureStateMachine
+
+
+def synthetic_session(seed: int = 0, fps: float = 30.0, duration_s: float = 20.0, w: int = 1280, h: int = 720, cfg=DEFAULT_CONFIG):
+    """Two hands whose tilt hovers at the deadband and whose spread hovers at the brake distance."""
+    rng = random.Random(seed)
+    n = int(duration_s * fps)
+    for i in range(n):
+        t = i / fps
+        phase = (t // 5) % 2  # alternate 5 s of "hover at deadband" and "hover at brake distance"
+        if phase == 0:
+            tilt_deg = cfg.turn_deadband_deg / cfg.steering_gain + rng.gauss(0, 2.5)
+            spread = 320.0
+        else:
+            tilt_deg = 0.0
+            spread = cfg.brake_distance_px + rng.gauss(0, 10.0)
+        cx, cy = w / 2, h / 2
+        dx = spread / 2 * math.cos(math.radians(tilt_deg))
+        dy = spread / 2 * math.sin(math.radians(tilt_deg))
+        hands = []
+        for label, sx in (("Left", -1), ("Right", 1)):
+            x, y = cx + sx * dx, cy + sx * dy
+            pts = np.zeros((21, 3), dtype=np.float32)
+            pts[:, 0] = x / w
+            pts[:, 1] = y / h
+            hands.append(SimpleNamespace(x=int(x), y=int(y), label=label, score=1.0, landmarks=None, points=pts))
+        yield t, w, h, hands
+
+
+def replay(frames, cfg=DEFAULT_CONFIG, use_state_machine: bool = True, filter_landmarks: bool | None = None) -> dict:
+    filter_landmarks = cfg.landmark_filter_enabled if filter_landmarks is None else filter_landmarks
+    bank = LandmarkFilterBank(cfg.max_num_hands, cfg.landmark_min_cutoff, cfg.landmark_beta, cfg.landmark_d_cutoff)
+    angle_filter = make_steering_filter(cfg)
+    sm = GestureStateMachine(
+        turn_enter_deg=cfg.turn_deadband_deg,
+        turn_exit_deg=cfg.turn_deadband_deg - cfg.turn_hysteresis_deg,
+        brake_enter_px=cfg.brake_distance_px,
+        brake_exit_px=cfg.brake_distance_px + cfg.brake_hysteresis_px,
+        move_min_dwell_s=cfg.move_min_dwell_s,
+        turn_min_dwell_s=cfg.turn_min_dwell_s,
+    )
+    backend = RecordingBackend()
+    controller = InputController(cfg.movement_keys, backend=backend)
+    t0 = t = None
+    for t, w, h, hands in frames:
+        t0 = t if t0 is None else t0
+        if filter_landmarks:
+            hands = bank.update(hands, t, w, h)
+        actions = decide_actions(
+            [(hd.x, hd.y, hd.label) for hd in hands],
+            brake_distance_px=cfg.brake_distance_px,
+            tilt_threshold=cfg.turn_tilt_threshold,
+            steering_gain=cfg.steering_gain,
+            max_steering_deg=cfg.max_steering_deg,
+            turn_deadband_deg=cfg.turn_deadband_deg,
+        )
+        actions.steering_angle = angle_filter.update(actions.steering_angle, t=t)
+        if use_state_machine:
+            actions, _ = sm.update(actions, t)
+        controller.apply_actions(actions.move, actions.turn)
+    controller.release_all()
+    duration = max(1e-6, (t or 0.0) - (t0 or 0.0))
+    return {"key_events": len(backend.events), "key_events_per_s": len(backend.events) / duration, "duration_s": duration}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session", help="recorded session (JSON lines); synthetic if omitted")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    def frames():
+        return read_session(args.session) if args.session else synthetic_session(args.seed)
+
+    raw = replay(frames(), use_state_machine=False)
+    stable = replay(frames(), use_state_machine=True)
+    print(f"{'variant':<16}{'key events':>12}{'events/s':>10}")
+    print(f"{'raw':<16}{raw['key_events']:>12}{raw['key_events_per_s']:>10.2f}")
+    print(f"{'state machine':<16}{stable['key_events']:>12}{stable['key_events_per_s']:>10.2f}")
+    if raw["key_events"]:
+        print(f"reduction: {100.0 * (1 - stable['key_events'] / raw['key_events']):.0f}%")
+    return raw, stable
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+
+@dataclass
+class BenchResult:
+    name: str
+    samples: list[float]  # one value per iteration, in `unit`
+    unit: str = "s"
+    params: dict = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        s = sorted(self.samples)
+        if not s:
+            return {"n": 0}
+        return {
+            "n": len(s),
+            "mean": statistics.fmean(s),
+            "p50": s[len(s) // 2],
+            "p95": s[min(len(s) - 1, int(0.95 * (len(s) - 1) + 0.5))],
+            "min": s[0],
+            "max": s[-1],
+        }
+
+
+def time_calls(fn: Callable[[], object], iterations: int = 1000, warmup: int = 50) -> list[float]:
+    """Per-call wall time of ``fn`` in seconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        t0 = clock()
+        fn()
+        samples.append(clock() - t0)
+    return samples
+
+
+def _fmt(value: float, unit: str) -> str:
+    if unit == "s":
+        if value < 1e-3:
+            return f"{value * 1e6:.1f}us"
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:.3g}{unit}"
+
+
+def print_table(results: Iterable[BenchResult]):
+    rows = [("benchmark", "n", "mean", "p50", "p95", "max")]
+    for r in results:
+        s = r.summary()
+        if not s["n"]:
+            rows.append((r.name, "0", "-", "-", "-", "-"))
+            continue
+        rows.append((r.name, str(s["n"]), *(_fmt(s[k], r.unit) for k in ("mean", "p50", "p95", "max"))))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
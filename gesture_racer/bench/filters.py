@@ -0,0 +1,137 @@
+"""Jitter vs. lag of the steering filters on synthetic or recorded traces.
+
+    python -m gesture_racer.bench.filters
+    python -m gesture_racer.bench.filters --trace session.jsonl
+
+A recorded trace is JSON lines with ``t`` (seconds) and ``angle`` (raw
+steering degrees). Recorded traces have no ground truth, so a centered
+(non-causal) moving average stands in for it.
+
+Reported per filter:
+  jitter_deg   std of the output around the truth while the hands hold still
+  lag_ms       delay that best aligns the output with the truth during motion
+  step_90_ms   time to reach 90% of a step change (synthetic traces only)
+  update_us    cost of one update() call
+"""
+
+import argparse
+import json
+import random
+from dataclasses import replace
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, time_calls
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.smoothing import make_steering_filter
+
+
+def synthetic_trace(seed: int = 0, fps: float = 30.0, noise_deg: float = 3.0, duration_s: float = 8.0):
+    """Holds, a step, a ramp and a sine with noisy frame timing (drops to half rate mid-way).
+
+    Returns (t, measured, truth, holds mask, step time).
+    """
+    rng = random.Random(seed)
+    ts, truth = [], []
+    t = 0.0
+    while t < duration_s:
+        if t < 1.0:
+            v = 0.0
+        elif t < 2.5:
+            v = 30.0
+        elif t < 3.5:
+            v = 30.0 - 70.0 * (t - 2.5)
+        elif t < 4.5:
+            v = -40.0
+        elif t < 6.5:
+            v = 25.0 * np.sin(2 * np.pi * 0.5 * (t - 4.5))
+        else:
+            v = 0.0
+        ts.append(t)
+        truth.append(v)
+        period = 1.0 / (fps / 2 if 5.0 < t < 6.0 else fps)
+        t += max(1e-3, rng.gauss(period, period * 0.15))
+    ts = np.array(ts)
+    truth = np.array(truth)
+    measured = truth + np.array([rng.gauss(0.0, noise_deg) for _ in ts])
+    holds = ((ts > 1.4) & (ts < 2.5)) | ((ts > 3.9) & (ts < 4.5)) | (ts > 6.9)
+    return ts, measured, truth, holds, 1.0
+
+
+def load_trace(path: str):
+    ts, measured = [], []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                ts.append(float(row["t"]))
+                measured.append(float(row["angle"]))
+    ts = np.array(ts)
+    measured = np.array(measured)
+    kernel = np.ones(7) / 7.0
+    truth = np.convolve(measured, kernel, mode="same")
+    speed = np.abs(np.gradient(truth, ts))
+    holds = speed < 5.0  # deg/s
+    return ts, measured, truth, holds, None
+
+
+def _lag_ms(ts, out, truth, moving, max_lag_ms: int = 400) -> float:
+    best, best_err = 0, float("inf")
+    for lag in range(0, max_lag_ms + 1, 2):
+        shifted = np.interp(ts - lag / 1000.0, ts, truth)
+        err = float(np.mean((out[moving] - shifted[moving]) ** 2))
+        if err < best_err:
+            best, best_err = lag, err
+    return float(best)
+
+
+def evaluate(filt, ts, measured, truth, holds, step_t=None) -> dict:
+    filt.reset()
+    out = np.array([filt.update(float(z), t=float(t)) for t, z in zip(ts, measured)])
+    jitter = float(np.std(out[holds] - truth[holds])) if holds.any() else 0.0
+    result = {"jitter_deg": jitter, "lag_ms": _lag_ms(ts, out, truth, ~holds)}
+    if step_t is not None:
+        after = (ts >= step_t) & (ts < step_t + 1.5)
+        target = truth[after][-1]
+        reached = np.nonzero(after & (out >= 0.9 * target))[0]
+        result["step_90_ms"] = (ts[reached[0]] - step_t) * 1000.0 if len(reached) else float("nan")
+    return result
+
+
+def filter_variants(cfg=DEFAULT_CONFIG):
+    return {
+        "ema": replace(cfg, steering_filter="ema"),
+        "one_euro": replace(cfg, steering_filter="one_euro"),
+        "kalman": replace(cfg, steering_filter="kalman"),
+        "kalman+predict50ms": replace(cfg, steering_filter="kalman", kalman_predict_s=0.05),
+    }
+
+
+def run(trace: str | None = None, seed: int = 0, iterations: int = 5000) -> list[BenchResult]:
+    ts, measured, truth, holds, step_t = load_trace(trace) if trace else synthetic_trace(seed)
+    results = []
+    print(f"{'filter':<20}{'jitter_deg':>12}{'lag_ms':>10}{'step_90_ms':>12}{'update_us':>11}")
+    for name, cfg in filter_variants().items():
+        filt = make_steering_filter(cfg)
+        metrics = evaluate(filt, ts, measured, truth, holds, step_t)
+        clock = iter(range(10 ** 9))
+        samples = time_calls(lambda: filt.update(10.0, t=next(clock) / 30.0), iterations)
+        update_us = float(np.mean(samples)) * 1e6
+        print(
+            f"{name:<20}{metrics['jitter_deg']:>12.2f}{metrics['lag_ms']:>10.0f}"
+            f"{metrics.get('step_90_ms', float('nan')):>12.0f}{update_us:>11.2f}"
+        )
+        results.append(BenchResult(f"filter.{name}.update", samples, params={"steering_filter": cfg.steering_filter, **metrics}))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trace", help="JSON lines with t and angle; synthetic trace if omitted")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    return run(args.trace, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""CPU use while nobody is playing, and how fast the loop wakes up.
+
+    python -m gesture_racer.bench.idle
+    python -m gesture_racer.bench.idle --seconds 60 --idle-after 2 --interval 0.25,0.5 --save
+
+The main loop (source read, idle switch, pipeline and full overlay when
+active, dimmed HUD when idle) runs in real time on a simulated 1280x720
+camera paced at ``--fps``. The tracker is a stand-in whose cost is OpenCV
+work proportional to the frame area, and a hand appears and leaves on a
+random script, so no camera or MediaPipe is needed. Each variant replays the
+same script:
+
+- ``always_on``: idle mode off (``idle_after_s = 0``).
+- ``idle@<interval>``: idle mode with that detection interval.
+
+Reported per variant: process CPU % in each second with no hand (once the
+idle delay has passed) and with a hand, and the wake latency from the hand's
+appearance to the end of the first full-rate frame that saw it (with idle
+mode off that is just the frame time plus up to one camera period).
+"""
+
+import argparse
+import random
+import time
+from dataclasses import replace
+
+import cv2
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.players import _synthetic_hands
+from gesture_racer.bench.overlay import make_overlay
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.idle import IdleMode, draw_idle_hud
+from gesture_racer.pipeline import PlayerPipeline
+from gesture_racer.sources import TrackedCamera
+from gesture_racer.timing import sleep_until
+
+
+class SimulatedCamera:
+    """Frames at a fixed rate; a read waits for the next one, like a camera with one buffer."""
+
+    def __init__(self, w: int, h: int, fps: float, seed: int = 0):
+        self.period = 1.0 / fps
+        self.background = np.random.default_rng(seed).integers(0, 255, (h, w, 3), dtype=np.uint8)
+        self.t0 = time.perf_counter()
+        self.mismatches = []
+
+    def check_frame(self, frame):
+        return []
+
+    def read(self, fresh: bool = False):
+        # a fresh read drops whatever was queued, which here means the same thing: the next frame
+        n = int((time.perf_counter() - self.t0) / self.period) + 1
+        sleep_until(self.t0 + n * self.period)
+        return self.background.copy()
+
+    def release(self):
+        pass
+
+
+class ScriptedTracker:
+    """Stands in for ``HandTracker``: OpenCV work scaled by frame area, hands from a script."""
+
+    def __init__(self, present, clock=time.perf_counter, work: int = 3, seed: int = 0):
+        self.present = present
+        self.clock = clock
+        self.work = work
+        self.rng = random.Random(seed)
+        self.ready = True
+
+    def process(self, frame):
+        for _ in range(self.work):
+            cv2.GaussianBlur(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (9, 9), 0)
+        h, w = frame.shape[:2]
+        return _synthetic_hands(self.rng, 1, w, h)[:1] if self.present(self.clock()) else []
+
+
+def make_script(seconds: float, idle_after_s: float, seed: int = 0) -> list[tuple[float, float]]:
+    """(appear, leave) times: a hand for 3-6 s, then gone long enough for idle mode to kick in."""
+    rng = random.Random(seed)
+    spans, t = [], 1.0
+    while t < seconds:
+        stay = rng.uniform(3.0, 6.0)
+        spans.append((t, min(seconds, t + stay)))
+        t += stay + idle_after_s + rng.uniform(2.0, 6.0)
+    return spans
+
+
+def run_variant(spans, seconds: float, idle_after_s: float, interval_s: float, scale: float,
+                fps: float = 30.0, w: int = 1280, h: int = 720, seed: int = 0) -> dict:
+    cfg = replace(DEFAULT_CONFIG, input_backend="null", async_input_dispatch=False)
+    start = time.perf_counter()
+
+    def present(now: float) -> bool:
+        return any(a <= now - start < b for a, b in spans)
+
+    def absent_long(now: float) -> bool:
+        # no hand, and none for at least idle_after_s: idle mode could be on
+        t = now - start
+        return not present(now) and all(not (a <= t < b + idle_after_s) for a, b in spans) and t >= idle_after_s
+
+    source = TrackedCamera(cfg)  # not entered: camera and tracker are swapped for the simulated ones
+    source.camera = SimulatedCamera(w, h, fps, seed)
+    source.tracker = ScriptedTracker(present, seed=seed)
+    source._checked = True
+    idle = IdleMode(idle_after_s, interval_s, scale) if idle_after_s > 0 else None
+    player = PlayerPipeline(cfg, cfg.movement_keys)
+    overlay = make_overlay(cfg)
+
+    cpu = {"absent": [], "present": []}
+    wake = []
+    answered = set()  # spans already seen by a full-rate frame
+    second_mark = (time.perf_counter(), time.process_time())
+    second_state = None
+    try:
+        while time.perf_counter() - start < seconds:
+            frame, frame_time, hands = source.read()
+            if idle is not None and idle.update(len(hands), frame_time):
+                source.set_idle(idle.period, idle.scale)
+            if idle is not None and idle.idle:
+                draw_idle_hud(frame)
+            else:
+                actions = player.process(hands, frame_time, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+                overlay.draw(frame, player.hands, actions, show_debug=cfg.show_debug, extra_chips=["bench"], draw_handles=True)
+                span = next((i for i, (a, b) in enumerate(spans) if a <= frame_time - start < b), None)
+                if hands and span is not None and span not in answered:
+                    answered.add(span)
+                    wake.append(time.perf_counter() - start - spans[span][0])
+            if idle is not None:
+                idle.frame_done()
+
+            now = time.perf_counter()
+            state = "present" if present(now) else "absent" if absent_long(now) else None
+            if state != second_state or now - second_mark[0] >= 1.0:
+                wall, proc = now - second_mark[0], time.process_time() - second_mark[1]
+                if second_state is not None and wall >= 0.5:
+                    cpu[second_state].append(100.0 * proc / wall)
+                second_mark, second_state = (now, time.process_time()), state
+    finally:
+        player.close()
+    return {"cpu": cpu, "wake": wake, "idle": idle.stats() if idle is not None else {}}
+
+
+def run(seconds: float = 40.0, idle_after_s: float = 2.0, intervals=(0.25,), scale: float = 0.5,
+        fps: float = 30.0, seed: int = 0) -> list[BenchResult]:
+    spans = make_script(seconds, idle_after_s, seed)
+    variants = [("always_on", 0.0, 0.0)] + [(f"idle@{i:g}", idle_after_s, i) for i in intervals]
+    results = []
+    for name, after, interval in variants:
+        out = run_variant(spans, seconds, after, interval, scale, fps, seed=seed)
+        params = {"idle_after_s": after, "interval_s": interval, "scale": scale, "fps": fps}
+        results.append(BenchResult(f"idle.cpu_absent.{name}", out["cpu"]["absent"], unit="%", params=params))
+        results.append(BenchResult(f"idle.cpu_present.{name}", out["cpu"]["present"], unit="%", params=params))
+        results.append(BenchResult(f"idle.wake.{name}", out["wake"], params={**params, **out["idle"]}))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=40.0, help="per variant, in real time")
+    parser.add_argument("--idle-after", type=float, default=2.0, help="idle_after_s (shorter than the default, to fit the run)")
+    parser.add_argument("--interval", default="0.25", help="comma-separated idle_detect_interval_s values")
+    parser.add_argument("--scale", type=float, default=DEFAULT_CONFIG.idle_scale)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    intervals = [float(v) for v in args.interval.split(",") if v]
+    results = run(args.seconds, args.idle_after, intervals, args.scale, args.fps, args.seed)
+    print_table(results)
+    save_if_requested(args, results, "idle", resolution=(1280, 720))
+    return results
+
+
+if __name__ == "__main__":
+    main()
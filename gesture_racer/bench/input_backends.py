@@ -0,0 +1,69 @@
+"""Press/release round-trip cost per input backend.
+
+    python -m gesture_racer.bench.input_backends
+    python -m gesture_racer.bench.input_backends --backends pynput --key f20
+
+Only the side-effect free backends (null, recording) run by default; real
+backends send keystrokes to the focused window, so they must be requested
+explicitly.
+"""
+
+import argparse
+import time
+
+from gesture_racer.bench.common import BenchResult, print_table, time_calls
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.input_backends import create_backend
+from gesture_racer.input_controller import InputController
+
+
+def run(backends=("null", "recording"), key: str = "w", iterations: int = 2000) -> list[BenchResult]:
+    results = []
+    for name in backends:
+        try:
+            backend = create_backend(name)
+        except Exception as exc:
+            print(f"skip {name}: {exc}")
+            continue
+
+        def round_trip():
+            backend.press(key)
+            backend.release(key)
+
+        results.append(BenchResult(f"backend.{name}.press_release", time_calls(round_trip, iterations), params={"key": key}))
+
+        # What the frame loop pays with the async dispatcher in front of the backend
+        controller = InputController(async_dispatch=True, backend=backend)
+        state = [False]
+
+        def publish():
+            state[0] = not state[0]
+            controller.apply_actions("forward" if state[0] else "stop", "straight")
+
+        results.append(BenchResult(f"dispatch.{name}.publish", time_calls(publish, iterations), params={"key": "w"}))
+
+        # Publish -> OS call latency, paced so the dispatcher thread is not starved of the GIL
+        controller.dispatcher.latency.clear()
+        for _ in range(min(iterations, 500)):
+            publish()
+            time.sleep(0.002)
+        results.append(BenchResult(f"dispatch.{name}.latency", list(controller.dispatcher.latency.samples)))
+        controller.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="null,recording", help="comma-separated backend names")
+    parser.add_argument("--key", default="w")
+    parser.add_argument("--iterations", type=int, default=2000)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+    results = run([b.strip() for b in args.backends.split(",") if b.strip()], args.key, args.iterations)
+    print_table(results)
+    save_if_requested(args, results, "input_backends")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Gesture-to-key latency and chatter on scripted two-hand trajectories.
+
+    python -m gesture_racer.bench.latency
+    python -m gesture_racer.bench.latency --configs default,one_euro --tracker-latency-ms 35 --fps 60
+
+Runs without MediaPipe or a camera: a scripted tracker stands in for
+``HandTracker`` and returns noisy ``HandData`` for each simulated frame of
+
+- ``step``: the wheel snaps from level to a 25° tilt and back (alternating sides),
+- ``ramp``: the tilt rises slowly through the deadband and falls back,
+- ``brake``: the hands close in past the brake distance and separate again,
+- ``jitter``: hands held just inside the deadband with 3x the tracker noise
+  (no key should move).
+
+Frames go through the real ``PlayerPipeline`` (landmark filter, decide,
+steering filter, hysteresis, ``InputController``) with a recording backend on
+the simulated clock. Latency is measured from the moment the scripted hands
+cross the decision threshold (what the driver did) to the matching key
+press/release (reported separately: hysteresis mostly delays releases).
+The match must come before the driver's next threshold crossing of any key;
+an intent without one is missed, and every other key event, including one
+that fires before its threshold is crossed or after the window, counts as
+chatter.
+"""
+
+import argparse
+import math
+import random
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.hand_tracking import HandData
+from gesture_racer.input_backends import RecordingBackend
+from gesture_racer.input_controller import InputController
+from gesture_racer.pipeline import PlayerPipeline
+
+# Config variants compared by default (overrides of DEFAULT_CONFIG)
+VARIANTS = {
+    "default": {},
+    "no_hysteresis": {"hysteresis_enabled": False},
+    "one_euro": {"steering_filter": "one_euro"},
+    "kalman": {"steering_filter": "kalman"},
+    "unfiltered": {"landmark_filter_enabled": False, "hysteresis_enabled": False, "smoothing_alpha_angle": 1.0},
+}
+ROLES = ("forward", "left", "reverse", "right")  # order of movement_keys
+
+
+@dataclass
+class Scenario:
+    name: str
+    duration_s: float
+    hands_at: object  # t -> (left (x, y), right (x, y)) in px, noise-free
+    intents: list  # (t, "press" | "release", role): when the driver's hands crossed a threshold
+    noise_scale: float = 1.0
+
+
+class SimClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+class ScriptedTracker:
+    """Stands in for ``HandTracker``: scripted hands plus tracker-like pixel noise."""
+
+    ready = True
+
+    def __init__(self, scenario: Scenario, clock: SimClock, w: int, h: int, noise_px: float, rng: random.Random):
+        self.scenario = scenario
+        self.clock = clock
+        self.w, self.h = w, h
+        self.noise_px = noise_px
+        self.rng = rng
+
+    def process(self, frame) -> list[HandData]:
+        hands = []
+        for label, (x, y) in zip(("Left", "Right"), self.scenario.hands_at(self.clock.t)):
+            x += self.rng.gauss(0.0, self.noise_px * self.scenario.noise_scale)
+            y += self.rng.gauss(0.0, self.noise_px * self.scenario.noise_scale)
+            pts = np.zeros((21, 3), dtype=np.float32)
+            pts[:, 0] = x / self.w
+            pts[:, 1] = y / self.h
+            hands.append(HandData(x=int(x), y=int(y), label=label, points=pts))
+        return hands
+
+
+def _wheel(cx: float, cy: float, tilt_deg: float, spread: float):
+    dx = spread / 2 * math.cos(math.radians(tilt_deg))
+    dy = spread / 2 * math.sin(math.radians(tilt_deg))
+    return (cx - dx, cy - dy), (cx + dx, cy + dy)
+
+
+def _segments(rng: random.Random, reps: int, lengths: tuple, fps: float):
+    """Start time of each repetition (random phase against the frame clock)."""
+    starts, t = [], 0.0
+    for _ in range(reps):
+        t += rng.uniform(0.0, 1.0 / fps)
+        starts.append(t)
+        t += sum(lengths)
+    return starts, t
+
+
+def make_scenarios(cfg, w: int = 1280, h: int = 720, reps: int = 20, fps: float = 30.0, seed: int = 0) -> list[Scenario]:
+    rng = random.Random(seed)
+    cx, cy = w / 2, h / 2
+    spread = 320.0
+    # wheel tilt at which decide_actions starts turning
+    cross_deg = cfg.turn_deadband_deg / cfg.steering_gain
+    scenarios = []
+
+    # step: 1 s level, 1 s at +-25 deg, 1 s level
+    starts, total = _segments(rng, reps, (1.0, 1.0, 1.0), fps)
+
+    def step_at(t, starts=starts):
+        i = max(0, np.searchsorted(starts, t, side="right") - 1)
+        local = t - starts[i]
+        tilt = (25.0 if i % 2 == 0 else -25.0) if 1.0 <= local < 2.0 else 0.0
+        return _wheel(cx, cy, tilt, spread)
+
+    intents = []
+    for i, s in enumerate(starts):
+        role = "right" if i % 2 == 0 else "left"
+        intents += [(s + 1.0, "press", role), (s + 2.0, "release", role)]
+    scenarios.append(Scenario("step", total, step_at, intents))
+
+    # ramp: 0 -> 30 deg over 1.5 s, hold 0.5 s, back over 1.5 s, 0.5 s level
+    starts, total = _segments(rng, reps, (0.5, 1.5, 0.5, 1.5), fps)
+    rate = 30.0 / 1.5
+
+    def ramp_at(t, starts=starts):
+        i = max(0, np.searchsorted(starts, t, side="right") - 1)
+        local = t - starts[i]
+        sign = 1.0 if i % 2 == 0 else -1.0
+        if local < 0.5:
+            tilt = 0.0
+        elif local < 2.0:
+            tilt = (local - 0.5) * rate
+        elif local < 2.5:
+            tilt = 30.0
+        else:
+            tilt = max(0.0, 30.0 - (local - 2.5) * rate)
+        return _wheel(cx, cy, sign * tilt, spread)
+
+    intents = []
+    for i, s in enumerate(starts):
+        role = "right" if i % 2 == 0 else "left"
+        intents += [(s + 0.5 + cross_deg / rate, "press", role), (s + 2.5 + (30.0 - cross_deg) / rate, "release", role)]
+    scenarios.append(Scenario("ramp", total, ramp_at, intents))
+
+    # brake: 0.5 s apart, close to 60 px over 0.8 s, hold 1 s, open over 0.8 s, 0.5 s apart
+    starts, total = _segments(rng, reps, (0.5, 0.8, 1.0, 0.8, 0.5), fps)
+    near, speed = 60.0, (spread - 60.0) / 0.8
+
+    def brake_at(t, starts=starts):
+        local = t - starts[max(0, np.searchsorted(starts, t, side="right") - 1)]
+        if local < 0.5:
+            d = spread
+        elif local < 1.3:
+            d = spread - (local - 0.5) * speed
+        elif local < 2.3:
+            d = near
+        else:
+            d = min(spread, near + (local - 2.3) * speed)
+        return _wheel(cx, cy, 0.0, d)
+
+    cross = (spread - cfg.brake_distance_px) / speed
+    intents = []
+    for s in starts:
+        intents += [(s + 0.5 + cross, "press", "reverse"), (s + 2.3 + (0.8 - cross), "release", "reverse")]
+    scenarios.append(Scenario("brake", total, brake_at, intents))
+
+    # jitter: 10 s at 80% of the turn threshold, noisy
+    scenarios.append(Scenario("jitter", 10.0, lambda t: _wheel(cx, cy, 0.8 * cross_deg, spread), [], noise_scale=3.0))
+    return scenarios
+
+
+def run_scenario(cfg, scenario: Scenario, fps: float = 30.0, tracker_latency_s: float = 0.0, noise_px: float = 2.0,
+                 frame_jitter_s: float = 0.002, w: int = 1280, h: int = 720, seed: int = 0) -> dict:
+    """Drive one scenario through the pipeline; returns latencies (s) per action, missed intents and chatter."""
+    rng = random.Random(seed)
+    clock = SimClock()
+    backend = RecordingBackend(clock=clock)
+    controller = InputController(
+        cfg.movement_keys,
+        async_dispatch=False,  # events stamped on the simulated clock, in order
+        turn_deadband_deg=cfg.turn_deadband_deg,
+        max_steering_deg=cfg.max_steering_deg,
+        backend=backend,
+    )
+    player = PlayerPipeline(cfg, cfg.movement_keys, controller=controller)
+    tracker = ScriptedTracker(scenario, clock, w, h, noise_px, rng)
+    frame = np.zeros((1, 1, 3), dtype=np.uint8)  # the stub tracker ignores pixels
+
+    n = int(scenario.duration_s * fps)
+    for i in range(n):
+        capture_t = i / fps + rng.uniform(-frame_jitter_s, frame_jitter_s)
+        clock.t = max(0.0, capture_t)
+        hands = tracker.process(frame)
+        clock.t += tracker_latency_s  # keys go out once inference has finished
+        player.process(hands, capture_t, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+    end_t = clock.t
+    player.close()
+
+    keys = dict(zip(ROLES, cfg.movement_keys))
+    events = [e for e in backend.events if e.t <= end_t]
+    used = set()
+    latencies, missed = {"press": [], "release": []}, 0
+    intents = sorted(scenario.intents)
+    for k, (t_intent, action, role) in enumerate(intents):
+        key = keys[role]
+        # only up to the driver's next move: anything later belongs to that one
+        later = [t for t, a, r in intents[k + 1:] if t > t_intent]
+        deadline = later[0] if later else end_t
+        match = next((j for j, e in enumerate(events)
+                      if j not in used and e.key == key and e.action == action and t_intent <= e.t < deadline), None)
+        if match is None:
+            missed += 1
+            continue
+        used.add(match)
+        latencies[action].append(events[match].t - t_intent)
+    # w is pressed while both hands are apart and released while braking; those follow from the intents
+    movement = [e for j, e in enumerate(events) if j not in used and e.key != keys["forward"]]
+    return {
+        "latencies": latencies,
+        "missed": missed,
+        "intents": len(intents),
+        "chatter_events": len(movement),
+        "chatter_per_s": len(movement) / max(1e-6, scenario.duration_s),
+    }
+
+
+def run(variants: list[str] | None = None, fps: float = 30.0, tracker_latency_ms: float = 0.0, noise_px: float = 2.0,
+        reps: int = 20, seed: int = 0):
+    rows = []
+    results = []
+    for name in variants or list(VARIANTS):
+        cfg = replace(DEFAULT_CONFIG, input_backend="null", async_input_dispatch=False, pwm_steering=False, **VARIANTS[name])
+        for scenario in make_scenarios(cfg, reps=reps, fps=fps, seed=seed):
+            out = run_scenario(cfg, scenario, fps, tracker_latency_ms / 1000.0, noise_px, seed=seed)
+            params = {"config": name, "fps": fps, "tracker_latency_ms": tracker_latency_ms, "noise_px": noise_px}
+            for action, samples in out["latencies"].items():
+                if scenario.intents:
+                    results.append(BenchResult(f"latency.{name}.{scenario.name}.{action}", samples, params=params))
+            rows.append((name, scenario.name, out))
+    return results, rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configs", default=",".join(VARIANTS), help=f"comma-separated, from: {', '.join(VARIANTS)}")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--tracker-latency-ms", type=float, default=0.0, help="capture -> landmarks delay added to every frame")
+    parser.add_argument("--noise-px", type=float, default=2.0, help="per-frame wrist noise (std dev, px)")
+    parser.add_argument("--reps", type=int, default=20, help="repetitions of each scripted gesture")
+    parser.add_argument("--seed", type=int, default=0)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    variants = [v.strip() for v in args.configs.split(",") if v.strip()]
+    unknown = [v for v in variants if v not in VARIANTS]
+    if unknown:
+        parser.error(f"unknown config(s): {', '.join(unknown)}")
+    results, rows = run(variants, args.fps, args.tracker_latency_ms, args.noise_px, args.reps, args.seed)
+    print_table(results)
+    print()
+    print(f"{'config':<16}{'scenario':<10}{'missed':>10}{'chatter':>10}{'events/s':>10}")
+    for name, scenario, out in rows:
+        missed = f"{out['missed']}/{out['intents']}" if out["intents"] else "-"
+        print(f"{name:<16}{scenario:<10}{missed:>10}{out['chatter_events']:>10}{out['chatter_per_s']:>10.2f}")
+    save_if_requested(args, results, "latency", resolution=(1280, 720))
+    return results, rows
+
+
+if __name__ == "__main__":
+    main()
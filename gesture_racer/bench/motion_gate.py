@@ -0,0 +1,226 @@
+"""Inference skip ratio of the motion gate and what skipping costs in accuracy.
+
+    python -m gesture_racer.bench.motion_gate
+    python -m gesture_racer.bench.motion_gate --thresholds 1,2,4 --min-hz 5,10
+    python -m gesture_racer.bench.motion_gate --video drive.mp4 --save
+
+Each gate setting runs over the same frames next to an ungated reference:
+
+- With ``--video`` (needs mediapipe) the reference is ``HandTracker`` on every
+  frame and the gated run has its own tracker, so the error includes
+  MediaPipe's own frame-to-frame jitter the gate suppresses.
+- Without it, two hands on a steering wheel are drawn onto a textured
+  960x540 frame with sensor noise: long holds with a slight tremor, and turns
+  between them. The stand-in tracker returns the drawn landmarks exactly,
+  after OpenCV work that stands in for inference cost.
+
+Reported per setting: skip ratio, frame time (gate plus tracker), wrist error
+against the reference (px), steering angle error (deg) and the share of
+frames where both runs press the same keys, each through its own
+``PlayerPipeline`` with the null input backend.
+"""
+
+import argparse
+import math
+from dataclasses import replace
+
+import cv2
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.hand_tracking import HandData
+from gesture_racer.motion_gate import MotionGate
+from gesture_racer.pipeline import PlayerPipeline
+from gesture_racer.poses import place_hand, synthetic_hand
+
+# finger chains from the wrist, for drawing
+_BONES = [(0, 1, 2, 3, 4), (0, 5, 6, 7, 8), (0, 9, 10, 11, 12), (0, 13, 14, 15, 16), (0, 17, 18, 19, 20), (5, 9, 13, 17)]
+
+
+def wheel_angle(t: float) -> float:
+    """Steering script: holds of 2-4 s with turns of 0.4-0.8 s between them."""
+    script = [(0.0, 0.0), (3.0, 0.0), (3.6, 30.0), (6.0, 30.0), (6.5, 0.0), (9.5, 0.0), (10.3, -35.0), (12.5, -35.0), (13.0, 0.0), (16.0, 0.0)]
+    t = t % script[-1][0]
+    for (t0, a0), (t1, a1) in zip(script, script[1:]):
+        if t0 <= t <= t1:
+            u = (t - t0) / (t1 - t0) if t1 > t0 else 1.0
+            return a0 + (a1 - a0) * (3 * u * u - 2 * u * u * u)
+    return 0.0
+
+
+class SyntheticDrive:
+    """Frames of two hands on a wheel, and the landmarks they were drawn from."""
+
+    def __init__(self, w: int = 960, h: int = 540, fps: float = 30.0, noise: float = 3.0, seed: int = 0):
+        self.w, self.h, self.fps, self.noise = w, h, fps, noise
+        rng = np.random.default_rng(seed)
+        texture = rng.integers(40, 200, (h // 16, w // 16, 3), dtype=np.uint8)
+        self.background = cv2.resize(texture, (w, h), interpolation=cv2.INTER_LINEAR)
+        self.palm = synthetic_hand("fist")
+        self.rng = rng
+
+    def frame(self, i: int):
+        t = i / self.fps
+        angle = wheel_angle(t)
+        cx, cy, radius = self.w * 0.5, self.h * 0.55, self.h * 0.3
+        tremor = 0.6 * math.sin(2 * math.pi * 7.3 * t)  # px; a steady grip is never perfectly still
+        frame = self.background.copy()
+        hands = []
+        for label, side in (("Left", 180.0), ("Right", 0.0)):
+            a = math.radians(angle + side)
+            hx, hy = cx + radius * math.cos(a) + tremor, cy + radius * math.sin(a) - tremor
+            px = place_hand(self.palm, hx, hy, self.h * 0.09, roll_deg=angle, label=label)
+            for bone in _BONES:
+                cv2.polylines(frame, [px[list(bone), :2].astype(np.int32)], False, (120, 160, 220), 9, cv2.LINE_AA)
+            pts = px.copy()
+            pts[:, 0] /= self.w
+            pts[:, 1] /= self.h
+            hands.append(HandData(x=int(hx), y=int(hy), label=label, points=pts))
+        if self.noise:
+            frame = cv2.add(frame, self.rng.normal(0.0, self.noise, frame.shape).astype(np.int8), dtype=cv2.CV_8U)
+        return frame, hands
+
+
+class SyntheticTracker:
+    """Returns the drawn landmarks of the current frame after some OpenCV work."""
+
+    def __init__(self, work: int = 3):
+        self.work = work
+        self.truth = []
+
+    def process(self, frame):
+        for _ in range(self.work):
+            cv2.GaussianBlur(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (9, 9), 0)
+        return [HandData(x=h.x, y=h.y, label=h.label, points=h.points.copy()) for h in self.truth]
+
+
+def _wrist_errors(ref, test, w: int, h: int) -> list[float]:
+    by_label = {hand.label: hand for hand in test}
+    out = []
+    for hand in ref:
+        other = by_label.get(hand.label)
+        if other is None:
+            continue
+        out.append(float(np.hypot((hand.points[0, 0] - other.points[0, 0]) * w, (hand.points[0, 1] - other.points[0, 1]) * h)))
+    return out
+
+
+def run_setting(frames_fn, n: int, w: int, h: int, gate: MotionGate, infer_ref, infer_gated, fps: float) -> dict:
+    import time
+
+    cfg = replace(DEFAULT_CONFIG, input_backend="null", async_input_dispatch=False)
+    ref_player, gated_player = PlayerPipeline(cfg, cfg.movement_keys), PlayerPipeline(cfg, cfg.movement_keys)
+    times, wrist, angle_err, same = [], [], [], 0
+    try:
+        for i in range(n):
+            frame, truth = frames_fn(i)
+            t = i / fps
+            ref = infer_ref(frame, truth)
+            t0 = time.perf_counter()
+            gated = gate.process(frame, lambda f: infer_gated(f, truth), t)
+            times.append(time.perf_counter() - t0)
+            wrist += _wrist_errors(ref, gated, w, h)
+            a = ref_player.process(ref, t, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+            b = gated_player.process(gated, t, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+            angle_err.append(abs(a.steering_angle - b.steering_angle))
+            same += (a.move, a.turn) == (b.move, b.turn)
+    finally:
+        ref_player.close()
+        gated_player.close()
+    return {"times": times, "wrist": wrist, "angle": angle_err, "agree": same / max(1, n), **gate.stats()}
+
+
+def run(thresholds=(1.0, 2.0, 4.0), min_hz=(10.0,), frames: int = 480, video: str | None = None,
+        downsample: int = DEFAULT_CONFIG.motion_gate_downsample, fps: float = 30.0) -> list[BenchResult]:
+    if video:
+        from gesture_racer.bench.tracker import read_frames
+        from gesture_racer.hand_tracking import HandTracker
+        from gesture_racer.sources import tracker_kwargs
+
+        images = read_frames(video, frames)
+        n = len(images)
+        h, w = images[0].shape[:2]
+        ref_tracker = HandTracker(**tracker_kwargs(DEFAULT_CONFIG)).__enter__()
+        reference = [ref_tracker.process(img) for img in images]
+        ref_tracker.__exit__(None, None, None)
+
+        def frames_fn(i):
+            return images[i], reference[i]
+
+        def make_infer():
+            tracker = HandTracker(**tracker_kwargs(DEFAULT_CONFIG)).__enter__()
+            return tracker, lambda f, truth: tracker.process(f)
+    else:
+        drive = SyntheticDrive(fps=fps)
+        w, h = drive.w, drive.h
+        rendered = [drive.frame(i) for i in range(frames)]
+        n = frames
+
+        def frames_fn(i):
+            return rendered[i]
+
+        def make_infer():
+            tracker = SyntheticTracker()
+
+            def infer(f, truth):
+                tracker.truth = truth
+                return tracker.process(f)
+            return None, infer
+
+    results = []
+    settings = [(None, None)] + [(th, hz) for hz in min_hz for th in thresholds]
+    for th, hz in settings:
+        # th None: ungated baseline, for the frame time
+        gate = MotionGate(threshold=th if th is not None else -1.0, min_rate_hz=hz or 0.0, downsample=downsample)
+        closer, infer = make_infer()
+        try:
+            out = run_setting(frames_fn, n, w, h, gate, lambda f, truth: truth, infer, fps)
+        finally:
+            if closer is not None:
+                closer.__exit__(None, None, None)
+        name = "motion_gate.off" if th is None else f"motion_gate.t{th:g}.min{hz:g}hz"
+        wrist = sorted(out["wrist"]) or [0.0]
+        angle = sorted(out["angle"]) or [0.0]
+        params = {
+            "threshold": th, "min_hz": hz, "downsample": downsample, "w": w, "h": h,
+            "skip_ratio": round(out["gate_skip_ratio"], 3),
+            "forced": out["gate_forced"],
+            "wrist_px_p95": round(wrist[int(0.95 * (len(wrist) - 1))], 2),
+            "wrist_px_max": round(wrist[-1], 2),
+            "angle_deg_p95": round(angle[int(0.95 * (len(angle) - 1))], 2),
+            "keys_agree": round(out["agree"], 4),
+        }
+        results.append(BenchResult(name, out["times"], params=params))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video file (needs mediapipe); default: synthetic drive")
+    parser.add_argument("--thresholds", default="1,2,4", help="comma-separated motion_gate_threshold values")
+    parser.add_argument("--min-hz", default="10", help="comma-separated motion_gate_min_hz values")
+    parser.add_argument("--downsample", type=int, default=DEFAULT_CONFIG.motion_gate_downsample)
+    parser.add_argument("--frames", type=int, default=480)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    results = run(
+        [float(v) for v in args.thresholds.split(",") if v],
+        [float(v) for v in args.min_hz.split(",") if v],
+        args.frames,
+        args.video,
+        args.downsample,
+    )
+    print_table(results)
+    for r in results:
+        p = r.params
+        print(f"{r.name}: skipped {p['skip_ratio'] * 100:.0f}% (forced {p['forced']}), wrist error p95 {p['wrist_px_p95']:.1f}px "
+              f"max {p['wrist_px_max']:.1f}px, angle p95 {p['angle_deg_p95']:.1f}°, same keys {p['keys_agree'] * 100:.1f}%")
+    save_if_requested(args, results, "motion_gate", resolution=(results[0].params["w"], results[0].params["h"]))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Cost of one ``Overlay.draw`` per resolution and effect setting.
+
+    python -m gesture_racer.bench.overlay
+    python -m gesture_racer.bench.overlay --resolutions 1280x720 --frames 300 --save
+
+Two synthetic hands (moving, so trails and particles are live) are drawn on a
+fresh noisy frame each iteration, with the default config and with the
+background blur and the advanced layers switched off, to show where the time
+goes.
+"""
+
+import argparse
+import random
+from dataclasses import replace
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.players import _synthetic_hands
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.gestures import GestureOutput
+from gesture_racer.ui.overlay import Overlay
+from gesture_racer.ui.theme import get_theme
+
+VARIANTS = {
+    "default": {},
+    "no_blur": {"background_blur_enabled": False},
+    "minimal": {"background_blur_enabled": False, "grid_alpha": 0.0, "scanlines_alpha": 0.0, "hex_alpha": 0.0, "particle_max": 0},
+}
+
+
+def make_overlay(cfg) -> Overlay:
+    return Overlay(
+        get_theme(cfg.theme_name),
+        alpha_scale=cfg.ui_intensity,
+        blur_enabled=cfg.background_blur_enabled,
+        blur_ksize=cfg.background_blur_ksize,
+        blur_sigma=cfg.background_blur_sigma,
+        trail_len=cfg.trail_length,
+        particle_max=cfg.particle_max,
+        grid_alpha=cfg.grid_alpha,
+        scan_alpha=cfg.scanlines_alpha,
+        hex_alpha=cfg.hex_alpha,
+    )
+
+
+def time_draw(cfg, w: int, h: int, frames: int = 200, warmup: int = 30) -> list[float]:
+    import time
+
+    overlay = make_overlay(cfg)
+    rng = random.Random(0)
+    background = np.random.default_rng(0).integers(0, 255, (h, w, 3), dtype=np.uint8)
+    actions = GestureOutput(move="forward", turn="right", steering_angle=18.0, debug="bench")
+    chips = ["Gain: 0.90", "Deadband: 12°", "FPS: 30 | HUD 30"]
+    samples = []
+    for i in range(frames + warmup):
+        frame = background.copy()
+        hands = _synthetic_hands(rng, 1, w, h)
+        t0 = time.perf_counter()
+        overlay.draw(frame, hands, actions, show_debug=cfg.show_debug, extra_chips=chips, draw_handles=True)
+        if i >= warmup:
+            samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def run(resolutions=((640, 480), (1280, 720), (1920, 1080)), variants=None, frames: int = 200) -> list[BenchResult]:
+    results = []
+    for w, h in resolutions:
+        for name in variants or list(VARIANTS):
+            cfg = replace(DEFAULT_CONFIG, **VARIANTS[name])
+            results.append(BenchResult(f"overlay.{name}.{w}x{h}", time_draw(cfg, w, h, frames), params={"w": w, "h": h, "variant": name}))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resolutions", default="640x480,1280x720,1920x1080")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help=f"comma-separated, from: {', '.join(VARIANTS)}")
+    parser.add_argument("--frames", type=int, default=200)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    resolutions = [tuple(int(v) for v in r.lower().split("x")) for r in args.resolutions.split(",") if r]
+    results = run(resolutions, [v for v in args.variants.split(",") if v], args.frames)
+    print_table(results)
+    save_if_requested(args, results, "overlay", resolution=resolutions[0] if len(resolutions) == 1 else None)
+    return results
+
+
+if __name__ == "__main__":
+    main()
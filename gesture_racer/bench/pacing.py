@@ -0,0 +1,75 @@
+"""Frame interval, jitter and CPU of the frame pacing strategies.
+
+    python -m gesture_racer.bench.pacing
+    python -m gesture_racer.bench.pacing --fps 60 --work-ms 8 --seconds 10 --save
+
+Each frame does a random amount of busy work (log-normal around
+``--work-ms``, so some frames overrun), then waits with:
+
+- ``uncapped``: no wait (``fps_cap = 0``).
+- ``sleep``: ``FramePacer`` with OS sleep only (``pacing_spin_ms = 0``).
+- ``hybrid``: ``FramePacer`` with the default spin window.
+
+Samples are frame intervals; jitter is |interval - target|, p95.
+"""
+
+import argparse
+import random
+import time
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.timing import FramePacer
+
+STRATEGIES = {
+    "uncapped": lambda fps: FramePacer(0.0),
+    "sleep": lambda fps: FramePacer(fps, spin_s=0.0),
+    "hybrid": lambda fps: FramePacer(fps, spin_s=DEFAULT_CONFIG.pacing_spin_ms / 1000.0),
+}
+
+
+def _busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def run(fps: float = 30.0, work_ms: float = 10.0, seconds: float = 5.0, strategies=None, seed: int = 0) -> list[BenchResult]:
+    results = []
+    for name in strategies or list(STRATEGIES):
+        pacer = STRATEGIES[name](fps)
+        rng = random.Random(seed)
+        cpu0, t0 = time.process_time(), time.perf_counter()
+        while time.perf_counter() - t0 < seconds:
+            _busy(rng.lognormvariate(0.0, 0.35) * work_ms / 1000.0)
+            pacer.wait()
+        cpu = 100.0 * (time.process_time() - cpu0) / (time.perf_counter() - t0)
+        stats = pacer.stats()
+        results.append(BenchResult(
+            f"pacing.{name}", list(pacer.interval.samples),
+            params={"fps": fps, "work_ms": work_ms, "cpu_pct": round(cpu, 1), **{k: round(v, 3) for k, v in stats.items()}},
+        ))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fps", type=float, default=30.0, help="target rate for the capped strategies")
+    parser.add_argument("--work-ms", type=float, default=10.0, help="median busy work per frame")
+    parser.add_argument("--seconds", type=float, default=5.0, help="per strategy")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help=f"comma-separated, from: {', '.join(STRATEGIES)}")
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    results = run(args.fps, args.work_ms, args.seconds, [s for s in args.strategies.split(",") if s])
+    print_table(results)
+    for r in results:
+        p = r.params
+        print(f"{r.name}: jitter {p['pace_jitter_ms_p95']:.2f}ms p95, overruns {p['pace_overrun_pct']:.1f}%, CPU {p['cpu_pct']:.0f}%")
+    save_if_requested(args, results, "pacing")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Per-frame cost of the multi-player path as the number of drivers grows.
+
+    python -m gesture_racer.bench.players --max-players 4
+    python -m gesture_racer.bench.players --video drivers.mp4   # also time HandTracker
+
+Synthetic hands (two per player, jittering in their own strip of a 1280x720
+frame) go through ``group_hands`` and one ``PlayerPipeline`` per player with
+the null input backend. With ``--video`` (needs mediapipe) the tracker is
+also timed at ``max_num_hands = 2N``, which is where most of the extra cost of
+each player lands.
+"""
+
+import argparse
+import random
+from dataclasses import replace
+from types import SimpleNamespace
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.pipeline import PlayerPipeline
+from gesture_racer.players import group_hands
+
+
+def _synthetic_hands(rng: random.Random, num_players: int, w: int, h: int):
+    hands = []
+    strip = w / num_players
+    for p in range(num_players):
+        cx = strip * (p + 0.5)
+        for label, sx in (("Left", -1), ("Right", 1)):
+            x = cx + sx * strip * 0.25 + rng.gauss(0, 4)
+            y = h * 0.5 + sx * rng.gauss(20, 10)
+            pts = np.zeros((21, 3), dtype=np.float32)
+            pts[:, 0] = x / w
+            pts[:, 1] = y / h
+            hands.append(SimpleNamespace(x=int(x), y=int(y), label=label, score=1.0, landmarks=None, points=pts))
+    return hands
+
+
+def time_pipelines(num_players: int, frames: int = 600, grouping: str = "zones", w: int = 1280, h: int = 720) -> list[float]:
+    import time
+
+    cfg = replace(DEFAULT_CONFIG, num_players=num_players, player_grouping=grouping, input_backend="null", async_input_dispatch=False)
+    players = [PlayerPipeline(cfg, cfg.player_key_maps[i % len(cfg.player_key_maps)], name=f"P{i + 1}") for i in range(num_players)]
+    rng = random.Random(num_players)
+    samples = []
+    for i in range(frames):
+        hands = _synthetic_hands(rng, num_players, w, h)
+        t = i / 30.0
+        t0 = time.perf_counter()
+        groups = group_hands(hands, num_players, w, grouping)
+        for player, player_hands in zip(players, groups):
+            player.process(player_hands, t, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+        samples.append(time.perf_counter() - t0)
+    for player in players:
+        player.close()
+    return samples[50:]
+
+
+def time_tracker(video: str, num_players: int, frames: int = 200) -> list[float]:
+    import time
+
+    import cv2
+
+    from gesture_racer.hand_tracking import HandTracker
+
+    cap = cv2.VideoCapture(video)
+    samples = []
+    with HandTracker(max_num_hands=2 * num_players) as tracker:
+        while len(samples) < frames:
+            ok, frame = cap.read()
+            if not ok:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ok, frame = cap.read()
+                if not ok:
+                    break
+            t0 = time.perf_counter()
+            tracker.process(frame)
+            samples.append(time.perf_counter() - t0)
+    cap.release()
+    return samples
+
+
+def run(max_players: int = 4, grouping: str = "zones", video: str | None = None) -> list[BenchResult]:
+    results = []
+    for n in range(1, max_players + 1):
+        results.append(BenchResult(f"players.{n}.pipelines", time_pipelines(n, grouping=grouping), params={"num_players": n, "grouping": grouping}))
+        if video:
+            results.append(BenchResult(f"players.{n}.tracker", time_tracker(video, n), params={"num_players": n, "video": video}))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-players", type=int, default=4)
+    parser.add_argument("--grouping", choices=["zones", "cluster"], default="zones")
+    parser.add_argument("--video", help="video with several drivers, to time HandTracker too")
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+    results = run(args.max_players, args.grouping, args.video)
+    print_table(results)
+
+    base = [r for r in results if r.name.endswith(".pipelines")]
+    if len(base) > 1:
+        per_player = (base[-1].summary()["mean"] - base[0].summary()["mean"]) / (len(base) - 1)
+        print(f"marginal pipeline cost per additional player: {per_player * 1e6:.1f}us")
+    save_if_requested(args, results, "players", resolution=(1280, 720))
+    return results
+
+
+if __name__ == "__main__":
+    main()
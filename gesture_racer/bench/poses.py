@@ -0,0 +1,86 @@
+"""Cost and accuracy of static pose classification per hand.
+
+    python -m gesture_racer.bench.poses
+    python -m gesture_racer.bench.poses --library poses.json --templates 50
+
+Synthetic hands (each built-in pose, random position, size, roll and side,
+with landmark noise) are classified against the library, one hand per call
+and as a batch of ``--batch`` hands per call (the per-frame path). The
+library is padded with jittered copies up to ``--templates`` templates per
+pose to show how the flat index scales with recorded templates.
+"""
+
+import argparse
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table, time_calls
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.poses import DEFAULT_POSES, PoseLibrary, batch_features, default_library, place_hand, synthetic_hand
+
+
+def _hands(rng: np.random.Generator, n: int, noise: float, aspect: float):
+    poses = rng.choice(DEFAULT_POSES, n)
+    labels = rng.choice(["Left", "Right"], n)
+    points = np.stack([
+        place_hand(synthetic_hand(pose, rng, noise), rng.uniform(0.3, 0.7), rng.uniform(0.3, 0.7),
+                   rng.uniform(0.05, 0.2), rng.uniform(-45, 45), label)
+        for pose, label in zip(poses, labels)
+    ])
+    points[:, :, 0] /= aspect
+    return list(poses), list(labels), points
+
+
+def _padded(library: PoseLibrary, per_pose: int, rng: np.random.Generator) -> PoseLibrary:
+    for pose in DEFAULT_POSES:
+        for _ in range(per_pose - library.names.count(pose)):
+            library.add(pose, synthetic_hand(pose, rng, 0.03))
+    return library
+
+
+def run(library_path: str = "", templates: int = 1, batch: int = 4, noise: float = 0.03, iterations: int = 2000, aspect: float = 16 / 9):
+    rng = np.random.default_rng(0)
+    library = PoseLibrary.load(library_path) if library_path else default_library()
+    library = _padded(library, templates, rng)
+    poses, labels, points = _hands(rng, 1000, noise, aspect)
+
+    i = iter(range(10 ** 9))
+
+    def one():
+        k = next(i) % len(points)
+        library.classify(points[k], labels[k], aspect)
+
+    def many():
+        k = next(i) % (len(points) - batch)
+        library.classify_features(batch_features(points[k:k + batch], labels[k:k + batch], aspect))
+
+    params = {"templates": len(library), "batch": batch}
+    results = [
+        BenchResult("poses.classify_1", time_calls(one, iterations), params=params),
+        BenchResult(f"poses.classify_{batch}", [s / batch for s in time_calls(many, iterations)], params={**params, "per": "hand"}),
+    ]
+    predicted = [name for name, _ in library.classify_features(batch_features(points, labels, aspect))]
+    accuracy = {pose: np.mean([p == pose for p, t in zip(predicted, poses) if t == pose]) for pose in DEFAULT_POSES}
+    rejected = np.mean([p is None for p in predicted])
+    return results, accuracy, rejected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--library", default="", help="pose library JSON (default: built-in templates)")
+    parser.add_argument("--templates", type=int, default=1, help="templates per pose (padded with jittered copies)")
+    parser.add_argument("--batch", type=int, default=4, help="hands per batched call")
+    parser.add_argument("--noise", type=float, default=0.03, help="landmark noise in palm lengths")
+    parser.add_argument("--iterations", type=int, default=2000)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    results, accuracy, rejected = run(args.library, args.templates, args.batch, args.noise, args.iterations)
+    print_table(results)
+    print("accuracy: " + "  ".join(f"{pose} {acc * 100:.1f}%" for pose, acc in accuracy.items()) + f"  (rejected {rejected * 100:.1f}%)")
+    save_if_requested(args, results, "poses")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Loopback throughput and latency of the gesture server protocol.
+
+    python -m gesture_racer.bench.server
+    python -m gesture_racer.bench.server --clients 1,8,32 --rate 2000 --transport unix
+
+A ``GestureServer`` publishes synthetic two-hand packets (full landmarks) at
+``--rate`` packets/s to N ``GestureClient`` threads. Latency is measured from
+the timestamp inside each packet (the publisher's perf_counter) to its
+arrival at a client; ``publish`` is the server-side cost of one frame for all
+subscribers. No camera or mediapipe needed.
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from gesture_racer import protocol
+from gesture_racer.bench.common import BenchResult, print_table, time_calls
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.client import GestureClient
+from gesture_racer.gestures import GestureOutput
+from gesture_racer.server import GestureServer
+from gesture_racer.timing import sleep_until
+
+
+def _synthetic_frame():
+    rng = np.random.default_rng(0)
+    hands = [
+        SimpleNamespace(x=400, y=360, label="Left", score=0.98, points=rng.random((21, 3), dtype=np.float32)),
+        SimpleNamespace(x=880, y=380, label="Right", score=0.97, points=rng.random((21, 3), dtype=np.float32)),
+    ]
+    output = GestureOutput(move="forward", turn="right", steering_angle=17.5, debug="", hand_distance=480.0)
+    return output, hands
+
+
+def _address(transport: str) -> str:
+    if transport == "unix":
+        return "unix://" + os.path.join(tempfile.gettempdir(), f"gesture-racer-bench-{os.getpid()}.sock")
+    return "udp://127.0.0.1:0"
+
+
+def time_codec(iterations: int = 20000) -> list[BenchResult]:
+    output, hands = _synthetic_frame()
+    data = protocol.encode(1, 0.0, output, hands)
+    return [
+        BenchResult("protocol.encode", time_calls(lambda: protocol.encode(1, 0.0, output, hands), iterations), params={"bytes": len(data)}),
+        BenchResult("protocol.decode", time_calls(lambda: protocol.decode(data), iterations), params={"bytes": len(data)}),
+    ]
+
+
+def run_loopback(num_clients: int, packets: int = 2000, rate_hz: float = 1000.0, transport: str = "udp"):
+    output, hands = _synthetic_frame()
+    server = GestureServer(_address(transport))
+    address = server.address
+    if transport == "udp":
+        host, port = server.sock.getsockname()[:2]  # the OS picked the port
+        address = f"udp://{host}:{port}"
+    clients = [GestureClient(address) for _ in range(num_clients)]
+    deadline = time.monotonic() + 2.0
+    while len(server.subscribers) < num_clients and time.monotonic() < deadline:
+        server.poll_subscriptions()
+        time.sleep(0.001)
+
+    latencies = [[] for _ in clients]
+    done = threading.Event()
+
+    def consume(i, client):
+        while not done.is_set():
+            packet = client.recv(timeout=0.2)
+            if packet is not None:
+                latencies[i].append(time.perf_counter() - packet.timestamp)
+
+    threads = [threading.Thread(target=consume, args=(i, c), daemon=True) for i, c in enumerate(clients)]
+    for t in threads:
+        t.start()
+
+    period = 1.0 / rate_hz
+    start = time.perf_counter()
+    next_t = start
+    for _ in range(packets):
+        server.publish(output, hands, timestamp=time.perf_counter())
+        next_t += period
+        sleep_until(next_t)
+    elapsed = time.perf_counter() - start
+    time.sleep(0.2)
+    done.set()
+    for t in threads:
+        t.join()
+
+    publish = list(server.publish_time.samples)
+    received = sum(len(lat) for lat in latencies)
+    lost = sum(c.lost for c in clients)
+    for c in clients:
+        c.close()
+    server.close()
+    params = {"clients": num_clients, "rate_hz": rate_hz, "transport": transport}
+    summary = {
+        "delivered_per_s": received / elapsed,
+        "loss": 1.0 - received / float(packets * num_clients),
+        "seq_gaps": lost,
+    }
+    return [
+        BenchResult(f"server.{transport}.{num_clients}c.latency", [x for lat in latencies for x in lat], params=params),
+        BenchResult(f"server.{transport}.{num_clients}c.publish", publish, params=params),
+    ], summary
+
+
+def run(clients=(1, 4, 16), packets: int = 2000, rate_hz: float = 1000.0, transport: str = "udp"):
+    results = time_codec()
+    summaries = {}
+    for n in clients:
+        r, summary = run_loopback(n, packets, rate_hz, transport)
+        results += r
+        summaries[n] = summary
+    return results, summaries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", default="1,4,16", help="comma-separated subscriber counts")
+    parser.add_argument("--packets", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=1000.0, help="packets per second")
+    parser.add_argument("--transport", choices=["udp", "unix"], default="udp")
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+    clients = [int(c) for c in args.clients.split(",") if c.strip()]
+    results, summaries = run(clients, args.packets, args.rate, args.transport)
+    print_table(results)
+    for n, s in summaries.items():
+        print(f"{n:>3} clients: {s['delivered_per_s']:.0f} packets/s delivered, loss {s['loss'] * 100:.2f}%")
+    save_if_requested(args, results, "server")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Memory soak test: run the frame loop for N minutes and fail on upward trends.
+
+    python -m gesture_racer.bench.soak --minutes 10
+    python -m gesture_racer.bench.soak --minutes 1 --max-traced-kb-per-min 64
+
+Synthetic hands (appearing, disappearing and moving, so trails and particles
+churn) go through ``PlayerPipeline`` and a full ``Overlay.draw`` on a fresh
+1280x720 frame each iteration, with the null input backend. Every second the
+traced Python heap and RSS are sampled; after a warm-up (long enough for the
+rolling telemetry windows to fill) the slope of each is fitted, and the run
+exits non-zero if either grows faster than allowed.
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.players import _synthetic_hands
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.memory import MemoryMonitor
+from gesture_racer.metrics import RollingStats
+from gesture_racer.pipeline import PlayerPipeline
+from gesture_racer.ui.overlay import Overlay
+from gesture_racer.ui.theme import get_theme
+
+
+def _slope_per_min(times, values) -> float:
+    if len(times) < 3:
+        return 0.0
+    return float(np.polyfit(np.asarray(times) / 60.0, np.asarray(values, dtype=np.float64), 1)[0])
+
+
+def soak(minutes: float = 5.0, warmup_s: float = 60.0, w: int = 1280, h: int = 720, seed: int = 0):
+    cfg = replace(DEFAULT_CONFIG, input_backend="null", async_input_dispatch=False)
+    player = PlayerPipeline(cfg, cfg.movement_keys)
+    overlay = Overlay(
+        get_theme(cfg.theme_name),
+        alpha_scale=cfg.ui_intensity,
+        blur_enabled=cfg.background_blur_enabled,
+        blur_ksize=cfg.background_blur_ksize,
+        trail_len=cfg.trail_length,
+        particle_max=cfg.particle_max,
+        grid_alpha=cfg.grid_alpha,
+        scan_alpha=cfg.scanlines_alpha,
+        hex_alpha=cfg.hex_alpha,
+    )
+    memory = MemoryMonitor(use_tracemalloc=True, rss_every=10).start()
+    rng = random.Random(seed)
+    background = np.random.default_rng(seed).integers(0, 255, (h, w, 3), dtype=np.uint8)
+
+    samples_t, traced, rss = [], [], []
+    frame_times = RollingStats(4096)  # bounded, so the harness itself does not grow
+    start = time.perf_counter()
+    next_sample = start + 1.0
+    end = start + minutes * 60.0
+    frame_no = 0
+    try:
+        while True:
+            t0 = time.perf_counter()
+            if t0 >= end:
+                break
+            memory.mark("tracker")
+            frame = background.copy()
+            hands = _synthetic_hands(rng, 1, w, h)
+            phase = (frame_no // 90) % 4  # both hands, one, none, both
+            hands = hands if phase in (0, 3) else hands[:1] if phase == 1 else []
+            memory.mark("decide")
+            actions = player.process(hands, t0 - start, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+            memory.mark("overlay")
+            overlay.draw(frame, player.hands, actions, show_debug=True, extra_chips=[memory.chip()], draw_handles=True)
+            memory.frame_done()
+            frame_no += 1
+            frame_times.add(time.perf_counter() - t0)
+            if t0 >= next_sample:
+                next_sample += 1.0
+                samples_t.append(t0 - start)
+                traced.append(memory.traced_bytes())
+                rss.append(memory.rss)
+    finally:
+        memory.stop()
+        player.close()
+
+    steady = [i for i, t in enumerate(samples_t) if t >= warmup_s] or list(range(len(samples_t)))
+    ts = [samples_t[i] for i in steady]
+    return {
+        "frames": frame_no,
+        "frame_times": list(frame_times.samples),
+        "traced_kb_per_min": _slope_per_min(ts, [traced[i] for i in steady]) / 1024.0,
+        "rss_kb_per_min": _slope_per_min(ts, [rss[i] for i in steady]) / 1024.0,
+        "traced_mb_end": traced[-1] / 2 ** 20 if traced else 0.0,
+        "rss_mb_end": rss[-1] / 2 ** 20 if rss else 0.0,
+        "memory": memory.stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--warmup", type=float, default=60.0, help="seconds excluded from the trend fit (stats windows fill up)")
+    parser.add_argument("--max-traced-kb-per-min", type=float, default=128.0)
+    parser.add_argument("--max-rss-kb-per-min", type=float, default=1024.0)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    result = soak(args.minutes, min(args.warmup, args.minutes * 30.0))
+    frame_result = BenchResult("soak.frame", result["frame_times"], params={"minutes": args.minutes})
+    print_table([frame_result])
+    save_if_requested(args, [frame_result], "soak", resolution=(1280, 720))
+    mem = result["memory"]
+    print(f"frames: {result['frames']}  GC pauses: {mem['mem_gc_collections']} (p95 {mem['mem_gc_pause_ms_p95']:.2f}ms)")
+    print(f"traced heap: {result['traced_mb_end']:.1f}MB, trend {result['traced_kb_per_min']:+.1f} KB/min")
+    print(f"RSS: {result['rss_mb_end']:.1f}MB, trend {result['rss_kb_per_min']:+.1f} KB/min")
+    for key in sorted(k for k in mem if k.startswith("mem_blocks_")):
+        print(f"  {key[len('mem_blocks_'):]:<10} {mem[key]:+.1f} blocks/frame")
+
+    failed = []
+    if result["traced_kb_per_min"] > args.max_traced_kb_per_min:
+        failed.append("traced heap")
+    if result["rss_kb_per_min"] > args.max_rss_kb_per_min:
+        failed.append("RSS")
+    if failed:
+        print(f"FAIL: {' and '.join(failed)} growing")
+        sys.exit(1)
+    print("OK: no upward memory trend")
+    return result
+
+
+if __name__ == "__main__":
+    main()
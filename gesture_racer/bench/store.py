@@ -0,0 +1,301 @@
+"""Local benchmark results store and regression check.
+
+    python -m gesture_racer.bench.overlay --save            # any bench with --save
+    python -m gesture_racer.bench.store list
+    python -m gesture_racer.bench.store compare              # latest run vs the previous one of that bench
+    python -m gesture_racer.bench.store compare 3f2a 91c0 --min-effect 0.1
+    python -m gesture_racer.bench.store compare label:before label:after   # two or more runs each
+
+Every saved benchmark is one JSON line in ``bench_results/results.jsonl``
+with its raw samples, the run id, git revision, a hardware fingerprint, the
+frame resolution and the config values that differ from the defaults.
+
+``compare`` matches benchmarks by name and estimates the ratio of medians
+(new / base) with a block-bootstrap confidence interval. A benchmark is flagged as
+a regression only when the whole interval lies above ``1 + min_effect``, so
+small changes are not reported. A single run per side only captures noise
+within the run, not drift between runs (background load, thermals), so a
+change it finds is reported as ``inconclusive``. Verdicts need at least two
+runs per side (``compare label:before label:after``, or comma-separated ids);
+the runs are then resampled as well. Exits 1 when anything regressed. Runs
+from different hardware are compared with a warning.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import asdict, fields
+
+import numpy as np
+
+from gesture_racer.bench.common import BenchResult, _fmt
+
+DEFAULT_DIR = "bench_results"
+RESULTS_FILE = "results.jsonl"
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def fingerprint() -> dict:
+    """Hardware and software the numbers depend on; ``id`` hashes the hardware part."""
+    import cv2
+
+    hw = {
+        "cpu": _cpu_model(),
+        "cores": os.cpu_count(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+    return {
+        **hw,
+        "id": hashlib.sha1(json.dumps(hw, sort_keys=True).encode()).hexdigest()[:12],
+        "os": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+def git_revision() -> str:
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=here, capture_output=True, text=True, timeout=5).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=here, capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return rev + ("+dirty" if rev and dirty else "")
+
+
+def config_overrides(cfg) -> dict:
+    """Config fields that differ from ``AppConfig`` defaults (JSON-friendly)."""
+    from gesture_racer.config import DEFAULT_CONFIG
+
+    if cfg is None:
+        return {}
+    return {f.name: getattr(cfg, f.name) for f in fields(cfg) if getattr(cfg, f.name) != getattr(DEFAULT_CONFIG, f.name)}
+
+
+def save_run(results: list[BenchResult], bench: str, directory: str = DEFAULT_DIR, label: str = "",
+             resolution: tuple[int, int] | None = None, cfg=None) -> str:
+    """Append one line per result; returns the run id."""
+    os.makedirs(directory, exist_ok=True)
+    run_id = uuid.uuid4().hex[:8]
+    common = {
+        "run": run_id,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "label": label,
+        "bench": bench,
+        "git": git_revision(),
+        "hardware": fingerprint(),
+        "resolution": list(resolution) if resolution else None,
+        "config": config_overrides(cfg),
+    }
+    with open(os.path.join(directory, RESULTS_FILE), "a") as f:
+        for r in results:
+            f.write(json.dumps({**common, **asdict(r)}, default=str) + "\n")
+    return run_id
+
+
+def load_runs(directory: str = DEFAULT_DIR) -> dict[str, list[dict]]:
+    """Run id -> rows, oldest run first."""
+    runs: dict[str, list[dict]] = {}
+    path = os.path.join(directory, RESULTS_FILE)
+    if not os.path.exists(path):
+        return runs
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                runs.setdefault(row["run"], []).append(row)
+    return runs
+
+
+def add_store_args(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("results store")
+    group.add_argument("--save", action="store_true", help="append the results to the local store")
+    group.add_argument("--results-dir", default=DEFAULT_DIR)
+    group.add_argument("--label", default="", help="free-form note stored with the run")
+
+
+def save_if_requested(args, results: list[BenchResult], bench: str, resolution=None, cfg=None):
+    if getattr(args, "save", False):
+        run_id = save_run(results, bench, args.results_dir, args.label, resolution, cfg)
+        print(f"saved run {run_id} to {os.path.join(args.results_dir, RESULTS_FILE)}")
+
+
+# --- comparison ---------------------------------------------------------------
+def _block_resample(samples: np.ndarray, n_boot: int, rng: np.random.Generator) -> np.ndarray:
+    # moving-block bootstrap: consecutive timings are correlated (thermal, cache, background load),
+    # so resample runs of ~n^(1/3) samples instead of single samples
+    n = len(samples)
+    block = max(1, min(n, int(round(n ** (1.0 / 3.0)))))
+    k = -(-n // block)
+    starts = rng.integers(0, n - block + 1, (n_boot, k))
+    return samples[(starts[:, :, None] + np.arange(block)).reshape(n_boot, -1)[:, :n]]
+
+
+def _boot_medians(groups: list, n_boot: int, rng: np.random.Generator) -> np.ndarray:
+    """Bootstrap medians of pooled samples; with several runs the runs are resampled too."""
+    resampled = [_block_resample(np.asarray(g, dtype=np.float64), n_boot, rng) for g in groups]
+    if len(resampled) == 1:
+        return np.median(resampled[0], axis=1)
+    pick = rng.integers(0, len(resampled), (n_boot, len(resampled)))
+    return np.array([np.median(np.concatenate([resampled[j][i] for j in pick[i]])) for i in range(n_boot)])
+
+
+def median_ratio_ci(base_groups: list, new_groups: list, confidence: float = 0.95, n_boot: int = 2000,
+                    seed: int = 0) -> tuple[float, float, float]:
+    """Ratio of medians new / base with a (hierarchical) block-bootstrap interval.
+
+    Each argument is a list of sample lists, one per run.
+    """
+    rng = np.random.default_rng(seed)
+    ratios = _boot_medians(new_groups, n_boot, rng) / np.maximum(_boot_medians(base_groups, n_boot, rng), 1e-12)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    lo, hi = np.percentile(ratios, [tail, 100.0 - tail])
+    point = np.median(np.concatenate(new_groups)) / max(np.median(np.concatenate(base_groups)), 1e-12)
+    return float(point), float(lo), float(hi)
+
+
+def _by_name(runs: list[list[dict]]) -> dict[str, list[dict]]:
+    out: dict[str, list[dict]] = {}
+    for rows in runs:
+        for r in rows:
+            if r["samples"]:
+                out.setdefault(r["name"], []).append(r)
+    return out
+
+
+def compare(base_runs: list[list[dict]], new_runs: list[list[dict]], confidence: float = 0.95,
+            min_effect: float = 0.05, min_runs: int = 2) -> list[dict]:
+    """Per benchmark in both sides: medians, ratio, interval and verdict.
+
+    With fewer than ``min_runs`` runs on either side a change is ``inconclusive``.
+    """
+    base = _by_name(base_runs)
+    out = []
+    for name, rows in _by_name(new_runs).items():
+        if name not in base:
+            continue
+        base_groups = [r["samples"] for r in base[name]]
+        new_groups = [r["samples"] for r in rows]
+        ratio, lo, hi = median_ratio_ci(base_groups, new_groups, confidence)
+        if lo > 1.0 + min_effect:
+            verdict = "REGRESSION"
+        elif hi < 1.0 - min_effect:
+            verdict = "faster"
+        else:
+            verdict = "same"
+        if verdict != "same" and min(len(base_groups), len(new_groups)) < min_runs:
+            verdict = "inconclusive"
+        out.append({
+            "name": name,
+            "unit": rows[0].get("unit", "s"),
+            "base_p50": float(np.median(np.concatenate(base_groups))),
+            "new_p50": float(np.median(np.concatenate(new_groups))),
+            "ratio": ratio,
+            "ci": (lo, hi),
+            "verdict": verdict,
+        })
+    return out
+
+
+def select_runs(runs: dict, spec: str) -> list[str]:
+    """``spec`` is ``label:NAME`` or comma-separated run id prefixes."""
+    if spec.startswith("label:"):
+        ids = [run for run, rows in runs.items() if rows[0]["label"] == spec[len("label:"):]]
+        if not ids:
+            raise SystemExit(f"no runs labelled '{spec[len('label:'):]}'")
+        return ids
+    ids = []
+    for prefix in spec.split(","):
+        matches = [run for run in runs if run.startswith(prefix.strip())]
+        if len(matches) != 1:
+            raise SystemExit(f"run '{prefix}': {'ambiguous' if matches else 'not found'}")
+        ids.append(matches[0])
+    return ids
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results-dir", default=DEFAULT_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="saved runs, oldest first")
+    cmp_ = sub.add_parser("compare", help="flag significant changes between two runs")
+    cmp_.add_argument("base", nargs="?", help="run ids (comma-separated prefixes) or label:NAME; default: the previous run of the same bench")
+    cmp_.add_argument("new", nargs="?", help="run ids (comma-separated prefixes) or label:NAME; default: latest run")
+    cmp_.add_argument("--confidence", type=float, default=0.95)
+    cmp_.add_argument("--min-effect", type=float, default=0.05, help="ignore changes smaller than this fraction")
+    args = parser.parse_args(argv)
+
+    runs = load_runs(args.results_dir)
+    if args.command == "list":
+        for run_id, rows in runs.items():
+            r = rows[0]
+            res = "x".join(map(str, r["resolution"])) if r.get("resolution") else "-"
+            print(f"{run_id}  {r['time']}  {r['bench']:<14} {len(rows):>3} results  {r['git'] or '-':<14} "
+                  f"hw {r['hardware']['id']}  {res:<10} {r['label']}")
+        return runs
+
+    ids = list(runs)
+    if not ids:
+        raise SystemExit("no saved runs")
+    new_ids = select_runs(runs, args.new) if args.new else ids[-1:]
+    if args.base:
+        base_ids = select_runs(runs, args.base)
+    else:
+        bench = runs[new_ids[0]][0]["bench"]
+        earlier = [run for run in ids[:ids.index(new_ids[0])] if runs[run][0]["bench"] == bench]
+        if not earlier:
+            raise SystemExit(f"no earlier '{bench}' run to compare with")
+        base_ids = earlier[-1:]
+    base_runs, new_runs = [runs[i] for i in base_ids], [runs[i] for i in new_ids]
+    first_base, first_new = base_runs[0][0], new_runs[0][0]
+    if {r[0]["hardware"]["id"] for r in base_runs + new_runs} != {first_base["hardware"]["id"]}:
+        print("warning: runs come from different hardware")
+    for key in ("resolution", "config"):
+        if first_base.get(key) != first_new.get(key):
+            print(f"warning: {key} differs ({first_base.get(key)} vs {first_new.get(key)})")
+
+    rows = compare(base_runs, new_runs, args.confidence, args.min_effect)
+    if not rows:
+        raise SystemExit("no benchmark names in common between the runs; nothing compared")
+    pct = f"{args.confidence * 100:.0f}% CI"
+    table = [("benchmark", "base p50", "new p50", "change", pct, "")]
+    for r in rows:
+        lo, hi = r["ci"]
+        table.append((
+            r["name"], _fmt(r["base_p50"], r["unit"]), _fmt(r["new_p50"], r["unit"]),
+            f"{(r['ratio'] - 1) * 100:+.1f}%", f"[{(lo - 1) * 100:+.1f}%, {(hi - 1) * 100:+.1f}%]", r["verdict"],
+        ))
+    print(f"base {','.join(base_ids)} ({first_base['git'] or '-'})  ->  new {','.join(new_ids)} ({first_new['git'] or '-'})")
+    widths = [max(len(row[i]) for row in table) for i in range(len(table[0]))]
+    for row in table:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)))
+    if any(r["verdict"] == "inconclusive" for r in rows):
+        print("inconclusive: one run per side cannot tell a change from drift between runs; "
+              "save at least two runs per side (e.g. with --label) and compare label:before label:after")
+    regressions = [r["name"] for r in rows if r["verdict"] == "REGRESSION"]
+    if regressions:
+        print(f"{len(regressions)} regression(s)")
+        sys.exit(1)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
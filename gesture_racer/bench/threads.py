@@ -0,0 +1,158 @@
+"""Throughput and frame latency across thread-count and affinity settings.
+
+    python -m gesture_racer.bench.threads
+    python -m gesture_racer.bench.threads --cv2-threads=-1,0,2 --affinity none,split
+    python -m gesture_racer.bench.threads --video drivers.mp4 --inference 0,1,2 --save
+
+Every cell of the matrix (``cv2_num_threads`` x ``inference_threads`` x
+affinity preset) runs in a fresh interpreter, because thread hints have to be
+in place before OpenCV's pool and MediaPipe start. A frame is
+``HandTracker.process`` (only with ``--video``; needs mediapipe) plus a full
+``Overlay.draw`` at the frame's size, on the main thread pinned as the
+``loop`` stage. Without ``--video`` the frames are synthetic 1280x720 noise
+and the inference axis is skipped.
+
+Affinity presets (from the CPUs this process may use):
+
+- ``none``: no pinning.
+- ``split``: ``loop`` on the first half of the CPUs, ``tracker`` on the rest.
+- ``shared``: ``loop`` and ``tracker`` on the same first half, to show contention.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import replace
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+
+PRESETS = ("none", "split", "shared")
+
+
+def affinity_preset(name: str) -> dict:
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    half = max(1, len(cpus) // 2)
+    if name == "none":
+        return {}
+    if len(cpus) < 2:
+        raise ValueError(f"preset '{name}' needs at least 2 CPUs, have {len(cpus)}")
+    if name == "split":
+        return {"loop": cpus[:half], "tracker": cpus[half:]}
+    if name == "shared":
+        return {"loop": cpus[:half], "tracker": cpus[:half]}
+    raise ValueError(f"unknown affinity preset '{name}' (known: {', '.join(PRESETS)})")
+
+
+def run_cell(cell: dict, frames: int, video: str | None, warmup: int = 20) -> dict:
+    """One matrix cell, in this process; called in a child interpreter."""
+    import numpy as np
+
+    from gesture_racer.threads import configure_threads, pin_current_thread
+
+    cfg = replace(
+        DEFAULT_CONFIG,
+        cv2_num_threads=cell["cv2_threads"],
+        inference_threads=cell["inference_threads"],
+        cpu_affinity=cell["affinity"],
+    )
+    configure_threads(cfg)
+    pin_current_thread("loop")
+
+    from gesture_racer.bench.overlay import make_overlay
+    from gesture_racer.gestures import GestureOutput
+
+    if video:
+        from gesture_racer.bench.tracker import read_frames
+        from gesture_racer.hand_tracking import HandTracker
+        from gesture_racer.sources import tracker_kwargs
+
+        images = read_frames(video, min(frames, 300))
+        tracker = HandTracker(**tracker_kwargs(cfg)).start(shape=images[0].shape)
+        while not tracker.ready:
+            time.sleep(0.01)
+    else:
+        images = [np.random.default_rng(i).integers(0, 255, (720, 1280, 3), dtype=np.uint8) for i in range(8)]
+        tracker = None
+    overlay = make_overlay(cfg)
+    actions = GestureOutput(move="forward", turn="right", steering_angle=18.0, debug="bench")
+    samples = []
+    try:
+        start = None
+        for i in range(warmup + frames):
+            if i == warmup:
+                start = time.perf_counter()
+            frame = images[i % len(images)].copy()
+            t0 = time.perf_counter()
+            hands = tracker.process(frame) if tracker is not None else []
+            overlay.draw(frame, hands, actions, show_debug=True, extra_chips=["bench"], draw_handles=True)
+            if i >= warmup:
+                samples.append(time.perf_counter() - t0)
+        wall = time.perf_counter() - start
+    finally:
+        if tracker is not None:
+            tracker.__exit__(None, None, None)
+    return {"samples": samples, "fps": frames / wall}
+
+
+def _spawn(cell: dict, frames: int, video: str | None) -> dict:
+    cmd = [sys.executable, "-m", "gesture_racer.bench.threads", "--cell", json.dumps(cell), "--frames", str(frames)]
+    if video:
+        cmd += ["--video", video]
+    out = subprocess.run(cmd, capture_output=True, text=True)
+    if out.returncode:
+        raise RuntimeError(f"cell {cell} failed:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(cv2_threads=(-1, 1), inference=(0,), presets=("none", "split"), frames: int = 200, video: str | None = None) -> list[BenchResult]:
+    results = []
+    for preset in presets:
+        try:
+            affinity = affinity_preset(preset)
+        except ValueError as exc:
+            print(f"skipping {preset}: {exc}")
+            continue
+        for n_cv2 in cv2_threads:
+            for n_inf in inference if video else (0,):
+                cell = {"cv2_threads": n_cv2, "inference_threads": n_inf, "affinity": affinity}
+                out = _spawn(cell, frames, video)
+                name = f"threads.cv{n_cv2}.inf{n_inf}.{preset}"
+                results.append(BenchResult(name, out["samples"], params={**cell, "fps": round(out["fps"], 1)}))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video file; adds HandTracker.process to every frame")
+    parser.add_argument("--cv2-threads", default="-1,1", help="comma-separated cv2_num_threads values (use --cv2-threads=-1,1)")
+    parser.add_argument("--inference", default="0,1,2", help="comma-separated inference_threads values (with --video)")
+    parser.add_argument("--affinity", default="none,split", help=f"comma-separated presets, from: {', '.join(PRESETS)}")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--cell", help=argparse.SUPPRESS)
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    if args.cell:
+        print(json.dumps(run_cell(json.loads(args.cell), args.frames, args.video)))
+        return None
+    results = run(
+        [int(v) for v in args.cv2_threads.split(",") if v],
+        [int(v) for v in args.inference.split(",") if v],
+        [p for p in args.affinity.split(",") if p],
+        args.frames,
+        args.video,
+    )
+    print_table(results)
+    for r in results:
+        print(f"{r.name}: {r.params['fps']:.1f} frames/s")
+    save_if_requested(args, results, "threads")
+    return results
+
+
+if __name__ == "__main__":
+    main()
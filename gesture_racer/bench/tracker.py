@@ -0,0 +1,99 @@
+"""Cost of ``HandTracker.process`` per frame (needs mediapipe).
+
+    python -m gesture_racer.bench.tracker --video drivers.mp4
+    python -m gesture_racer.bench.tracker --source 0 --frames 300 --complexity 0,1 --save
+
+Frames are read up front (a video file is looped if it is short), so the
+numbers are inference plus conversion only, not capture. Each model
+complexity runs over the same frames after a warm-up.
+"""
+
+import argparse
+import time
+from dataclasses import replace
+
+import cv2
+
+from gesture_racer.bench.common import BenchResult, print_table
+from gesture_racer.bench.store import add_store_args, save_if_requested
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.hand_tracking import HandTracker
+
+
+def read_frames(source, count: int, width: int = 0, height: int = 0) -> list:
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Error: could not open '{source}'.")
+    frames = []
+    try:
+        while len(frames) < count:
+            ok, frame = cap.read()
+            if not ok:
+                if not frames:
+                    raise RuntimeError(f"Error: no frames from '{source}'.")
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                continue
+            if width and height:
+                frame = cv2.resize(frame, (width, height))
+            frames.append(frame)
+    finally:
+        cap.release()
+    return frames
+
+
+def time_tracker(frames, cfg, warmup: int = 20) -> tuple[list[float], float]:
+    """Per-frame seconds and the fraction of frames with at least one hand."""
+    samples, found = [], 0
+    with HandTracker(
+        max_num_hands=cfg.max_num_hands,
+        model_complexity=cfg.model_complexity,
+        min_detection_confidence=cfg.min_detection_confidence,
+        min_tracking_confidence=cfg.min_tracking_confidence,
+    ) as tracker:
+        for i, frame in enumerate(frames[:warmup] + frames):
+            t0 = time.perf_counter()
+            hands = tracker.process(frame)
+            if i >= warmup:
+                samples.append(time.perf_counter() - t0)
+                found += bool(hands)
+    return samples, found / max(1, len(frames))
+
+
+def run(source, frames: int = 300, complexities=(0, 1), max_hands: int = 2, width: int = 0, height: int = 0):
+    images = read_frames(source, frames, width, height)
+    h, w = images[0].shape[:2]
+    results = []
+    for complexity in complexities:
+        cfg = replace(DEFAULT_CONFIG, model_complexity=complexity, max_num_hands=max_hands)
+        samples, detected = time_tracker(images, cfg)
+        results.append(BenchResult(
+            f"tracker.c{complexity}.{w}x{h}", samples,
+            params={"model_complexity": complexity, "max_num_hands": max_hands, "detected": round(detected, 3)},
+        ))
+    return results, (w, h)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="video file")
+    parser.add_argument("--source", default="0", help="camera index or video path (if --video is not given)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--complexity", default="0,1", help="comma-separated model_complexity values")
+    parser.add_argument("--max-hands", type=int, default=2)
+    parser.add_argument("--resize", default="", help="WxH to resize frames to, e.g. 640x360")
+    add_store_args(parser)
+    args = parser.parse_args(argv)
+
+    source = args.video or (int(args.source) if args.source.isdigit() else args.source)
+    width, height = (int(v) for v in args.resize.lower().split("x")) if args.resize else (0, 0)
+    complexities = [int(c) for c in args.complexity.split(",") if c]
+    results, resolution = run(source, args.frames, complexities, args.max_hands, width, height)
+    print_table(results)
+    for r in results:
+        print(f"{r.name}: hands found in {r.params['detected'] * 100:.0f}% of frames")
+    save_if_requested(args, results, "tracker", resolution=resolution)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,106 @@
+import time
+
 import cv2
 
 
+def fourcc_str(code: float) -> str:
+    code = int(code)
+    chars = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+    return chars if chars.isprintable() and chars.strip() else ""
+
+
 class Camera:
-    def __init__(self, index: int = 0, flip: bool = True):
+    def __init__(
+        self,
+        index: int = 0,
+        flip: bool = True,
+        width: int = 0,
+        height: int = 0,
+        fps: float = 0.0,
+        fourcc: str = "",
+        buffer_size: int = 0,
+    ):
+        """Open a camera (or video file). Zero/empty settings keep the driver default."""
         self.index = index
         self.flip = flip
         self.cap = cv2.VideoCapture(index)
         if not self.cap.isOpened():
             raise RuntimeError("Error: Could not open camera.")
+        self.requested = {}
+        # fourcc first: many drivers only expose high resolutions/FPS in MJPG
+        if fourcc:
+            self.requested["fourcc"] = fourcc.upper()
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc.upper()))
+        if width:
+            self.requested["width"] = width
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            self.requested["height"] = height
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.requested["fps"] = fps
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        if buffer_size:
+            self.requested["buffer_size"] = buffer_size
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        self.actual = self.read_properties()
+        self.mismatches = self._verify()
+
+    def read_properties(self) -> dict:
+        """What the device reports now (buffer_size <= 0 where the backend cannot tell)."""
+        return {
+            "fourcc": fourcc_str(self.cap.get(cv2.CAP_PROP_FOURCC)),
+            "width": int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": float(self.cap.get(cv2.CAP_PROP_FPS)),
+            "buffer_size": int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
 
-    def read(self):
-        success, frame = self.cap.read()
+    def _verify(self) -> list[str]:
+        out = []
+        for key, want in self.requested.items():
+            got = self.actual.get(key)
+            if key == "fps":
+                ok = got and abs(got - want) <= 0.5
+            elif key == "buffer_size":
+                ok = got <= 0 or got == want  # backend cannot report it
+            else:
+                ok = got == want
+            if not ok:
+                out.append(f"{key}: requested {want}, got {got}")
+        return out
+
+    def check_frame(self, frame) -> list[str]:
+        """Compare a delivered frame against the requested size (some drivers report one mode and send another)."""
+        h, w = frame.shape[:2]
+        out = []
+        if self.requested.get("width", w) != w or self.requested.get("height", h) != h:
+            out.append(f"frames are {w}x{h}, requested {self.requested.get('width', w)}x{self.requested.get('height', h)}")
+        return out
+
+    def read(self, fresh: bool = False):
+        """Next frame; ``fresh`` first drops frames the driver queued while we were not reading."""
+        if fresh:
+            success, frame = self._read_fresh()
+        else:
+            success, frame = self.cap.read()
         if not success:
             raise RuntimeError("Error: Camera read failed.")
         if self.flip:
             frame = cv2.flip(frame, 1)
         return frame
 
+    def _read_fresh(self, max_drop: int = 8):
+        # queued frames are handed out at once; the first grab that has to wait got a new frame
+        half_period = 0.5 / (self.actual["fps"] if self.actual["fps"] > 0 else 30.0)
+        for _ in range(max_drop):
+            t0 = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if time.perf_counter() - t0 > half_period:
+                break
+        return self.cap.retrieve()
+
     def release(self):
         if self.cap:
-            self.cap.release()
\ No newline at end of file
+            self.cap.release()
@@ -0,0 +1,126 @@
+"""Subscriber side of the gesture server.
+
+    from gesture_racer.client import GestureClient
+
+    with GestureClient() as client:
+        for packet in client:            # blocks for each frame
+            print(packet.seq, packet.move, packet.steering_angle, len(packet.hands))
+
+``latest()`` drains whatever is queued and returns only the newest packet,
+for consumers that poll once per game frame.
+"""
+
+import os
+import socket
+import tempfile
+import time
+
+from gesture_racer import protocol
+
+
+class GestureClient:
+    def __init__(self, address: str = protocol.DEFAULT_ADDRESS, resubscribe_s: float = 1.0):
+        self.address = address
+        self.family, self.server_addr = protocol.parse_address(address)
+        self.resubscribe_s = resubscribe_s
+        self.sock = socket.socket(self.family, socket.SOCK_DGRAM)
+        self._own_path = None
+        if self.family == socket.AF_UNIX:
+            # datagram unix clients need their own address to be replied to
+            self._own_path = os.path.join(tempfile.gettempdir(), f"gesture-racer-client-{os.getpid()}-{id(self)}.sock")
+            if os.path.exists(self._own_path):
+                os.unlink(self._own_path)
+            self.sock.bind(self._own_path)
+        else:
+            self.sock.bind(("127.0.0.1" if self.server_addr[0] in ("127.0.0.1", "localhost") else "", 0))
+        self.received = 0
+        self.lost = 0  # sequence gaps (dropped datagrams) per player
+        self._last_seq: dict[int, int] = {}
+        self._next_subscribe = 0.0
+        self.subscribe()
+
+    def subscribe(self):
+        try:
+            self.sock.sendto(protocol.SUBSCRIBE, self.server_addr)
+        except OSError:
+            pass  # server not up yet; retried on the next renewal
+        self._next_subscribe = time.monotonic() + self.resubscribe_s
+
+    def _renew(self):
+        if time.monotonic() >= self._next_subscribe:
+            self.subscribe()
+
+    def _accept(self, data: bytes) -> protocol.GesturePacket:
+        packet = protocol.decode(data)
+        last = self._last_seq.get(packet.player)
+        if last is not None and packet.seq > last + 1:
+            self.lost += packet.seq - last - 1
+        self._last_seq[packet.player] = packet.seq
+        self.received += 1
+        return packet
+
+    def recv(self, timeout: float | None = None) -> protocol.GesturePacket | None:
+        """Next packet, or None after ``timeout`` seconds (None = wait forever)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._renew()
+            wait = self.resubscribe_s
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return None
+            self.sock.settimeout(wait)
+            try:
+                data = self.sock.recv(protocol.MAX_PACKET_SIZE)
+            except socket.timeout:
+                continue
+            except OSError:
+                # Windows: ICMP port unreachable while the server is down
+                time.sleep(min(wait, 0.1))
+                continue
+            try:
+                return self._accept(data)
+            except ValueError:
+                continue  # not ours
+
+    def latest(self, timeout: float | None = 0.0) -> protocol.GesturePacket | None:
+        """Newest queued packet (older ones are discarded); waits up to ``timeout`` if none."""
+        packet = None
+        self._renew()
+        self.sock.setblocking(False)
+        try:
+            while True:
+                try:
+                    data = self.sock.recv(protocol.MAX_PACKET_SIZE)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    break
+                try:
+                    packet = self._accept(data)
+                except ValueError:
+                    continue
+        finally:
+            self.sock.setblocking(True)
+        if packet is None and timeout != 0.0:
+            packet = self.recv(timeout)
+        return packet
+
+    def __iter__(self):
+        while True:
+            yield self.recv()
+
+    def close(self):
+        try:
+            self.sock.sendto(protocol.UNSUBSCRIBE, self.server_addr)
+        except OSError:
+            pass
+        self.sock.close()
+        if self._own_path and os.path.exists(self._own_path):
+            os.unlink(self._own_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -6,10 +6,26 @@ class AppConfig:
     # Camera
     camera_index: int = 0
     frame_flip: bool = True
+    # Requested capture mode (0 / "" = driver default); checked against what the device reports.
+    # e.g. 1280x720 @ 60, "MJPG", buffer 1 avoids slow YUYV modes and queued stale frames.
+    # See python -m gesture_racer.bench.camera for the modes a device really delivers.
+    camera_width: int = 0
+    camera_height: int = 0
+    camera_fps: float = 0.0
+    camera_fourcc: str = ""
+    camera_buffer_size: int = 0
+
+    # Multiple sources: indices or video paths, e.g. [0, 1]; the first one is displayed.
+    # Empty = camera_index only.
+    camera_sources: list = field(default_factory=list)
+    # Per source (sx, sy, ox, oy) mapping its normalized coords into the first source's view
+    camera_source_transforms: list = field(default_factory=list)
+    multicam_max_skew_ms: float = 50.0   # ignore a source whose latest capture is further apart
+    multicam_merge_radius: float = 0.08  # same-label detections closer than this are one hand
 
     # MediaPipe Hands
     model_complexity: int = 0
-    max_num_hands: int = 2
+    max_num_hands: int = 2  # raised to 2 * num_players in multi-player mode
     min_detection_confidence: float = 0.7
     min_tracking_confidence: float = 0.6
 
@@ -22,14 +38,113 @@ class AppConfig:
     max_steering_deg: float = 60.0  # clamp steering angle
     turn_deadband_deg: float = 12.0  # within +/- deadband considered straight
 
+    # Hysteresis between decide_actions and the keyboard (cuts key chatter)
+    hysteresis_enabled: bool = True
+    turn_hysteresis_deg: float = 4.0  # exit threshold = turn_deadband_deg - this
+    brake_hysteresis_px: int = 20     # release brake only beyond brake_distance_px + this
+    move_min_dwell_s: float = 0.10    # minimum time in a move state before it may change
+    turn_min_dwell_s: float = 0.06    # minimum time in a turn state before it may change
+
     # Smoothing
-    smoothing_alpha_angle: float = 0.18  # 0..1, higher = faster, lower = smoother
+    steering_filter: str = "ema"  # ema | one_euro | kalman (one_euro/kalman use frame timestamps)
+    smoothing_alpha_angle: float = 0.18  # ema: 0..1, higher = faster, lower = smoother
+    one_euro_min_cutoff: float = 1.0   # Hz at rest; lower = less jitter when holding still
+    one_euro_beta: float = 0.02        # cutoff increase per deg/s; higher = less lag on fast turns
+    one_euro_d_cutoff: float = 1.0     # Hz, smoothing of the speed estimate
+    kalman_process_noise: float = 400.0     # deg^2/s^3, higher = trusts motion more
+    kalman_measurement_noise: float = 9.0   # deg^2, per-sample measurement variance
+    kalman_predict_s: float = 0.0           # look-ahead to offset pipeline latency
+
+    # Landmark smoothing (all 21 points of every hand, before gesture decisions)
+    landmark_filter_enabled: bool = True
+    landmark_min_cutoff: float = 1.0  # Hz at rest
+    landmark_beta: float = 8.0        # cutoff increase per (frame widths / s)
+    landmark_d_cutoff: float = 1.0
 
     # Input / control
-    movement_keys = ["w", "a", "s", "d"]
+    movement_keys = ["w", "a", "s", "d"]  # forward, left, reverse, right
+
+    # Static hand poses (nearest template), each holding a key while it lasts
+    pose_enabled: bool = False
+    pose_library_path: str = ""      # templates from python -m gesture_racer.poses record; "" = built-in
+    pose_max_distance: float = 0.25  # RMS distance in palm lengths; farther = no pose
+    pose_min_frames: int = 3         # consecutive frames before a pose counts
+    pose_keys: dict = field(default_factory=lambda: {"fist": "shift", "open_palm": "esc", "v_sign": "c"})
+
+    # Motion gestures (subsequence DTW over recent wrist motion), each tapping a key once
+    motion_enabled: bool = False
+    motion_rate_hz: float = 30.0      # wrist motion is resampled to this rate before matching
+    motion_threshold: float = 0.45    # mean DTW cost / template mean speed; lower = stricter
+    motion_refractory_s: float = 0.4  # per hand, after an event
+    motion_tap_ms: float = 50.0       # how long an event's key is held
+    motion_keys: dict = field(default_factory=lambda: {
+        "flick_up": "e", "flick_down": "q", "swipe_left": "h", "swipe_right": "h",
+    })
+
+    # Multi-player: several drivers side by side in front of one camera
+    num_players: int = 1
+    player_grouping: str = "zones"  # zones (equal vertical strips) | cluster (split at widest gaps)
+    player_key_maps: list = field(default_factory=lambda: [
+        ["w", "a", "s", "d"],
+        ["i", "j", "k", "l"],
+        ["up", "left", "down", "right"],
+        ["t", "f", "g", "h"],
+    ])
+    async_input_dispatch: bool = True  # send key events from a background thread
+    input_backend: str = "auto"  # auto | pynput | scancode (Windows) | null | recording
+
+    # PWM steering: pulse a/d with a duty cycle proportional to steering_angle
+    pwm_steering: bool = False
+    pwm_carrier_hz: float = 100.0  # pulse rate, independent of camera FPS
+    pwm_min_pulse_ms: float = 0.0  # stretch shorter pulses (games that poll keys once per frame)
+    pwm_spin_ms: float = 1.0       # busy-wait window before each edge for timing precision
+
+    # Gesture server (python -m gesture_racer.server): udp://host:port or unix:///path
+    server_address: str = "udp://127.0.0.1:50555"
+
+    # HUD video recording (--record-video): encoded on a background thread, frames dropped if it lags
+    record_fps: float = 30.0       # constant output rate; frames are placed by capture timestamp
+    record_fourcc: str = "mp4v"
+    record_queue_size: int = 8
+
+    # Sampling profiler ('p' key or --profile-frames): frames per run and sample period
+    profile_frames: int = 300
+    profile_interval_ms: float = 1.0
+
+    # Memory telemetry (--memory): RSS, per-frame tracemalloc peak, allocations per stage, GC pauses
+    memory_monitor: bool = False
+    memory_tracemalloc: bool = True  # per-frame peaks and bytes per stage; slows allocation
+
+    # Motion-gated inference: reuse the last hands while the luma change inside their boxes
+    # (frame shrunk by motion_gate_downsample, boxes padded by motion_gate_pad) stays under
+    # motion_gate_threshold (0-255 levels); inference still runs at least motion_gate_min_hz
+    motion_gate_enabled: bool = False
+    motion_gate_threshold: float = 2.0
+    motion_gate_min_hz: float = 10.0
+    motion_gate_downsample: int = 8
+    motion_gate_pad: float = 0.25
+
+    # Threads (gesture_racer/threads.py): cv2_num_threads -1 = OpenCV default, 0 = no pool;
+    # inference_threads 0 = MediaPipe default (a hint); cpu_affinity maps stages (loop, tracker,
+    # sources, input, recorder) to CPU ids on Linux, e.g. {"loop": [0], "tracker": [1, 2]}
+    cv2_num_threads: int = -1
+    inference_threads: int = 0
+    cpu_affinity: dict = field(default_factory=dict)
+
+    # Frame pacing: cap the loop rate (0 = uncapped, as fast as the camera delivers), e.g. 30 on a
+    # laptop to save power. Waits sleep, then spin the last pacing_spin_ms for an even period.
+    fps_cap: float = 0.0
+    pacing_spin_ms: float = 1.5
+
+    # Idle mode (kiosks): with no hand for idle_after_s (0 = off), detect at a low rate on a
+    # downscaled fresh frame and show a dimmed HUD; the first hand wakes the full loop
+    idle_after_s: float = 0.0  # e.g. 30 on an unattended machine
+    idle_detect_interval_s: float = 0.25
+    idle_scale: float = 0.5
 
     # UI
     show_debug: bool = True
+    display_hz: float = 30.0  # HUD draw/show rate; tracking and input run at camera rate (0 = every frame)
     theme_name: str = "holo_flux"  # switchable: neo_green, ocean_blue, sunset_orange, cyber_purple, holo_flux
     advanced_ui: bool = True
 
@@ -0,0 +1,195 @@
+"""Motion gestures (flicks, swipes) from recent wrist motion.
+
+Each hand's wrist positions go into a short ring buffer and are resampled at
+a fixed rate, so matching does not depend on the camera's frame rate. Every
+resampled step yields one velocity feature (palm lengths per second, so it
+does not depend on distance to the camera), which is fed to one streaming
+subsequence-DTW matcher per template (SPRING: one cost column per template
+is updated per step, O(template length), instead of re-aligning the whole
+window every frame). A match is reported once it cannot be improved by a
+later end point; it becomes a discrete event in ``GestureOutput.events``.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+WRIST = 0
+MIDDLE_MCP = 9
+
+
+@dataclass
+class MotionTemplate:
+    name: str
+    velocities: np.ndarray  # (m, 2) palm lengths / s, sampled at the recognizer rate
+
+    @property
+    def mean_speed(self) -> float:
+        return float(np.mean(np.hypot(self.velocities[:, 0], self.velocities[:, 1])))
+
+
+def stroke_velocities(dx: float, dy: float, duration_s: float, rate_hz: float) -> np.ndarray:
+    """Velocity samples of a minimum-jerk stroke covering (dx, dy) palm lengths."""
+    n = max(2, int(round(duration_s * rate_hz)))
+    s = (np.arange(n) + 0.5) / n
+    profile = 30.0 * s ** 2 * (1.0 - s) ** 2 / duration_s  # integrates to 1 over the stroke
+    return np.stack([dx * profile, dy * profile], axis=1).astype(np.float32)
+
+
+def default_templates(rate_hz: float = 30.0) -> list[MotionTemplate]:
+    """Flick = quick out-and-back (gear shift), swipe = one-way sideways stroke (horn)."""
+    def flick(dy):
+        return np.vstack([stroke_velocities(0.0, dy, 0.15, rate_hz), stroke_velocities(0.0, -dy, 0.2, rate_hz)])
+
+    return [
+        MotionTemplate("flick_up", flick(-1.5)),
+        MotionTemplate("flick_down", flick(1.5)),
+        MotionTemplate("swipe_left", stroke_velocities(-3.0, 0.0, 0.3, rate_hz)),
+        MotionTemplate("swipe_right", stroke_velocities(3.0, 0.0, 0.3, rate_hz)),
+    ]
+
+
+class SpringMatcher:
+    """Streaming subsequence DTW of one template against one feature stream."""
+
+    def __init__(self, template: MotionTemplate, threshold: float):
+        self.template = template
+        self.m = len(template.velocities)
+        # accept when the mean per-step cost is below threshold * the template's mean speed
+        self.epsilon = threshold * template.mean_speed * self.m
+        self.reset()
+
+    def reset(self):
+        self._d = [math.inf] * (self.m + 1)
+        self._s = [0] * (self.m + 1)
+        self._d[0] = 0.0
+        self._best = math.inf
+        self._best_span = (0, 0)
+
+    def update(self, x: np.ndarray, step: int) -> tuple[float, int, int] | None:
+        """Feed one feature; returns (mean cost, start step, end step) when a match is final."""
+        dist = np.hypot(self.template.velocities[:, 0] - x[0], self.template.velocities[:, 1] - x[1]).tolist()
+        prev_d, prev_s = self._d, self._s
+        d = [0.0] * (self.m + 1)
+        s = [step] * (self.m + 1)
+        for i in range(1, self.m + 1):
+            # insertion (same step), match (diagonal), deletion (previous step)
+            best, start = d[i - 1], s[i - 1]
+            if prev_d[i - 1] < best:
+                best, start = prev_d[i - 1], prev_s[i - 1]
+            if prev_d[i] < best:
+                best, start = prev_d[i], prev_s[i]
+            d[i] = dist[i - 1] + best
+            s[i] = start
+
+        match = None
+        if self._best <= self.epsilon:
+            start, end = self._best_span
+            # final once no running path can still beat it within the reported span
+            if all(d[i] >= self._best or s[i] > end for i in range(1, self.m + 1)):
+                match = (self._best / self.m, start, end)
+                self._best = math.inf
+                for i in range(1, self.m + 1):
+                    if s[i] <= end:
+                        d[i] = math.inf
+        if d[self.m] <= self.epsilon and d[self.m] < self._best:
+            self._best = d[self.m]
+            self._best_span = (s[self.m], step)
+        self._d, self._s = d, s
+        return match
+
+
+class _HandTrack:
+    def __init__(self, templates, threshold: float, history: int):
+        self.samples: deque = deque(maxlen=history)  # (t, x, y, palm)
+        self.matchers = [SpringMatcher(tpl, threshold) for tpl in templates]
+        self.next_tick: float | None = None
+        self.last_pos = None
+        self.step = 0
+        self.refractory_until = -math.inf
+
+    def reset(self):
+        self.samples.clear()
+        self.next_tick = None
+        self.last_pos = None
+        for m in self.matchers:
+            m.reset()
+
+
+class DynamicGestureRecognizer:
+    """Per-hand (by label) motion templates matched on a fixed-rate resampled stream."""
+
+    def __init__(
+        self,
+        templates: list[MotionTemplate] | None = None,
+        rate_hz: float = 30.0,
+        threshold: float = 0.45,
+        refractory_s: float = 0.4,
+        max_gap_s: float = 0.2,
+        history: int = 32,
+    ):
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+        self.templates = templates or default_templates(rate_hz)
+        self.threshold = threshold
+        self.refractory_s = refractory_s
+        self.max_gap_s = max_gap_s
+        self.history = history
+        self.tracks: dict[str, _HandTrack] = {}
+        self.steps = 0
+        self.events = 0
+
+    def _track(self, label: str) -> _HandTrack:
+        track = self.tracks.get(label)
+        if track is None:
+            track = self.tracks[label] = _HandTrack(self.templates, self.threshold, self.history)
+        return track
+
+    def update(self, hands, t: float, aspect: float = 1.0) -> list[str]:
+        """Add one frame of hands (with ``points``); returns the events it completed."""
+        events = []
+        seen = set()
+        for hand in hands:
+            pts = getattr(hand, "points", None)
+            if pts is None or hand.label in seen:
+                continue
+            seen.add(hand.label)
+            x, y = float(pts[WRIST][0]) * aspect, float(pts[WRIST][1])
+            palm = math.hypot((float(pts[MIDDLE_MCP][0]) - float(pts[WRIST][0])) * aspect, float(pts[MIDDLE_MCP][1]) - y)
+            events += self._add_sample(self._track(hand.label), t, x, y, max(palm, 1e-4))
+        for label, track in self.tracks.items():
+            if label not in seen and track.samples and t - track.samples[-1][0] > self.max_gap_s:
+                track.reset()
+        self.events += len(events)
+        return events
+
+    def _add_sample(self, track: _HandTrack, t: float, x: float, y: float, palm: float) -> list[str]:
+        if track.samples and t - track.samples[-1][0] > self.max_gap_s:
+            track.reset()
+        track.samples.append((t, x, y, palm))
+        if track.next_tick is None:
+            track.next_tick = t + self.period
+            track.last_pos = (x, y)
+            return []
+        if len(track.samples) < 2:
+            return []
+        t0, x0, y0, p0 = track.samples[-2]
+        events = []
+        while track.next_tick <= t:
+            # linear interpolation between the last two frames; velocity in palm lengths / s
+            a = (track.next_tick - t0) / (t - t0) if t > t0 else 1.0
+            pos = (x0 + a * (x - x0), y0 + a * (y - y0))
+            scale = self.rate_hz / (p0 + a * (palm - p0))
+            feature = np.array(((pos[0] - track.last_pos[0]) * scale, (pos[1] - track.last_pos[1]) * scale))
+            track.last_pos = pos
+            track.step += 1
+            self.steps += 1
+            for matcher in track.matchers:
+                match = matcher.update(feature, track.step)
+                if match is not None and track.next_tick >= track.refractory_until:
+                    events.append(matcher.template.name)
+                    track.refractory_until = track.next_tick + self.refractory_s
+            track.next_tick += self.period
+        return events
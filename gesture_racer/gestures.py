@@ -1,5 +1,5 @@
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple
 
 
@@ -9,6 +9,10 @@ class GestureOutput:
     turn: str  # 'left', 'right', 'straight'
     steering_angle: float  # degrees
     debug: str
+    hand_distance: float | None = None  # px between wrists when two hands are seen
+    timestamp: float | None = None  # capture time (perf_counter) of the frame it was decided on
+    poses: list = field(default_factory=list)  # held static poses, e.g. ['fist']
+    events: list = field(default_factory=list)  # motion gestures completed this frame, e.g. ['flick_up']
 
 
 def _calculate_steering_wheel_angle(p1: Tuple[int, int], p2: Tuple[int, int]) -> float:
@@ -49,6 +53,7 @@ def decide_actions(
     # hands: list of (x, y, label)
     debug_text = ""
     steering_angle = 0.0
+    distance = None
 
     if len(hands) == 2:
         # Map Left/Right
@@ -95,4 +100,4 @@ def decide_actions(
         steering_angle = 0
         debug_text = "Stop | No hands"
 
-    return GestureOutput(move=move, turn=turn, steering_angle=steering_angle, debug=debug_text)
\ No newline at end of file
+    return GestureOutput(move=move, turn=turn, steering_angle=steering_angle, debug=debug_text, hand_distance=distance)
\ No newline at end of file
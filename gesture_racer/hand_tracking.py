@@ -1,7 +1,12 @@
+import threading
 from dataclasses import dataclass
 from typing import List, Optional
 import cv2
-import mediapipe as mp
+import numpy as np
+
+from gesture_racer.threads import pin_current_thread
+
+WRIST = 0  # mediapipe HandLandmark.WRIST
 
 
 @dataclass
@@ -10,6 +15,8 @@ class HandData:
     y: int
     label: str  # 'Left', 'Right', or 'Unknown'
     landmarks: Optional[object] = None
+    points: Optional[np.ndarray] = None  # (21, 3) float32, normalized x/y and relative z
+    score: float = 1.0  # handedness confidence
 
 
 class HandTracker:
@@ -25,25 +32,75 @@ class HandTracker:
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
 
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
+        # mediapipe is imported on __enter__ (about a second), not with this module
+        self.mp_hands = None
         self.hands_ctx = None
+        self._opener: threading.Thread | None = None
+        self._ready = threading.Event()
+        self.open_error: Exception | None = None
 
-    def __enter__(self):
+    def _create(self):
+        import mediapipe as mp
+
+        self.mp_hands = mp.solutions.hands
         self.hands_ctx = self.mp_hands.Hands(
             model_complexity=self.model_complexity,
             max_num_hands=self.max_num_hands,
             min_detection_confidence=self.min_detection_confidence,
             min_tracking_confidence=self.min_tracking_confidence,
         )
+
+    def __enter__(self):
+        self._create()
+        self._ready.set()
         return self
 
     def __exit__(self, exc_type, exc, tb):
+        if self._opener is not None:
+            self._opener.join()
+            self._opener = None
         if self.hands_ctx:
             self.hands_ctx.close()
             self.hands_ctx = None
 
+    def warm_up(self, shape=(480, 640, 3)):
+        """Run one blank frame so the graph's first-call setup happens now."""
+        self.hands_ctx.process(np.zeros(shape, dtype=np.uint8))
+
+    def start(self, warm_up: bool = True, shape=(480, 640, 3)) -> "HandTracker":
+        """Open (and warm up) the graph on a helper thread.
+
+        Until it is ready ``process`` returns no hands, so frames can be shown
+        straight away. Close with ``__exit__`` as usual. The graph is not tied
+        to the thread that created it (it runs on its own threads), so
+        ``process`` may then be called from any thread, one call at a time.
+        """
+        self._ready.clear()
+        self._opener = threading.Thread(target=self._open, args=(warm_up, shape), name="tracker-warmup", daemon=True)
+        self._opener.start()
+        return self
+
+    def _open(self, warm_up: bool, shape):
+        # MediaPipe's own threads start from this one and inherit its CPUs
+        pin_current_thread("tracker")
+        try:
+            self._create()
+            if warm_up:
+                self.warm_up(shape)
+        except Exception as exc:
+            self.open_error = exc
+        finally:
+            self._ready.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
     def process(self, bgr_frame) -> List[HandData]:
+        if self._opener is not None and not self._ready.is_set():
+            return []
+        if self.open_error is not None:
+            raise RuntimeError(f"Error: hand tracker failed to start ({self.open_error}).")
         if self.hands_ctx is None:
             raise RuntimeError("HandTracker must be used as a context manager or call __enter__ first.")
 
@@ -55,15 +112,17 @@ class HandTracker:
         if results.multi_hand_landmarks:
             for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
                 # Wrist landmark in pixel coordinates
-                wrist = hand_landmarks.landmark[self.mp_hands.HandLandmark.WRIST]
+                wrist = hand_landmarks.landmark[WRIST]
                 x_px, y_px = int(wrist.x * w), int(wrist.y * h)
 
                 # Handedness
                 if results.multi_handedness and idx < len(results.multi_handedness):
-                    label = results.multi_handedness[idx].classification[0].label
+                    cls = results.multi_handedness[idx].classification[0]
+                    label, score = cls.label, cls.score
                 else:
-                    label = "Unknown"
+                    label, score = "Unknown", 0.0
 
-                hands.append(HandData(x=x_px, y=y_px, label=label, landmarks=hand_landmarks))
+                points = np.array([(p.x, p.y, p.z) for p in hand_landmarks.landmark], dtype=np.float32)
+                hands.append(HandData(x=x_px, y=y_px, label=label, landmarks=hand_landmarks, points=points, score=score))
 
         return hands
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""Idle mode for unattended machines (kiosks).
+
+After ``idle_after_s`` without a hand the loop stops running at camera rate:
+the source captures one fresh frame per ``detect_interval_s``, runs hand
+detection on it at ``scale`` resolution, and the HUD is a dimmed frame with a
+hint instead of the full overlay. The first detection that sees a hand
+switches straight back to full rate, and that frame is processed normally, so
+waking costs at most one detection interval.
+
+Process CPU time is accounted per state (``idle_cpu_pct`` vs
+``active_cpu_pct``), and every wake-up records the time from the last idle
+detection that saw nothing (the latest a hand can have arrived unseen) to the
+end of the first full-rate frame: a worst-case wake latency.
+"""
+
+import time
+
+import cv2
+
+from gesture_racer.metrics import RollingStats
+
+
+class IdleMode:
+    def __init__(
+        self,
+        idle_after_s: float = 30.0,
+        detect_interval_s: float = 0.25,
+        scale: float = 0.5,
+        clock=time.perf_counter,
+        cpu_clock=time.process_time,
+    ):
+        self.idle_after_s = idle_after_s
+        self.detect_interval_s = detect_interval_s
+        self.scale = scale
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.idle = False
+        self.wakes = 0
+        self.wake_latency = RollingStats(64)
+        self._last_hand_t: float | None = None
+        self._last_empty_t: float | None = None  # last idle detection without hands
+        self._waking_from: float | None = None
+        # [wall seconds, cpu seconds] spent in each state
+        self._time = {False: [0.0, 0.0], True: [0.0, 0.0]}
+        self._mark = (clock(), cpu_clock())
+
+    def _account(self):
+        wall, cpu = self.clock(), self.cpu_clock()
+        bucket = self._time[self.idle]
+        bucket[0] += wall - self._mark[0]
+        bucket[1] += cpu - self._mark[1]
+        self._mark = (wall, cpu)
+
+    def update(self, num_hands: int, t: float) -> bool:
+        """Feed one frame's detection; returns True when the state changed."""
+        if self._last_hand_t is None:
+            self._last_hand_t = t
+        if num_hands:
+            self._last_hand_t = t
+            if self.idle:
+                self._account()
+                self.idle = False
+                self.wakes += 1
+                self._waking_from = self._last_empty_t if self._last_empty_t is not None else t
+                return True
+            return False
+        if self.idle:
+            self._last_empty_t = t
+            return False
+        if t - self._last_hand_t >= self.idle_after_s:
+            self._account()
+            self.idle = True
+            self._last_empty_t = t
+            return True
+        return False
+
+    @property
+    def period(self) -> float:
+        """Source capture period for the current state (0 = camera rate)."""
+        return self.detect_interval_s if self.idle else 0.0
+
+    def frame_done(self, now: float | None = None):
+        """Call at the end of every frame; completes a pending wake-up measurement."""
+        if self._waking_from is not None:
+            self.wake_latency.add((self.clock() if now is None else now) - self._waking_from)
+            self._waking_from = None
+
+    def stats(self) -> dict:
+        self._account()
+        (active_wall, active_cpu), (idle_wall, idle_cpu) = self._time[False], self._time[True]
+        total = active_wall + idle_wall
+        lat = self.wake_latency.summary(scale=1000.0)
+        return {
+            "idle": int(self.idle),
+            "idle_fraction": idle_wall / total if total else 0.0,
+            "idle_cpu_pct": 100.0 * idle_cpu / idle_wall if idle_wall else 0.0,
+            "active_cpu_pct": 100.0 * active_cpu / active_wall if active_wall else 0.0,
+            "idle_wakes": self.wakes,
+            "idle_wake_ms_p50": lat["p50"],
+            "idle_wake_ms_max": lat["max"],
+        }
+
+
+def draw_idle_hud(frame, text: str = "Idle - show your hands to drive"):
+    """Minimal HUD: the dimmed camera image and one line of text."""
+    frame = cv2.convertScaleAbs(frame, alpha=0.35)
+    h, w = frame.shape[:2]
+    size, _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 2)
+    cv2.putText(frame, text, ((w - size[0]) // 2, h // 2), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (200, 200, 200), 2, cv2.LINE_AA)
+    return frame
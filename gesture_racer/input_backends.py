@@ -0,0 +1,186 @@
+"""Keyboard output backends.
+
+Every backend exposes ``press(key)``, ``release(key)`` and ``close()`` with
+single-character or named keys (``"w"``, ``"space"``, ``"shift"``). Select one
+by name with :func:`create_backend` (``AppConfig.input_backend``).
+"""
+
+import ctypes
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+class InputBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def press(self, key: str):
+        ...
+
+    @abstractmethod
+    def release(self, key: str):
+        ...
+
+    def close(self):
+        pass
+
+
+class PynputBackend(InputBackend):
+    """Cross-platform virtual-key events via pynput."""
+
+    name = "pynput"
+
+    def __init__(self):
+        from pynput.keyboard import Controller, Key
+
+        self._controller = Controller()
+        self._key_enum = Key
+
+    def _resolve(self, key: str):
+        if len(key) == 1:
+            return key
+        return getattr(self._key_enum, key)
+
+    def press(self, key: str):
+        self._controller.press(self._resolve(key))
+
+    def release(self, key: str):
+        self._controller.release(self._resolve(key))
+
+
+# --- Windows SendInput with hardware scan codes (works with DirectInput games) ---
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_SCANCODE = 0x0008
+KEYEVENTF_KEYUP = 0x0002
+INPUT_KEYBOARD = 1
+
+SCAN_CODES = {
+    "1": 0x02, "2": 0x03, "3": 0x04, "4": 0x05, "5": 0x06,
+    "6": 0x07, "7": 0x08, "8": 0x09, "9": 0x0A, "0": 0x0B,
+    "q": 0x10, "w": 0x11, "e": 0x12, "r": 0x13, "t": 0x14,
+    "y": 0x15, "u": 0x16, "i": 0x17, "o": 0x18, "p": 0x19,
+    "a": 0x1E, "s": 0x1F, "d": 0x20, "f": 0x21, "g": 0x22,
+    "h": 0x23, "j": 0x24, "k": 0x25, "l": 0x26,
+    "z": 0x2C, "x": 0x2D, "c": 0x2E, "v": 0x2F, "b": 0x30,
+    "n": 0x31, "m": 0x32,
+    "esc": 0x01, "tab": 0x0F, "enter": 0x1C, "space": 0x39,
+    "ctrl": 0x1D, "shift": 0x2A, "alt": 0x38,
+    "up": 0x48, "left": 0x4B, "right": 0x4D, "down": 0x50,
+}
+EXTENDED_KEYS = {"up", "left", "right", "down"}
+
+PUL = ctypes.POINTER(ctypes.c_ulong)
+
+
+class KeyBdInput(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", PUL),
+    ]
+
+
+class Input_I(ctypes.Union):
+    _fields_ = [("ki", KeyBdInput)]
+
+
+class Input(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("ii", Input_I)]
+
+
+class ScanCodeBackend(InputBackend):
+    """ctypes ``SendInput`` with scan codes (Windows only)."""
+
+    name = "scancode"
+
+    def __init__(self):
+        if not sys.platform.startswith("win"):
+            raise RuntimeError("scancode backend requires Windows (SendInput)")
+        self._send = ctypes.windll.user32.SendInput
+        self._extra = ctypes.c_ulong(0)
+
+    def _send_input(self, scan_code: int, flags: int):
+        ki = KeyBdInput(0, scan_code, flags, 0, ctypes.pointer(self._extra))
+        ii_ = Input_I()
+        ii_.ki = ki
+        command = Input(ctypes.c_ulong(INPUT_KEYBOARD), ii_)
+        self._send(1, ctypes.pointer(command), ctypes.sizeof(command))
+
+    @staticmethod
+    def _flags(key: str) -> int:
+        return KEYEVENTF_SCANCODE | (KEYEVENTF_EXTENDEDKEY if key in EXTENDED_KEYS else 0)
+
+    def press(self, key: str):
+        key = key.lower()
+        code = SCAN_CODES.get(key)
+        if code is not None:
+            self._send_input(code, self._flags(key))
+
+    def release(self, key: str):
+        key = key.lower()
+        code = SCAN_CODES.get(key)
+        if code is not None:
+            self._send_input(code, self._flags(key) | KEYEVENTF_KEYUP)
+
+
+class NullBackend(InputBackend):
+    """Discards all events (headless runs, dry runs)."""
+
+    name = "null"
+
+    def press(self, key: str):
+        pass
+
+    def release(self, key: str):
+        pass
+
+
+@dataclass
+class KeyEvent:
+    t: float
+    action: str  # 'press' | 'release'
+    key: str
+
+
+class RecordingBackend(InputBackend):
+    """Keeps every event in memory with a timestamp from ``clock``."""
+
+    name = "recording"
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.events: list[KeyEvent] = []
+        self.held: set[str] = set()
+
+    def press(self, key: str):
+        self.events.append(KeyEvent(self.clock(), "press", key))
+        self.held.add(key)
+
+    def release(self, key: str):
+        self.events.append(KeyEvent(self.clock(), "release", key))
+        self.held.discard(key)
+
+    def clear(self):
+        self.events.clear()
+
+
+BACKENDS = {
+    "pynput": PynputBackend,
+    "scancode": ScanCodeBackend,
+    "null": NullBackend,
+    "recording": RecordingBackend,
+}
+
+
+def create_backend(name: str = "auto") -> InputBackend:
+    """Instantiate a backend by name; ``auto`` keeps the historical pynput default."""
+    key = (name or "auto").lower()
+    if key == "auto":
+        key = "pynput"
+    if key not in BACKENDS:
+        raise ValueError(f"Unknown input backend '{name}'. Choose from: auto, {', '.join(BACKENDS)}")
+    return BACKENDS[key]()
@@ -1,52 +1,177 @@
-import sys
+import threading
+import time
 from typing import Iterable
 
+from gesture_racer.input_backends import InputBackend, create_backend
+from gesture_racer.input_dispatch import InputDispatcher
+from gesture_racer.pwm import SteeringPWM
+
 
 class InputController:
-    def __init__(self, movement_keys: Iterable[str] = ("w", "a", "s", "d")):
+    def __init__(
+        self,
+        movement_keys: Iterable[str] = ("w", "a", "s", "d"),
+        async_dispatch: bool = False,
+        pwm_steering: bool = False,
+        pwm_carrier_hz: float = 100.0,
+        pwm_min_pulse_ms: float = 0.0,
+        pwm_spin_ms: float = 1.0,
+        turn_deadband_deg: float = 12.0,
+        max_steering_deg: float = 60.0,
+        backend: InputBackend | str = "auto",
+    ):
         self.movement_keys = list(movement_keys)
-        self.backend = None
-        if sys.platform.startswith("win"):
-            # Fallback to pynput even on Windows for simplicity; could add ctypes-based mode later.
-            from pynput.keyboard import Controller
-            self.backend = Controller()
-        else:
-            # macOS / Linux
-            from pynput.keyboard import Controller
-            self.backend = Controller()
+        # movement_keys order is forward, left, reverse, right (w, a, s, d)
+        self.key_forward, self.key_left, self.key_reverse, self.key_right = self.movement_keys[:4]
+        # pynput everywhere by default; see input_backends for scancode/null/recording
+        self.backend = create_backend(backend) if isinstance(backend, str) else backend
         self._pressed = set()
+        self.errors = 0
+        self.last_error: Exception | None = None
+
+        # Optional background dispatch: apply_actions only publishes the desired state
+        self.dispatcher = InputDispatcher(self._backend_press, self._backend_release) if async_dispatch else None
+        self._published = None
+
+        # Movement and turn keys are desired independently: the frame loop owns movement,
+        # while turn keys come either from the frame loop or from the PWM scheduler thread.
+        self._move_desired = frozenset()
+        self._turn_desired = frozenset()
+        self._extra_desired = frozenset()  # e.g. pose keys, held while the pose lasts
+        self._taps: dict[str, float] = {}  # tapped key -> release time
+        self._publish_lock = threading.Lock()
+        self.pwm = None
+        if pwm_steering:
+            self.pwm = SteeringPWM(
+                self._set_turn,
+                carrier_hz=pwm_carrier_hz,
+                deadband_deg=turn_deadband_deg,
+                max_steering_deg=max_steering_deg,
+                min_pulse_ms=pwm_min_pulse_ms,
+                spin_s=pwm_spin_ms / 1000.0,
+            )
+
+    def _backend_press(self, key: str):
+        self.backend.press(key)
+
+    def _backend_release(self, key: str):
+        self.backend.release(key)
+
+    def _record_error(self, exc: Exception):
+        # e.g., missing Accessibility permission; keep going but make it visible
+        self.errors += 1
+        self.last_error = exc
 
     def press(self, key: str):
         try:
             self.backend.press(key)
-        except Exception:
-            # Ignore press errors (e.g., missing Accessibility permission)
-            pass
+        except Exception as exc:
+            self._record_error(exc)
 
     def release(self, key: str):
         try:
             self.backend.release(key)
-        except Exception:
-            pass
+        except Exception as exc:
+            self._record_error(exc)
 
     def release_all(self):
+        if self.pwm is not None:
+            self.pwm.stop()
+        extra = self._extra_desired | set(self._taps)
+        self._move_desired = frozenset()
+        self._turn_desired = frozenset()
+        self._extra_desired = frozenset()
+        self._taps = {}
+        if self.dispatcher is not None:
+            # Let the thread drain to an empty state, then release synchronously whatever
+            # it still reports as held (or everything, if it did not stop in time).
+            self.dispatcher.submit(())
+            stopped = self.dispatcher.stop()
+            held = set(self.dispatcher.applied)
+            if not stopped:
+                held |= set(self.movement_keys) | extra
+            for k in held:
+                self.release(k)
+            self.dispatcher.applied.clear()
+            self._published = None
         for k in list(self._pressed):
             self.release(k)
         self._pressed.clear()
 
-    def apply_actions(self, move: str, turn: str):
+    def close(self):
+        self.release_all()
+        self.backend.close()
+
+    def dispatch_stats(self) -> dict:
+        stats = self.dispatcher.stats() if self.dispatcher is not None else {}
+        stats["errors"] = self.errors + stats.get("errors", 0)
+        if self.pwm is not None:
+            stats.update({f"pwm_{k}": v for k, v in self.pwm.stats().items()})
+        return stats
+
+    def _turn_keys(self, turn: str | None) -> frozenset:
+        if turn == "left":
+            return frozenset((self.key_left,))
+        if turn == "right":
+            return frozenset((self.key_right,))
+        return frozenset()
+
+    def _set_turn(self, turn: str | None):
+        # called from the PWM thread on every edge
+        self._turn_desired = self._turn_keys(turn)
+        self._publish()
+
+    def apply_actions(self, move: str, turn: str, steering_angle: float | None = None):
         desired = set()
         # Movement
         if move == "forward":
-            desired.add("w")
+            desired.add(self.key_forward)
         elif move in ("brake", "reverse"):
-            desired.add("s")
-        # Turning
-        if turn == "left":
-            desired.add("a")
-        elif turn == "right":
-            desired.add("d")
+            desired.add(self.key_reverse)
+        self._move_desired = frozenset(desired)
+
+        # Turning: proportional pulses when PWM is active, otherwise on/off from `turn`
+        if self.pwm is not None and steering_angle is not None:
+            self.pwm.set_angle(steering_angle if move == "forward" else 0.0)
+            self.pwm.start()
+        else:
+            self._turn_desired = self._turn_keys(turn)
+        self._publish()
+
+    def set_extra_keys(self, keys: Iterable[str]):
+        """Hold exactly ``keys`` besides the movement/turn keys (empty releases them)."""
+        keys = frozenset(keys)
+        if keys != self._extra_desired:
+            self._extra_desired = keys
+            self._publish()
+
+    def tap(self, key: str, hold_s: float = 0.05):
+        """Press ``key`` once for a discrete event (e.g. a gear shift).
+
+        It is released by the first update after ``hold_s``, long enough for
+        games that sample key state once per frame to see it.
+        """
+        self._taps[key] = time.perf_counter() + hold_s
+        self._publish()
+
+    def _publish(self):
+        # Serializes the two producers (frame loop, PWM thread); held only for a set union
+        # plus either a slot assignment (async) or the key diff (sync).
+        with self._publish_lock:
+            desired = self._move_desired | self._turn_desired | self._extra_desired
+            if self._taps:
+                now = time.perf_counter()
+                self._taps = {k: until for k, until in self._taps.items() if until > now}
+                desired |= frozenset(self._taps)
+            if self.dispatcher is not None:
+                if desired != self._published:
+                    self.dispatcher.start()
+                    self.dispatcher.submit(desired)
+                    self._published = desired
+            else:
+                self._apply_sync(desired)
 
+    def _apply_sync(self, desired):
         # Release keys that are no longer needed
         for k in list(self._pressed):
             if k not in desired:
@@ -57,4 +182,4 @@ class InputController:
         for k in desired:
             if k not in self._pressed:
                 self.press(k)
-                self._pressed.add(k)
\ No newline at end of file
+                self._pressed.add(k)
@@ -0,0 +1,120 @@
+import threading
+import time
+from typing import Callable, Iterable
+
+from gesture_racer.metrics import RollingStats
+from gesture_racer.threads import pin_current_thread
+
+
+class InputDispatcher:
+    """Applies key state on a background thread so the vision loop never blocks.
+
+    The frame loop publishes the *desired* set of held keys into a single
+    latest-state slot; publishing is a plain reference assignment, so the
+    producer never waits on a lock. The dispatcher thread wakes, reads the
+    newest slot and only emits the press/release transitions needed to reach
+    it. Intermediate states published while the thread was busy are coalesced
+    away (a key that flips on and off between two wake-ups costs nothing).
+    """
+
+    def __init__(
+        self,
+        press: Callable[[str], None],
+        release: Callable[[str], None],
+        history: int = 512,
+    ):
+        self._press = press
+        self._release = release
+        # (sequence, desired keys, publish time); replaced atomically, never mutated
+        self._slot = (0, frozenset(), 0.0)
+        self._seq = 0
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+        self.applied: set[str] = set()
+
+        # telemetry
+        self.latency = RollingStats(history)  # publish -> OS call returned, seconds
+        self.call_time = RollingStats(history)  # duration of the OS call alone
+        self.submitted = 0
+        self.coalesced = 0
+        self.events = 0
+        self.errors = 0
+        self.last_error: Exception | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="input-dispatch", daemon=True)
+        self._thread.start()
+
+    def submit(self, desired: Iterable[str]):
+        """Publish the desired key set; returns immediately."""
+        self._seq += 1
+        self._slot = (self._seq, frozenset(desired), time.perf_counter())
+        self.submitted += 1
+        self._wake.set()
+
+    def stop(self, timeout: float = 0.5) -> bool:
+        """Stop the thread after it drains the latest slot. Returns False on timeout."""
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            alive = self._thread.is_alive()
+            self._thread = None
+            return not alive
+        return True
+
+    def _emit(self, fn, key: str, published_at: float):
+        t0 = time.perf_counter()
+        try:
+            fn(key)
+        except Exception as exc:
+            self.errors += 1
+            self.last_error = exc
+            return False
+        t1 = time.perf_counter()
+        self.call_time.add(t1 - t0)
+        self.latency.add(t1 - published_at)
+        self.events += 1
+        return True
+
+    def _apply(self, desired: frozenset, published_at: float):
+        for k in list(self.applied):
+            if k not in desired and self._emit(self._release, k, published_at):
+                self.applied.discard(k)
+        for k in desired:
+            if k not in self.applied and self._emit(self._press, k, published_at):
+                self.applied.add(k)
+
+    def _run(self):
+        pin_current_thread("input")
+        last_seq = 0
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            seq, desired, published_at = self._slot
+            if seq != last_seq:
+                self.coalesced += max(0, seq - last_seq - 1)
+                last_seq = seq
+                self._apply(desired, published_at)
+            if not self._running:
+                break
+
+    def stats(self) -> dict:
+        lat = self.latency.summary(scale=1000.0)
+        return {
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "events": self.events,
+            "errors": self.errors,
+            "latency_ms_p50": lat["p50"],
+            "latency_ms_p95": lat["p95"],
+            "latency_ms_max": lat["max"],
+        }
@@ -12,20 +12,25 @@ def compute_grip(hand_data, frame_width: int, frame_height: int, threshold_px: i
     grip_strength is 0..1 where 1 means fully pinched (distance ~0),
     and 0 means far apart.
     """
-    lm = getattr(hand_data, "landmarks", None)
-    if lm is None:
-        return False, 0.0
-
     # Mediapipe enums are inside the module; use integral indices to avoid import here:
     # THUMB_TIP = 4, INDEX_FINGER_TIP = 8
-    try:
-        thumb_tip = lm.landmark[4]
-        index_tip = lm.landmark[8]
-    except Exception:
-        return False, 0.0
-
-    tx, ty = _landmark_to_px(thumb_tip, frame_width, frame_height)
-    ix, iy = _landmark_to_px(index_tip, frame_width, frame_height)
+    pts = getattr(hand_data, "points", None)
+    if pts is not None:
+        # (21, 3) array, possibly smoothed by LandmarkFilterBank
+        tx, ty = int(pts[4][0] * frame_width), int(pts[4][1] * frame_height)
+        ix, iy = int(pts[8][0] * frame_width), int(pts[8][1] * frame_height)
+    else:
+        lm = getattr(hand_data, "landmarks", None)
+        if lm is None:
+            return False, 0.0
+        try:
+            thumb_tip = lm.landmark[4]
+            index_tip = lm.landmark[8]
+        except Exception:
+            return False, 0.0
+
+        tx, ty = _landmark_to_px(thumb_tip, frame_width, frame_height)
+        ix, iy = _landmark_to_px(index_tip, frame_width, frame_height)
 
     dx = tx - ix
     dy = ty - iy
@@ -0,0 +1,123 @@
+import copy
+
+import numpy as np
+
+from gesture_racer.smoothing import _smoothing_factor
+
+
+class LandmarkFilterBank:
+    """One Euro smoothing of every landmark of every tracked hand in one NumPy update.
+
+    State is a ``(max_tracks, 21, 3)`` tensor of filtered positions plus their
+    filtered speeds. Each frame the detected hands are matched to tracks
+    (same handedness label and nearest wrist), all matched tracks are updated
+    together, and tracks with no hand this frame are dropped so a returning
+    hand starts from its raw position instead of being dragged from a stale one.
+
+    Coordinates are MediaPipe-normalized, so ``beta`` is in Hz per
+    (frame-widths / second).
+    """
+
+    def __init__(
+        self,
+        max_tracks: int = 2,
+        min_cutoff: float = 1.0,
+        beta: float = 8.0,
+        d_cutoff: float = 1.0,
+        match_radius: float = 0.25,
+        num_landmarks: int = 21,
+    ):
+        self.max_tracks = max_tracks
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.match_radius = match_radius
+        self.value = np.zeros((max_tracks, num_landmarks, 3), dtype=np.float32)
+        self.dx = np.zeros_like(self.value)
+        self.active = np.zeros(max_tracks, dtype=bool)
+        self.labels: list[str | None] = [None] * max_tracks
+        self.t = None
+
+    def reset(self):
+        self.active[:] = False
+        self.labels = [None] * self.max_tracks
+        self.t = None
+
+    def _assign(self, hands) -> tuple[list[int], set]:
+        """Track index per hand (-1 if no slot is left) and the set of matched (continuing) tracks."""
+        pairs = []
+        for hi, h in enumerate(hands):
+            wrist = h.points[0, :2]
+            for ti in np.nonzero(self.active)[0]:
+                d = float(np.hypot(*(self.value[ti, 0, :2] - wrist)))
+                if d <= self.match_radius:
+                    penalty = 0.0 if self.labels[ti] == h.label else self.match_radius
+                    pairs.append((d + penalty, hi, int(ti)))
+        pairs.sort()
+        assigned = [-1] * len(hands)
+        used = set()
+        for _, hi, ti in pairs:
+            if assigned[hi] == -1 and ti not in used:
+                assigned[hi] = ti
+                used.add(ti)
+        matched = set(used)
+        # unmatched hands start new tracks, preferring idle slots over unmatched live ones
+        free = [ti for ti in range(self.max_tracks) if ti not in used and not self.active[ti]]
+        free += [ti for ti in range(self.max_tracks) if ti not in used and self.active[ti]]
+        for hi in range(len(hands)):
+            if assigned[hi] == -1 and free:
+                assigned[hi] = free.pop(0)
+        return assigned, matched
+
+    def update(self, hands, t: float, frame_width: int, frame_height: int):
+        """Return copies of ``hands`` with smoothed ``points`` and wrist ``x``/``y``."""
+        usable = [h for h in hands if getattr(h, "points", None) is not None]
+        assigned, matched = self._assign(usable)
+
+        seen = np.zeros(self.max_tracks, dtype=bool)
+        continuing, fresh, raw_cont = [], [], []
+        for h, ti in zip(usable, assigned):
+            if ti < 0:
+                continue
+            seen[ti] = True
+            if ti in matched:
+                continuing.append(ti)
+                raw_cont.append(h.points)
+            else:
+                fresh.append((ti, h.points))
+            self.labels[ti] = h.label
+
+        dt = (t - self.t) if self.t is not None else 0.0
+        if continuing and dt > 0:
+            idx = np.array(continuing)
+            x = np.stack(raw_cont).astype(np.float32)
+            prev = self.value[idx]
+            a_d = _smoothing_factor(dt, self.d_cutoff)
+            dx = a_d * ((x - prev) / dt) + (1.0 - a_d) * self.dx[idx]
+            cutoff = self.min_cutoff + self.beta * np.abs(dx)
+            a = _smoothing_factor(dt, cutoff)
+            self.value[idx] = a * x + (1.0 - a) * prev
+            self.dx[idx] = dx
+        for ti, pts in fresh:
+            self.value[ti] = pts
+            self.dx[ti] = 0.0
+
+        # hands that vanished this frame lose their state
+        self.active = seen
+        for ti in np.nonzero(~seen)[0]:
+            self.labels[ti] = None
+        self.t = t
+
+        out = []
+        for h, ti in zip(usable, assigned):
+            if ti < 0:
+                out.append(h)
+                continue
+            pts = self.value[ti].copy()
+            smoothed = copy.copy(h)
+            smoothed.points = pts
+            smoothed.x = int(pts[0, 0] * frame_width)
+            smoothed.y = int(pts[0, 1] * frame_height)
+            out.append(smoothed)
+        out.extend(h for h in hands if getattr(h, "points", None) is None)
+        return out
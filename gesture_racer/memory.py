@@ -0,0 +1,170 @@
+"""Per-frame memory telemetry: RSS, tracemalloc peaks, allocations per stage, GC pauses.
+
+``MemoryMonitor`` is driven by the same stage marks as the profiler
+(``mark("overlay")``) plus ``frame_done()`` once per frame. Per stage it
+records the change in ``sys.getallocatedblocks()`` (net objects allocated)
+and, with tracemalloc on, in traced bytes. GC pauses are timed with
+``gc.callbacks``. tracemalloc slows allocation noticeably, so it is
+optional; everything else is cheap enough to leave on.
+"""
+
+import ctypes
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+from gesture_racer.metrics import RollingStats
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process (peak RSS where current is unavailable)."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            pass
+    if sys.platform.startswith("win"):
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", ctypes.c_ulong),
+                ("PageFaultCount", ctypes.c_ulong),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return 0
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, others KiB
+
+
+class MemoryMonitor:
+    def __init__(self, use_tracemalloc: bool = True, rss_every: int = 30, window: int = 300):
+        self.use_tracemalloc = use_tracemalloc
+        self.rss_every = rss_every
+        self.rss = 0
+        self.frames = 0
+        self.frame_peak = RollingStats(window)  # bytes above the frame's starting level
+        self.gc_pause = RollingStats(window)
+        self.gc_collections = 0
+        self.gc_time_total = 0.0
+        self.stage_blocks: dict[str, RollingStats] = defaultdict(lambda: RollingStats(window))
+        self.stage_bytes: dict[str, RollingStats] = defaultdict(lambda: RollingStats(window))
+        self.stage = None
+        self._stage_blocks0 = 0
+        self._stage_bytes0 = 0
+        self._frame_bytes0 = 0
+        self._gc_t0 = None
+        self._started_tracemalloc = False
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return self
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        gc.callbacks.append(self._on_gc)
+        self.rss = rss_bytes()
+        self._begin_frame()
+        self.running = True
+        return self
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_t0 = time.perf_counter()
+        elif self._gc_t0 is not None:
+            pause = time.perf_counter() - self._gc_t0
+            self._gc_t0 = None
+            self.gc_pause.add(pause)
+            self.gc_collections += 1
+            self.gc_time_total += pause
+
+    def _traced(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.use_tracemalloc else 0
+
+    def _begin_frame(self):
+        if self.use_tracemalloc:
+            tracemalloc.reset_peak()
+        self._frame_bytes0 = self._traced()
+        self._stage_blocks0 = sys.getallocatedblocks()
+        self._stage_bytes0 = self._frame_bytes0
+
+    # --- loop side -----------------------------------------------------
+    def mark(self, stage: str | None):
+        """Close the current stage and start ``stage`` (None = untracked)."""
+        if not self.running:
+            return
+        blocks = sys.getallocatedblocks()
+        traced = self._traced()
+        if self.stage is not None:
+            self.stage_blocks[self.stage].add(blocks - self._stage_blocks0)
+            if self.use_tracemalloc:
+                self.stage_bytes[self.stage].add(traced - self._stage_bytes0)
+        self.stage = stage
+        self._stage_blocks0 = blocks
+        self._stage_bytes0 = traced
+
+    def frame_done(self):
+        if not self.running:
+            return
+        self.mark(None)
+        if self.use_tracemalloc:
+            self.frame_peak.add(tracemalloc.get_traced_memory()[1] - self._frame_bytes0)
+        self.frames += 1
+        if self.frames % self.rss_every == 0:
+            self.rss = rss_bytes()
+        self._begin_frame()
+
+    # --- results -------------------------------------------------------
+    def traced_bytes(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    def stats(self) -> dict:
+        out = {
+            "mem_rss_mb": self.rss / 2 ** 20,
+            "mem_gc_pause_ms_p95": self.gc_pause.percentile(95) * 1000.0,
+            "mem_gc_pause_ms_max": self.gc_pause.max * 1000.0,
+            "mem_gc_collections": self.gc_collections,
+        }
+        if self.use_tracemalloc:
+            out["mem_traced_mb"] = self.traced_bytes() / 2 ** 20
+            out["mem_frame_peak_kb_p95"] = self.frame_peak.percentile(95) / 1024.0
+        for stage, blocks in self.stage_blocks.items():
+            out[f"mem_blocks_{stage}"] = blocks.mean
+        for stage, nbytes in self.stage_bytes.items():
+            out[f"mem_kb_{stage}"] = nbytes.mean / 1024.0
+        return out
+
+    def chip(self) -> str:
+        parts = [f"Mem: {self.rss / 2 ** 20:.0f}MB"]
+        if self.use_tracemalloc:
+            parts.append(f"peak/frame {self.frame_peak.percentile(95) / 2 ** 20:.1f}MB")
+        parts.append(f"GC {self.gc_pause.percentile(95) * 1000.0:.2f}ms p95")
+        return " | ".join(parts)
@@ -0,0 +1,65 @@
+import json
+from collections import deque
+
+
+class RollingStats:
+    """Fixed-size window of samples with cheap summary statistics."""
+
+    def __init__(self, maxlen: int = 512):
+        self.samples = deque(maxlen=maxlen)
+        self.count = 0  # total samples ever added
+
+    def add(self, x: float):
+        self.samples.append(x)
+        self.count += 1
+
+    def clear(self):
+        self.samples.clear()
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        idx = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+        return ordered[idx]
+
+    @property
+    def mean(self) -> float:
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    @property
+    def max(self) -> float:
+        return max(self.samples) if self.samples else 0.0
+
+    def summary(self, scale: float = 1.0) -> dict:
+        """Return mean/p50/p95/max of the window, multiplied by ``scale``."""
+        return {
+            "n": len(self.samples),
+            "mean": self.mean * scale,
+            "p50": self.percentile(50) * scale,
+            "p95": self.percentile(95) * scale,
+            "max": self.max * scale,
+        }
+
+
+class MetricsExporter:
+    """Appends a JSON line of metrics to ``path`` at most every ``interval_s`` seconds."""
+
+    def __init__(self, path: str, interval_s: float = 1.0):
+        self.path = path
+        self.interval_s = interval_s
+        self._next = 0.0
+        self._f = open(path, "a")
+
+    def due(self, now: float) -> bool:
+        return now >= self._next
+
+    def write(self, now: float, metrics: dict):
+        self._next = now + self.interval_s
+        self._f.write(json.dumps({"t": round(now, 3), **metrics}, default=float) + "\n")
+        self._f.flush()
+
+    def close(self):
+        if self._f:
+            self._f.close()
+            self._f = None
@@ -0,0 +1,122 @@
+"""Motion-gated hand tracking: skip inference while the hands hold still.
+
+While a driver holds a steady grip, consecutive frames are nearly identical
+around the hands and a MediaPipe pass returns the same landmarks. Before each
+inference :class:`MotionGate` shrinks the frame by ``downsample`` (area
+average, which also evens out sensor noise), converts it to luma and
+compares it, inside the padded bounding box of every tracked hand, with the
+luma of the last frame that was actually inferred. Comparing against that
+frame, not the previous one, means slow drift still adds up to a re-run. If
+the mean absolute difference in every box stays below ``threshold`` (0-255
+luma levels), the previous ``HandData`` is returned instead.
+
+Inference always runs:
+
+- when no hand is tracked, because there is no region to watch and a hand
+  could enter anywhere;
+- at least every ``1 / min_rate_hz`` seconds, so a wrong result cannot stick;
+- on any frame whose size differs from the reference, since the boxes
+  would not line up. The gate sees full-size frames even in idle mode, which
+  downscales inside inference; idle mode has no tracked hands, so it always
+  infers anyway.
+
+``python -m gesture_racer.bench.motion_gate`` reports the skip ratio and
+what skipping costs in landmark error and key decisions.
+"""
+
+import copy
+import time
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    def __init__(
+        self,
+        threshold: float = 2.0,
+        min_rate_hz: float = 10.0,
+        downsample: int = 8,
+        pad: float = 0.25,
+        clock=time.perf_counter,
+    ):
+        self.threshold = threshold
+        self.min_interval = 1.0 / min_rate_hz if min_rate_hz > 0 else float("inf")
+        self.downsample = max(1, int(downsample))
+        self.pad = pad
+        self.clock = clock
+        self.frames = 0
+        self.inferred = 0
+        self.forced = 0  # inferences caused by min_rate_hz alone
+        self.last_motion = 0.0
+        self._ref = None  # luma of the last inferred frame
+        self._ref_shape = None
+        self._ref_t = 0.0
+        self._hands = []
+
+    def _luma(self, frame) -> np.ndarray:
+        h, w = frame.shape[:2]
+        small = cv2.resize(frame, (max(1, w // self.downsample), max(1, h // self.downsample)), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+
+    def _rois(self, shape):
+        h, w = shape
+        for hand in self._hands:
+            pts = getattr(hand, "points", None)
+            if pts is None:
+                continue
+            x0, y0 = pts[:, 0].min(), pts[:, 1].min()
+            x1, y1 = pts[:, 0].max(), pts[:, 1].max()
+            px, py = (x1 - x0) * self.pad, (y1 - y0) * self.pad
+            c0, c1 = max(0, int((x0 - px) * w)), min(w, int(np.ceil((x1 + px) * w)))
+            r0, r1 = max(0, int((y0 - py) * h)), min(h, int(np.ceil((y1 + py) * h)))
+            if c1 > c0 and r1 > r0:
+                yield slice(r0, r1), slice(c0, c1)
+
+    def motion(self, luma: np.ndarray) -> float:
+        """Largest mean absolute luma change over the tracked hands' boxes."""
+        worst = 0.0
+        for rows, cols in self._rois(luma.shape):
+            diff = cv2.absdiff(luma[rows, cols], self._ref[rows, cols])
+            worst = max(worst, float(diff.mean()))
+        return worst
+
+    def process(self, frame, infer, t: float | None = None) -> list:
+        """``infer(frame) -> hands`` unless the tracked hands have not moved."""
+        t = self.clock() if t is None else t
+        self.frames += 1
+        luma = self._luma(frame)
+        if self._hands and self._ref is not None and frame.shape == self._ref_shape:
+            self.last_motion = self.motion(luma)
+            if self.last_motion < self.threshold:
+                if t - self._ref_t < self.min_interval:
+                    # copies: the pipeline may replace attributes on what it is given
+                    return [copy.copy(h) for h in self._hands]
+                self.forced += 1
+        hands = infer(frame)
+        self.inferred += 1
+        self._hands = [h for h in hands if getattr(h, "points", None) is not None]
+        self._ref, self._ref_shape, self._ref_t = luma, frame.shape, t
+        return hands
+
+    def reset(self):
+        self._ref = None
+        self._hands = []
+
+    def stats(self) -> dict:
+        return {
+            "gate_skip_ratio": 1.0 - self.inferred / self.frames if self.frames else 0.0,
+            "gate_forced": self.forced,
+            "gate_motion": self.last_motion,
+        }
+
+
+def make_gate(cfg) -> MotionGate | None:
+    if not cfg.motion_gate_enabled:
+        return None
+    return MotionGate(
+        threshold=cfg.motion_gate_threshold,
+        min_rate_hz=cfg.motion_gate_min_hz,
+        downsample=cfg.motion_gate_downsample,
+        pad=cfg.motion_gate_pad,
+    )
@@ -0,0 +1,117 @@
+from gesture_racer.dynamic_gestures import DynamicGestureRecognizer
+from gesture_racer.gestures import GestureOutput, decide_actions
+from gesture_racer.input_controller import InputController
+from gesture_racer.landmark_filter import LandmarkFilterBank
+from gesture_racer.poses import PoseDebouncer, make_library
+from gesture_racer.smoothing import make_steering_filter
+from gesture_racer.state_machine import GestureStateMachine
+
+
+def make_controller(cfg, keys=None, backend=None) -> InputController:
+    return InputController(
+        keys or cfg.movement_keys,
+        async_dispatch=cfg.async_input_dispatch,
+        pwm_steering=cfg.pwm_steering,
+        pwm_carrier_hz=cfg.pwm_carrier_hz,
+        pwm_min_pulse_ms=cfg.pwm_min_pulse_ms,
+        pwm_spin_ms=cfg.pwm_spin_ms,
+        turn_deadband_deg=cfg.turn_deadband_deg,
+        max_steering_deg=cfg.max_steering_deg,
+        backend=backend or cfg.input_backend,
+    )
+
+
+class PlayerPipeline:
+    """Everything between one driver's hands and their keys.
+
+    Landmark smoothing -> ``decide_actions`` -> steering filter -> hysteresis
+    -> ``InputController``. Each player owns its own filter state and key map,
+    so several drivers can share one camera.
+    """
+
+    def __init__(self, cfg, keys=None, name: str = "P1", controller: InputController | None = None):
+        self.cfg = cfg
+        self.name = name
+        self.controller = controller or make_controller(cfg, keys)
+        self.angle_filter = make_steering_filter(cfg)
+        self.landmark_bank = None
+        if cfg.landmark_filter_enabled:
+            self.landmark_bank = LandmarkFilterBank(
+                max_tracks=2,
+                min_cutoff=cfg.landmark_min_cutoff,
+                beta=cfg.landmark_beta,
+                d_cutoff=cfg.landmark_d_cutoff,
+            )
+        self.state_machine = None
+        if cfg.hysteresis_enabled:
+            self.state_machine = GestureStateMachine(
+                brake_enter_px=cfg.brake_distance_px,
+                brake_exit_px=cfg.brake_distance_px + cfg.brake_hysteresis_px,
+                move_min_dwell_s=cfg.move_min_dwell_s,
+                turn_min_dwell_s=cfg.turn_min_dwell_s,
+            )
+        self.pose_library = None
+        if cfg.pose_enabled:
+            self.pose_library = make_library(cfg)
+            self.pose_debouncers = {label: PoseDebouncer(cfg.pose_min_frames) for label in ("Left", "Right")}
+        self.motion = None
+        if cfg.motion_enabled:
+            self.motion = DynamicGestureRecognizer(
+                rate_hz=cfg.motion_rate_hz,
+                threshold=cfg.motion_threshold,
+                refractory_s=cfg.motion_refractory_s,
+            )
+        self.hands = []
+        self.actions: GestureOutput | None = None
+
+    def reset_filter(self):
+        self.angle_filter = make_steering_filter(self.cfg)
+
+    def process(self, hands, t: float, frame_width: int, frame_height: int, steering_gain: float, turn_deadband_deg: float) -> GestureOutput:
+        cfg = self.cfg
+        if self.landmark_bank is not None:
+            hands = self.landmark_bank.update(hands, t, frame_width, frame_height)
+        self.hands = hands
+
+        actions = decide_actions(
+            [(h.x, h.y, h.label) for h in hands],
+            brake_distance_px=cfg.brake_distance_px,
+            tilt_threshold=cfg.turn_tilt_threshold,
+            steering_gain=steering_gain,
+            max_steering_deg=cfg.max_steering_deg,
+            turn_deadband_deg=turn_deadband_deg,
+        )
+        # Smooth steering angle for more fluid visualization and PWM output
+        actions.steering_angle = self.angle_filter.update(actions.steering_angle, t=t)
+        if self.state_machine is not None:
+            self.state_machine.set_thresholds(turn_deadband_deg, cfg.turn_hysteresis_deg)
+            actions, _ = self.state_machine.update(actions, t)
+
+        controller = self.controller
+        if self.pose_library is not None:
+            actions.poses = self._update_poses(hands, frame_width / max(1, frame_height))
+            controller.set_extra_keys(self.cfg.pose_keys[p] for p in actions.poses if p in self.cfg.pose_keys)
+        if self.motion is not None:
+            actions.events = self.motion.update(hands, t, frame_width / max(1, frame_height))
+            for event in actions.events:
+                if event in self.cfg.motion_keys:
+                    controller.tap(self.cfg.motion_keys[event], self.cfg.motion_tap_ms / 1000.0)
+        if controller.pwm is not None:
+            controller.pwm.deadband_deg = turn_deadband_deg
+        controller.apply_actions(actions.move, actions.turn, steering_angle=actions.steering_angle)
+        self.actions = actions
+        return actions
+
+    def _update_poses(self, hands, aspect: float) -> list:
+        seen = {}
+        for hand, (pose, _) in zip(hands, self.pose_library.classify_hands(hands, aspect)):
+            if hand.label in self.pose_debouncers:
+                seen[hand.label] = pose
+        poses = (debouncer.update(seen.get(label)) for label, debouncer in self.pose_debouncers.items())
+        return sorted({p for p in poses if p is not None})
+
+    def event_rates(self, now: float) -> dict:
+        return self.state_machine.rates(now) if self.state_machine is not None else {}
+
+    def close(self):
+        self.controller.close()
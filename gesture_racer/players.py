@@ -0,0 +1,77 @@
+"""Splitting the hands seen by one camera between several drivers.
+
+Players stand side by side; player 0 is the leftmost in the (mirrored)
+frame. Two grouping modes are available:
+
+- ``zones``: the frame is cut into N equal vertical strips and each hand
+  belongs to the strip its wrist is in.
+- ``cluster``: hands are sorted by wrist x and split at the N-1 widest
+  gaps, then each cluster is given to the player whose strip contains its
+  centre. This copes with players who drift over a strip boundary.
+
+Either way a player gets at most two hands (the most confident ones).
+"""
+
+
+def _cap(group, limit: int = 2):
+    if len(group) <= limit:
+        return group
+    return sorted(group, key=lambda h: getattr(h, "score", 1.0), reverse=True)[:limit]
+
+
+def group_by_zones(hands, num_players: int, frame_width: int):
+    groups = [[] for _ in range(num_players)]
+    strip = frame_width / num_players
+    for h in hands:
+        idx = min(num_players - 1, max(0, int(h.x / strip)))
+        groups[idx].append(h)
+    return [_cap(g) for g in groups]
+
+
+def group_by_clusters(hands, num_players: int, frame_width: int, min_gap_px: float | None = None):
+    groups = [[] for _ in range(num_players)]
+    if not hands:
+        return groups
+    strip = frame_width / num_players
+    min_gap = strip / 4 if min_gap_px is None else min_gap_px
+
+    ordered = sorted(hands, key=lambda h: h.x)
+    gaps = sorted(
+        ((ordered[i + 1].x - ordered[i].x, i) for i in range(len(ordered) - 1)),
+        reverse=True,
+    )
+    cuts = sorted(i for gap, i in gaps[: num_players - 1] if gap >= min_gap)
+    clusters, start = [], 0
+    for i in cuts:
+        clusters.append(ordered[start:i + 1])
+        start = i + 1
+    clusters.append(ordered[start:])
+
+    # clusters are left-to-right; give each the player of its centre's strip,
+    # pushing right when that player is already taken and there is room
+    taken = set()
+    remaining = len(clusters)
+    for cluster in clusters:
+        centre = sum(h.x for h in cluster) / len(cluster)
+        idx = min(num_players - 1, max(0, int(centre / strip)))
+        while idx in taken and idx < num_players - 1:
+            idx += 1
+        # leave enough players free for the clusters still to the right
+        idx = min(idx, num_players - remaining)
+        while idx in taken:
+            idx += 1
+        taken.add(idx)
+        remaining -= 1
+        groups[idx] = _cap(cluster)
+    return groups
+
+
+def group_hands(hands, num_players: int, frame_width: int, mode: str = "zones"):
+    """Return one list of hands per player."""
+    if num_players <= 1:
+        return [_cap(list(hands))]
+    if mode == "cluster":
+        return group_by_clusters(hands, num_players, frame_width)
+    if mode == "zones":
+        return group_by_zones(hands, num_players, frame_width)
+    raise ValueError(f"Unknown player_grouping '{mode}'. Choose from: zones, cluster")
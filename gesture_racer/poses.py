@@ -0,0 +1,301 @@
+"""Static hand poses (fist, open palm, V-sign, ...) by nearest template.
+
+Each hand's 21 landmarks become a feature vector that does not depend on
+where the hand is, how large it appears or how it is rolled: points are taken
+relative to the wrist, rotated so the wrist -> middle-finger-MCP vector points
+up, and divided by that vector's length (the palm length). Left hands are
+mirrored so one template serves both. A pose is the nearest template in a
+flat NumPy index (one matrix product for all hands of a frame), accepted if it
+lies within ``max_distance`` palm lengths (RMS over the coordinates).
+
+Record new templates from the camera and save them to a library file:
+
+    python -m gesture_racer.poses record thumbs_up --library poses.json
+    python -m gesture_racer.poses list --library poses.json
+"""
+
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+WRIST = 0
+MIDDLE_MCP = 9
+NUM_POINTS = 21
+
+# Built-in templates (procedural; record your own for better accuracy)
+DEFAULT_POSES = ("fist", "open_palm", "v_sign")
+
+
+def pose_features(points, label: str = "Right", aspect: float = 1.0) -> np.ndarray:
+    """(21, 3) normalized landmarks -> (60,) invariant features (wrist dropped).
+
+    ``aspect`` is frame width / height, so x and y are in the same units.
+    """
+    return batch_features(np.asarray(points, dtype=np.float32)[None], [label], aspect)[0]
+
+
+def batch_features(points: np.ndarray, labels, aspect: float = 1.0) -> np.ndarray:
+    """(N, 21, 3) landmarks -> (N, 60) features, vectorized over hands."""
+    p = np.array(points, dtype=np.float32, copy=True)
+    p[:, :, 0] *= aspect
+    p -= p[:, WRIST:WRIST + 1]
+    mirror = np.array([label == "Left" for label in labels])
+    p[mirror, :, 0] *= -1.0
+    v = p[:, MIDDLE_MCP, :2]
+    scale = np.maximum(np.hypot(v[:, 0], v[:, 1]), 1e-6)
+    # rotate so v maps to (0, -1): image "up"
+    c, s = -v[:, 1] / scale, -v[:, 0] / scale
+    x, y = p[:, :, 0], p[:, :, 1]
+    out = np.empty_like(p)
+    out[:, :, 0] = c[:, None] * x - s[:, None] * y
+    out[:, :, 1] = s[:, None] * x + c[:, None] * y
+    out[:, :, 2] = p[:, :, 2]
+    out /= scale[:, None, None]
+    return out[:, 1:].reshape(len(p), -1)
+
+
+class PoseLibrary:
+    """Flat nearest-neighbour index over labelled pose templates."""
+
+    def __init__(self, max_distance: float = 0.25):
+        self.max_distance = max_distance
+        self.names: list[str] = []
+        self._raw: list[tuple[np.ndarray, str]] = []  # kept so the file stays re-normalizable
+        self._features = np.empty((0, (NUM_POINTS - 1) * 3), dtype=np.float32)
+        self._sq_norms = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def poses(self) -> list[str]:
+        return sorted(set(self.names))
+
+    def add(self, name: str, points, label: str = "Right", aspect: float = 1.0):
+        """Add one template from a hand's (21, 3) landmarks."""
+        points = np.asarray(points, dtype=np.float32).copy()
+        points[:, 0] *= aspect  # stored in square units
+        feature = pose_features(points, label)
+        self.names.append(name)
+        self._raw.append((points, label))
+        self._features = np.vstack([self._features, feature[None]])
+        self._sq_norms = np.einsum("ij,ij->i", self._features, self._features)
+
+    def record(self, name: str, hands, aspect: float = 1.0) -> int:
+        """Add templates from tracked hands (objects with ``points`` and ``label``)."""
+        n = 0
+        for hand in hands:
+            if getattr(hand, "points", None) is not None:
+                self.add(name, hand.points, hand.label, aspect)
+                n += 1
+        return n
+
+    def remove(self, name: str) -> int:
+        keep = [i for i, n in enumerate(self.names) if n != name]
+        removed = len(self.names) - len(keep)
+        self.names = [self.names[i] for i in keep]
+        self._raw = [self._raw[i] for i in keep]
+        self._features = self._features[keep]
+        self._sq_norms = self._sq_norms[keep]
+        return removed
+
+    def classify_features(self, features: np.ndarray) -> list[tuple[str | None, float]]:
+        """(N, 60) features -> [(pose or None, rms distance)] per row."""
+        if not len(self.names) or not len(features):
+            return [(None, math.inf)] * len(features)
+        # |a - b|^2 = |a|^2 - 2ab + |b|^2, one GEMM for every hand x template
+        sq = np.einsum("ij,ij->i", features, features)[:, None] - 2.0 * features @ self._features.T + self._sq_norms
+        best = np.argmin(sq, axis=1)
+        dims = features.shape[1]
+        out = []
+        for row, j in enumerate(best):
+            dist = math.sqrt(max(float(sq[row, j]), 0.0) / dims)
+            out.append((self.names[j] if dist <= self.max_distance else None, dist))
+        return out
+
+    def classify(self, points, label: str = "Right", aspect: float = 1.0) -> tuple[str | None, float]:
+        return self.classify_features(pose_features(points, label, aspect)[None])[0]
+
+    def classify_hands(self, hands, aspect: float = 1.0) -> list[tuple[str | None, float]]:
+        """One result per hand; hands without landmarks get (None, inf)."""
+        with_points = [h for h in hands if getattr(h, "points", None) is not None]
+        results = iter(self.classify_features(
+            batch_features(np.stack([h.points for h in with_points]), [h.label for h in with_points], aspect)
+        ) if with_points else [])
+        return [next(results) if getattr(h, "points", None) is not None else (None, math.inf) for h in hands]
+
+    # --- persistence -----------------------------------------------------
+    def save(self, path: str):
+        data = {
+            "max_distance": self.max_distance,
+            "templates": [
+                {"name": n, "label": label, "points": np.round(points, 5).tolist()}
+                for n, (points, label) in zip(self.names, self._raw)
+            ],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str, max_distance: float | None = None) -> "PoseLibrary":
+        with open(path) as f:
+            data = json.load(f)
+        library = cls(max_distance if max_distance is not None else data.get("max_distance", 0.25))
+        for t in data["templates"]:
+            library.add(t["name"], t["points"], t.get("label", "Right"))
+        return library
+
+
+class PoseDebouncer:
+    """Report a pose only after it was seen ``min_frames`` frames in a row."""
+
+    def __init__(self, min_frames: int = 3):
+        self.min_frames = min_frames
+        self._candidate = None
+        self._count = 0
+        self.stable: str | None = None
+
+    def update(self, pose: str | None) -> str | None:
+        if pose == self._candidate:
+            self._count += 1
+        else:
+            self._candidate, self._count = pose, 1
+        if self._count >= self.min_frames:
+            self.stable = pose
+        return self.stable
+
+
+# --- procedural templates ----------------------------------------------------
+# Right hand, palm towards the camera, fingers up; palm length (wrist -> middle MCP) = 1.
+_FINGERS = {  # name: (MCP x, MCP y, segment lengths)
+    "index": (-0.30, -0.95, (0.45, 0.28, 0.22)),
+    "middle": (0.0, -1.0, (0.50, 0.30, 0.24)),
+    "ring": (0.25, -0.92, (0.46, 0.28, 0.22)),
+    "pinky": (0.45, -0.80, (0.36, 0.22, 0.20)),
+}
+_CURL = (70.0, 100.0, 60.0)  # degrees per joint for a folded finger
+_POSE_SHAPES = {  # extended fingers and thumb state
+    "fist": ((), False),
+    "open_palm": (("index", "middle", "ring", "pinky"), True),
+    "v_sign": (("index", "middle"), False),
+}
+
+
+def _finger(base, lengths, fan_deg: float, curls) -> list:
+    pts = []
+    x, y, z = base
+    phi = 0.0
+    fan = math.radians(fan_deg)
+    for length, curl in zip(lengths, curls):
+        phi += math.radians(curl)
+        x += length * math.sin(fan) * math.cos(phi)
+        y -= length * math.cos(fan) * math.cos(phi)
+        z -= length * math.sin(phi)
+        pts.append((x, y, z))
+    return pts
+
+
+def synthetic_hand(pose: str, rng: np.random.Generator | None = None, noise: float = 0.0) -> np.ndarray:
+    """(21, 3) right-hand landmarks for a built-in pose in palm units, wrist at the origin."""
+    extended, thumb_out = _POSE_SHAPES[pose]
+    pts = [(0.0, 0.0, 0.0)]
+    if thumb_out:
+        thumb = [(-0.25, -0.25, 0.0), (-0.45, -0.45, 0.0), (-0.62, -0.62, 0.0), (-0.78, -0.78, 0.0)]
+    else:  # folded across the palm
+        thumb = [(-0.25, -0.25, 0.0), (-0.35, -0.50, -0.15), (-0.20, -0.65, -0.25), (-0.02, -0.70, -0.30)]
+    pts += thumb
+    for name, (bx, by, lengths) in _FINGERS.items():
+        spread = 12.0 if pose == "v_sign" and name in extended else 4.0
+        fan = spread * (-1 if bx < 0 else 1 if bx > 0 else 0) if name != "middle" else (spread if pose == "v_sign" else 0.0)
+        curls = (0.0, 0.0, 0.0) if name in extended else _CURL
+        pts.append((bx, by, 0.0))
+        pts += _finger((bx, by, 0.0), lengths, fan, curls)
+    out = np.array(pts, dtype=np.float32)
+    if rng is not None and noise:
+        out += rng.normal(0.0, noise, out.shape).astype(np.float32)
+    return out
+
+
+def place_hand(palm_points: np.ndarray, cx: float, cy: float, size: float, roll_deg: float = 0.0, label: str = "Right") -> np.ndarray:
+    """Palm-unit landmarks -> normalized image landmarks (square frame) at (cx, cy)."""
+    a = math.radians(roll_deg)
+    c, s = math.cos(a), math.sin(a)
+    p = palm_points.astype(np.float32).copy()
+    x, y = p[:, 0].copy(), p[:, 1].copy()
+    p[:, 0] = (c * x - s * y) * size
+    p[:, 1] = (s * x + c * y) * size
+    p[:, 2] *= size
+    if label == "Left":
+        p[:, 0] *= -1.0
+    p[:, 0] += cx
+    p[:, 1] += cy
+    return p
+
+
+def default_library(max_distance: float = 0.25) -> PoseLibrary:
+    """Built-in fist / open palm / V-sign templates."""
+    library = PoseLibrary(max_distance)
+    for pose in DEFAULT_POSES:
+        library.add(pose, synthetic_hand(pose))
+    return library
+
+
+def make_library(cfg) -> PoseLibrary:
+    if cfg.pose_library_path:
+        return PoseLibrary.load(cfg.pose_library_path, cfg.pose_max_distance)
+    return default_library(cfg.pose_max_distance)
+
+
+# --- recording CLI ------------------------------------------------------------
+def _record(args):
+    import cv2
+
+    from gesture_racer.config import DEFAULT_CONFIG
+    from gesture_racer.sources import TrackedCamera
+
+    try:
+        library = PoseLibrary.load(args.library)
+    except FileNotFoundError:
+        library = PoseLibrary()
+    print(f"Hold '{args.name}' in front of the camera; recording starts in {args.delay:.0f}s...")
+    added = 0
+    with TrackedCamera(DEFAULT_CONFIG) as source:
+        start = time.perf_counter()
+        while added < args.samples:
+            frame, _, hands = source.read()
+            h, w = frame.shape[:2]
+            if time.perf_counter() - start >= args.delay and hands:
+                added += library.record(args.name, hands[:1], aspect=w / h)
+            cv2.putText(frame, f"{args.name}: {added}/{args.samples}", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+            cv2.imshow("Record pose", frame)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
+    cv2.destroyAllWindows()
+    library.save(args.library)
+    print(f"Added {added} '{args.name}' templates to {args.library} ({len(library)} total)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="add templates for a pose from the camera")
+    rec.add_argument("name")
+    rec.add_argument("--library", default="poses.json")
+    rec.add_argument("--samples", type=int, default=30)
+    rec.add_argument("--delay", type=float, default=3.0, help="seconds to get into position")
+    ls = sub.add_parser("list", help="show the poses in a library")
+    ls.add_argument("--library", default="poses.json")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        _record(args)
+    else:
+        library = PoseLibrary.load(args.library)
+        for name in library.poses():
+            print(f"{name:<16} {library.names.count(name)} templates")
+
+
+if __name__ == "__main__":
+    main()
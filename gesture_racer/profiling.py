@@ -0,0 +1,155 @@
+"""Low-overhead sampling profiler for the live loop.
+
+A helper thread snapshots the main thread's stack (``sys._current_frames``)
+every ``interval_s`` while profiling is active. The loop only tags which
+stage it is in (``mark("overlay")``: one attribute store), so nothing is
+instrumented and the cost when idle is nil. Samples taken inside
+``Overlay.draw`` are split by the helper method it was in
+(``overlay._hex_grid``, ``overlay._blur``...); work done inline in ``draw``
+itself (the bars, particles and trails) stays plain ``overlay``.
+
+The report written at the end lists, per stage, the share of samples,
+estimated ms per frame and the top functions by self and cumulative samples.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+# (file name, function) whose callee names the sub-stage
+SPLIT_FRAMES = {("overlay.py", "draw"): "overlay"}
+
+
+def _func_key(code) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}({code.co_name})"
+
+
+class SamplingProfiler:
+    def __init__(self, interval_s: float = 0.001, top: int = 12):
+        self.interval_s = interval_s
+        self.top = top
+        self.stage = "other"
+        self.active = False
+        self.frames_left = 0
+        self.frames = 0
+        self.summary = ""  # one line for the HUD, set when a run finishes
+        self.last_path: str | None = None
+        self._path = None
+        self._thread = None
+        self._target_id = None
+        self._stop = threading.Event()
+        self._reset()
+
+    def _reset(self):
+        self.samples = 0
+        self.stage_samples: Counter = Counter()
+        self.self_samples: dict[str, Counter] = defaultdict(Counter)
+        self.cum_samples: dict[str, Counter] = defaultdict(Counter)
+        self._t0 = 0.0
+        self.elapsed = 0.0
+
+    # --- loop side -----------------------------------------------------
+    def mark(self, stage: str):
+        self.stage = stage
+
+    def start(self, frames: int, path: str | None = None):
+        """Profile the calling thread for the next ``frames`` calls to ``frame_done``."""
+        if self.active:
+            return
+        self._reset()
+        self.frames_left = frames
+        self.frames = 0
+        self._path = path or time.strftime("profile-%Y%m%d-%H%M%S.txt")
+        self._target_id = threading.get_ident()
+        self._stop.clear()
+        self.active = True
+        self._t0 = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def frame_done(self) -> bool:
+        """Count a frame; returns True when this frame finished a run (report written)."""
+        if not self.active:
+            return False
+        self.frames += 1
+        self.frames_left -= 1
+        if self.frames_left > 0:
+            return False
+        self.stop()
+        return True
+
+    def stop(self):
+        if not self.active:
+            return
+        self.active = False
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self._t0
+        self.summary = self.summary_line()
+        self.last_path = self._path
+        with open(self._path, "w") as f:
+            f.write(self.report())
+
+    # --- sampler thread ------------------------------------------------
+    def _run(self):
+        target = self._target_id
+        interval = self.interval_s
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                continue
+            self._sample(frame, self.stage)
+
+    def _sample(self, frame, stage: str):
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        stack.reverse()  # outermost first
+        for i, code in enumerate(stack[:-1]):
+            prefix = SPLIT_FRAMES.get((os.path.basename(code.co_filename), code.co_name))
+            if prefix is not None:
+                stage = f"{prefix}.{stack[i + 1].co_name}"
+                break
+        self.samples += 1
+        self.stage_samples[stage] += 1
+        self.self_samples[stage][_func_key(stack[-1])] += 1
+        cum = self.cum_samples[stage]
+        for key in {_func_key(code) for code in stack}:
+            cum[key] += 1
+
+    # --- results -------------------------------------------------------
+    def _ms_per_frame(self, samples: int) -> float:
+        if not self.samples or not self.frames:
+            return 0.0
+        return samples / self.samples * self.elapsed * 1000.0 / self.frames
+
+    def summary_line(self, n: int = 3) -> str:
+        if not self.samples:
+            return "Profile: no samples"
+        parts = [
+            f"{stage} {count * 100.0 / self.samples:.0f}%"
+            for stage, count in self.stage_samples.most_common(n)
+        ]
+        return "Profile: " + " | ".join(parts)
+
+    def report(self) -> str:
+        lines = [
+            f"Gesture Racer profile: {self.frames} frames, {self.samples} samples "
+            f"every {self.interval_s * 1000:.1f} ms over {self.elapsed:.2f} s",
+            "",
+            f"{'stage':<28}{'samples':>9}{'share':>8}{'ms/frame':>10}",
+        ]
+        for stage, count in self.stage_samples.most_common():
+            lines.append(
+                f"{stage:<28}{count:>9}{count * 100.0 / self.samples:>7.1f}%{self._ms_per_frame(count):>10.2f}"
+            )
+        for stage, count in self.stage_samples.most_common():
+            lines += ["", f"== {stage} ({count} samples)", f"{'self':>7}{'cum':>7}  function"]
+            cum = self.cum_samples[stage]
+            selfs = self.self_samples[stage]
+            for key, n in selfs.most_common(self.top):
+                lines.append(f"{n:>7}{cum[key]:>7}  {key}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,166 @@
+"""Binary wire format for the gesture server (``gesture_racer.server``).
+
+One datagram per player per frame, little-endian:
+
+    header  28 bytes  magic "GR", version, player, seq (u32, counted per
+                      player), timestamp (f64, sender's perf_counter at
+                      capture), move, turn, hand count, flags,
+                      steering_angle (f32), hand_distance (f32)
+    hand   262 bytes  label, flags, wrist x/y (i16 px), score (f32),
+                      21 x 3 landmark points (f32, normalized)
+
+At most ``MAX_HANDS`` hands are sent, so a packet (1076 bytes max) always
+fits in one datagram. Clients subscribe by sending ``SUBSCRIBE`` to the
+server and repeat it every second or so; ``UNSUBSCRIBE`` leaves.
+
+Addresses are ``udp://host:port`` or ``unix:///path/to/socket`` (datagram
+sockets; Unix sockets are not available on Windows).
+"""
+
+import socket
+import struct
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from gesture_racer.gestures import GestureOutput
+
+MAGIC = b"GR"
+VERSION = 1
+MAX_HANDS = 4
+NUM_POINTS = 21
+
+SUBSCRIBE = b"GRSUB"
+UNSUBSCRIBE = b"GRBYE"
+
+HEADER = struct.Struct("<2sBBIdBBBBff")
+HAND = struct.Struct("<BBhhf")
+POINTS_SIZE = NUM_POINTS * 3 * 4
+HAND_SIZE = HAND.size + POINTS_SIZE
+MAX_PACKET_SIZE = HEADER.size + MAX_HANDS * HAND_SIZE
+
+MOVES = ("stop", "forward", "reverse", "brake")
+TURNS = ("straight", "left", "right")
+LABELS = ("Unknown", "Left", "Right")
+
+_MOVE_CODES = {name: i for i, name in enumerate(MOVES)}
+_TURN_CODES = {name: i for i, name in enumerate(TURNS)}
+_LABEL_CODES = {name: i for i, name in enumerate(LABELS)}
+
+FLAG_HAND_DISTANCE = 0x01  # header: hand_distance is valid
+FLAG_POINTS = 0x01         # hand: points are valid (else zeros)
+
+_NO_POINTS = bytes(POINTS_SIZE)
+
+DEFAULT_ADDRESS = "udp://127.0.0.1:50555"
+
+
+def parse_address(address: str):
+    """``(socket family, socket address)`` for a ``udp://`` or ``unix://`` address."""
+    if address.startswith("unix://"):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("unix:// addresses are not supported on this platform")
+        return socket.AF_UNIX, address[len("unix://"):]
+    if address.startswith("udp://"):
+        host, _, port = address[len("udp://"):].rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Bad address '{address}', expected udp://host:port")
+        return socket.AF_INET, (host, int(port))
+    raise ValueError(f"Bad address '{address}', expected udp://host:port or unix:///path")
+
+
+@dataclass
+class PacketHand:
+    label: str
+    x: int
+    y: int
+    score: float
+    points: np.ndarray | None = None  # (21, 3) float32
+
+
+@dataclass
+class GesturePacket:
+    seq: int
+    timestamp: float
+    player: int
+    move: str
+    turn: str
+    steering_angle: float
+    hand_distance: float | None = None
+    hands: list[PacketHand] = field(default_factory=list)
+
+    @property
+    def output(self) -> GestureOutput:
+        return GestureOutput(
+            move=self.move,
+            turn=self.turn,
+            steering_angle=self.steering_angle,
+            debug="",
+            hand_distance=self.hand_distance,
+            timestamp=self.timestamp,
+        )
+
+
+def _clamp_i16(v) -> int:
+    return max(-32768, min(32767, int(v)))
+
+
+def encode(seq: int, timestamp: float, output: GestureOutput, hands=(), player: int = 0) -> bytes:
+    hands = list(hands)[:MAX_HANDS]
+    flags = FLAG_HAND_DISTANCE if output.hand_distance is not None else 0
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            VERSION,
+            player,
+            seq & 0xFFFFFFFF,
+            timestamp,
+            _MOVE_CODES.get(output.move, 0),
+            _TURN_CODES.get(output.turn, 0),
+            len(hands),
+            flags,
+            output.steering_angle,
+            output.hand_distance or 0.0,
+        )
+    ]
+    for h in hands:
+        points = getattr(h, "points", None)
+        parts.append(HAND.pack(
+            _LABEL_CODES.get(h.label, 0),
+            FLAG_POINTS if points is not None else 0,
+            _clamp_i16(h.x),
+            _clamp_i16(h.y),
+            getattr(h, "score", 1.0),
+        ))
+        parts.append(_NO_POINTS if points is None else np.ascontiguousarray(points, dtype="<f4").tobytes())
+    return b"".join(parts)
+
+
+def decode(data: bytes) -> GesturePacket:
+    if len(data) < HEADER.size:
+        raise ValueError(f"packet too short ({len(data)} bytes)")
+    magic, version, player, seq, ts, move, turn, n_hands, flags, steer, dist = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a gesture packet (magic {magic!r}, version {version})")
+    if len(data) < HEADER.size + n_hands * HAND_SIZE:
+        raise ValueError(f"truncated packet ({len(data)} bytes for {n_hands} hands)")
+    hands = []
+    offset = HEADER.size
+    for _ in range(n_hands):
+        label, hflags, x, y, score = HAND.unpack_from(data, offset)
+        offset += HAND.size
+        points = None
+        if hflags & FLAG_POINTS:
+            points = np.frombuffer(data, dtype="<f4", count=NUM_POINTS * 3, offset=offset).reshape(NUM_POINTS, 3)
+        offset += POINTS_SIZE
+        hands.append(PacketHand(LABELS[label] if label < len(LABELS) else "Unknown", x, y, score, points))
+    return GesturePacket(
+        seq=seq,
+        timestamp=ts,
+        player=player,
+        move=MOVES[move] if move < len(MOVES) else "stop",
+        turn=TURNS[turn] if turn < len(TURNS) else "straight",
+        steering_angle=steer,
+        hand_distance=dist if flags & FLAG_HAND_DISTANCE else None,
+        hands=hands,
+    )
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Callable
+
+from gesture_racer.metrics import RollingStats
+from gesture_racer.threads import pin_current_thread
+from gesture_racer.timing import sleep_until
+
+
+class SteeringPWM:
+    """Pulse-width-modulated steering keys driven by a continuous angle.
+
+    A scheduler thread runs at ``carrier_hz`` independently of the camera frame
+    rate. Each period it holds the left or right key for a fraction of the
+    period proportional to how far the angle is past the deadband, giving
+    digital-input games an analog-feeling steering response.
+
+    ``set_turn`` is called with ``"left"``, ``"right"`` or ``None`` on every
+    edge. Edge timing error against the ideal schedule is kept in ``jitter``.
+    """
+
+    def __init__(
+        self,
+        set_turn: Callable[[str | None], None],
+        carrier_hz: float = 100.0,
+        deadband_deg: float = 12.0,
+        max_steering_deg: float = 60.0,
+        min_pulse_ms: float = 0.0,
+        spin_s: float = 0.0015,
+    ):
+        self.set_turn = set_turn
+        self.carrier_hz = max(1.0, carrier_hz)
+        self.deadband_deg = deadband_deg
+        self.max_steering_deg = max_steering_deg
+        self.min_pulse_s = max(0.0, min_pulse_ms) / 1000.0
+        self.spin_s = spin_s
+
+        self.angle = 0.0  # written by the frame loop, read by the scheduler
+        self.duty = 0.0
+        self.jitter = RollingStats(1024)  # |actual - scheduled| per edge, seconds
+        self.overruns = 0
+        self._running = False
+        self._thread = None
+
+    def duty_for(self, angle_deg: float) -> float:
+        span = max(1e-6, self.max_steering_deg - self.deadband_deg)
+        return max(0.0, min(1.0, (abs(angle_deg) - self.deadband_deg) / span))
+
+    def set_angle(self, angle_deg: float):
+        self.angle = float(angle_deg or 0.0)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="steering-pwm", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 0.5):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.set_turn(None)
+
+    def _edge(self, scheduled: float, turn: str | None):
+        actual = sleep_until(scheduled, self.spin_s)
+        self.jitter.add(actual - scheduled)
+        self.set_turn(turn)
+
+    def _run(self):
+        pin_current_thread("input")
+        period = 1.0 / self.carrier_hz
+        start = time.perf_counter()
+        current = None
+        while self._running:
+            angle = self.angle
+            duty = self.duty_for(angle)
+            self.duty = duty
+            turn = "right" if angle > 0 else "left"
+            on_s = duty * period
+            if 0.0 < on_s < self.min_pulse_s:
+                on_s = min(period, self.min_pulse_s)
+
+            if on_s >= period:
+                # fully on: hold the key through the whole period, no release edge
+                if current != turn:
+                    self._edge(start, turn)
+                    current = turn
+            elif on_s <= 0.0:
+                if current is not None:
+                    self._edge(start, None)
+                    current = None
+            else:
+                self._edge(start, turn)
+                self._edge(start + on_s, None)
+                current = None
+
+            start += period
+            now = time.perf_counter()
+            if now > start:
+                # missed a whole period (e.g. descheduled); resync instead of bursting
+                self.overruns += 1
+                start = now
+            else:
+                sleep_until(start, self.spin_s)
+
+    def stats(self) -> dict:
+        j = self.jitter.summary(scale=1000.0)
+        return {
+            "carrier_hz": self.carrier_hz,
+            "duty": self.duty,
+            "jitter_ms_p50": j["p50"],
+            "jitter_ms_p95": j["p95"],
+            "jitter_ms_max": j["max"],
+            "overruns": self.overruns,
+        }
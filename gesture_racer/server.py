@@ -0,0 +1,164 @@
+"""Headless gesture daemon: keeps the tracker loaded and streams every frame.
+
+    python -m gesture_racer.server                      # udp://127.0.0.1:50555
+    python -m gesture_racer.server --address unix:///tmp/gesture-racer.sock
+    python -m gesture_racer.server --apply-input        # also press keys locally
+
+Each frame is encoded once (``protocol.encode``) and sent with one
+``sendto`` per subscriber, so extra clients cost a syscall each and nothing
+else. Subscribers that stop renewing are dropped after
+``subscriber_timeout_s``. Read the stream with ``gesture_racer.client``.
+"""
+
+import argparse
+import os
+import socket
+import time
+from dataclasses import replace
+
+from gesture_racer import protocol
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.gestures import GestureOutput
+from gesture_racer.metrics import RollingStats
+
+
+class GestureServer:
+    def __init__(self, address: str = protocol.DEFAULT_ADDRESS, subscriber_timeout_s: float = 5.0):
+        self.address = address
+        self.family, self.sockaddr = protocol.parse_address(address)
+        self.subscriber_timeout_s = subscriber_timeout_s
+        self.sock = socket.socket(self.family, socket.SOCK_DGRAM)
+        if self.family == socket.AF_UNIX and os.path.exists(self.sockaddr):
+            os.unlink(self.sockaddr)  # stale socket from a previous run
+        self.sock.bind(self.sockaddr)
+        self.sock.setblocking(False)
+        self.subscribers: dict = {}  # address -> last time it (re)subscribed
+        self.seqs: dict[int, int] = {}  # player -> last sequence number; clients count gaps per player
+        self.packets = 0
+        self.bytes_sent = 0
+        self.send_errors = 0
+        self.publish_time = RollingStats(240)
+
+    def poll_subscriptions(self, now: float | None = None):
+        now = time.monotonic() if now is None else now
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(64)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # Windows reports an earlier ICMP port-unreachable here; ignore it
+                continue
+            if not addr:
+                continue  # unbound unix client, nowhere to send
+            if data == protocol.SUBSCRIBE:
+                self.subscribers[addr] = now
+            elif data == protocol.UNSUBSCRIBE:
+                self.subscribers.pop(addr, None)
+        expired = [a for a, seen in self.subscribers.items() if now - seen > self.subscriber_timeout_s]
+        for a in expired:
+            del self.subscribers[a]
+
+    def publish(self, output: GestureOutput, hands=(), timestamp: float | None = None, player: int = 0) -> int:
+        """Send one packet to every subscriber; returns how many got it."""
+        t0 = time.perf_counter()
+        self.poll_subscriptions()
+        seq = self.seqs[player] = self.seqs.get(player, 0) + 1
+        if timestamp is None:
+            timestamp = output.timestamp if output.timestamp is not None else t0
+        data = protocol.encode(seq, timestamp, output, hands, player)
+        sent = 0
+        for addr in list(self.subscribers):
+            try:
+                self.sock.sendto(data, addr)
+                sent += 1
+            except (BlockingIOError, InterruptedError):
+                self.send_errors += 1  # client's buffer is full; it misses this frame
+            except OSError:
+                self.send_errors += 1
+                self.subscribers.pop(addr, None)  # gone (closed unix socket, unreachable)
+        self.packets += sent
+        self.bytes_sent += sent * len(data)
+        self.publish_time.add(time.perf_counter() - t0)
+        return sent
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self.subscribers),
+            "packets": self.packets,
+            "bytes_sent": self.bytes_sent,
+            "send_errors": self.send_errors,
+            "publish_us_p95": self.publish_time.percentile(95) * 1e6,
+        }
+
+    def close(self):
+        self.sock.close()
+        if self.family == socket.AF_UNIX and os.path.exists(self.sockaddr):
+            os.unlink(self.sockaddr)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def serve(cfg=None, address: str | None = None, apply_input: bool = False, status_every_s: float = 10.0):
+    from gesture_racer.pipeline import PlayerPipeline
+    from gesture_racer.players import group_hands
+    from gesture_racer.sources import open_tracking
+
+    cfg = cfg or DEFAULT_CONFIG
+    if not apply_input:
+        cfg = replace(cfg, input_backend="null", async_input_dispatch=False, pwm_steering=False)
+    num_players = max(1, cfg.num_players)
+    if num_players == 1:
+        players = [PlayerPipeline(cfg, cfg.movement_keys, name="P1")]
+    else:
+        players = [
+            PlayerPipeline(cfg, cfg.player_key_maps[i % len(cfg.player_key_maps)], name=f"P{i + 1}")
+            for i in range(num_players)
+        ]
+    max_num_hands = max(cfg.max_num_hands, 2 * num_players) if num_players > 1 else cfg.max_num_hands
+
+    server = GestureServer(address or cfg.server_address)
+    print(f"Serving gestures on {server.address}")
+    next_status = time.monotonic() + status_every_s
+    try:
+        with open_tracking(cfg, max_num_hands) as source:
+            while True:
+                frame, t, hands = source.read()
+                w, h = frame.shape[1], frame.shape[0]
+                groups = group_hands(hands, num_players, w, cfg.player_grouping)
+                for i, (player, player_hands) in enumerate(zip(players, groups)):
+                    out = player.process(player_hands, t, w, h, cfg.steering_gain, cfg.turn_deadband_deg)
+                    server.publish(out, player.hands, timestamp=t, player=i)
+                if time.monotonic() >= next_status:
+                    next_status += status_every_s
+                    print(" | ".join(f"{k}: {v:.0f}" for k, v in server.stats().items()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for player in players:
+            player.close()
+        server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--address", help=f"udp://host:port or unix:///path (default {DEFAULT_CONFIG.server_address})")
+    parser.add_argument("--apply-input", action="store_true", help="also send key events on this machine")
+    parser.add_argument("--sources", help="comma-separated camera indices or video paths")
+    parser.add_argument("--players", type=int, help="number of drivers sharing the camera")
+    args = parser.parse_args(argv)
+
+    cfg = DEFAULT_CONFIG
+    if args.players:
+        cfg = replace(cfg, num_players=args.players)
+    if args.sources:
+        cfg = replace(cfg, camera_sources=[s.strip() for s in args.sources.split(",") if s.strip()])
+    serve(cfg, args.address, apply_input=args.apply_input)
+
+
+if __name__ == "__main__":
+    main()
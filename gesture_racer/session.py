@@ -0,0 +1,60 @@
+"""Recorded sessions: per-frame hand detections as JSON lines.
+
+Each line is ``{"t": seconds, "w": width, "h": height, "hands": [...]}`` where
+every hand is ``{"x", "y", "label", "score", "points"}`` (``points`` is the
+21x3 normalized landmark list, or null). Sessions are recorded from the live
+loop with ``--record-session`` and replayed by the benchmarks to measure
+chatter, latency and filter behaviour without a camera.
+"""
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class SessionRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "w")
+        self.frames = 0
+
+    def write(self, t: float, frame_width: int, frame_height: int, hands):
+        rows = []
+        for h in hands:
+            pts = getattr(h, "points", None)
+            rows.append({
+                "x": int(h.x),
+                "y": int(h.y),
+                "label": h.label,
+                "score": round(float(getattr(h, "score", 1.0)), 4),
+                "points": np.round(pts, 5).tolist() if pts is not None else None,
+            })
+        self._f.write(json.dumps({"t": round(t, 6), "w": frame_width, "h": frame_height, "hands": rows}) + "\n")
+        self.frames += 1
+
+    def close(self):
+        if self._f:
+            self._f.close()
+            self._f = None
+
+
+def read_session(path: str):
+    """Yield ``(t, width, height, hands)``; hands are HandData-like namespaces."""
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            hands = []
+            for h in row["hands"]:
+                pts = h.get("points")
+                hands.append(SimpleNamespace(
+                    x=h["x"],
+                    y=h["y"],
+                    label=h["label"],
+                    score=h.get("score", 1.0),
+                    landmarks=None,
+                    points=np.array(pts, dtype=np.float32) if pts is not None else None,
+                ))
+            yield row["t"], row["w"], row["h"], hands
@@ -1,13 +1,149 @@
+import math
+
+
 class LowPassFilter:
     """Simple exponential smoothing filter for scalar values."""
 
     def __init__(self, alpha: float = 0.2, initial=None):
         self.alpha = max(0.0, min(1.0, alpha))
+        self.initial = initial
         self.value = initial
 
-    def update(self, x):
+    def update(self, x, t: float | None = None):
+        # `t` is accepted for interface compatibility; the EMA is per-sample.
         if self.value is None:
             self.value = x
         else:
             self.value = self.alpha * x + (1.0 - self.alpha) * self.value
-        return self.value
\ No newline at end of file
+        return self.value
+
+    def reset(self):
+        self.value = self.initial
+
+
+def _smoothing_factor(dt: float, cutoff):
+    # exact EMA coefficient of a first-order low-pass with the given cutoff (Hz)
+    r = 2.0 * math.pi * cutoff * dt
+    return r / (r + 1.0)
+
+
+class OneEuroFilter:
+    """Speed-adaptive low-pass filter (Casiez et al., "1€ filter", CHI 2012).
+
+    Cutoff rises with the signal's speed: slow motion is smoothed hard
+    (low jitter), fast motion passes through (low lag). Uses real timestamps,
+    so behaviour does not change when the frame rate drops. Works on floats
+    and, elementwise, on NumPy arrays.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.02, d_cutoff: float = 1.0, initial=None):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.initial = initial
+        self.reset()
+
+    def reset(self):
+        self.value = self.initial
+        self.dx = 0.0
+        self.t = None
+
+    def update(self, x, t: float | None = None):
+        if self.value is None or self.t is None or t is None:
+            self.value = x
+            self.dx = 0.0 * x
+            self.t = t
+            return self.value
+        dt = t - self.t
+        if dt <= 0:
+            return self.value
+        self.t = t
+        a_d = _smoothing_factor(dt, self.d_cutoff)
+        self.dx = a_d * ((x - self.value) / dt) + (1.0 - a_d) * self.dx
+        cutoff = self.min_cutoff + self.beta * abs(self.dx)
+        a = _smoothing_factor(dt, cutoff)
+        self.value = a * x + (1.0 - a) * self.value
+        return self.value
+
+
+class KalmanFilter:
+    """Constant-velocity Kalman filter for a scalar, with optional look-ahead.
+
+    State is (position, velocity). ``process_noise`` is the white-acceleration
+    spectral density (units^2/s^3), ``measurement_noise`` the variance of one
+    sample. ``predict_s`` extrapolates the output by that many seconds along
+    the estimated velocity to compensate for pipeline latency.
+    """
+
+    def __init__(
+        self,
+        process_noise: float = 400.0,
+        measurement_noise: float = 9.0,
+        predict_s: float = 0.0,
+        initial=None,
+    ):
+        self.q = process_noise
+        self.r = measurement_noise
+        self.predict_s = predict_s
+        self.initial = initial
+        self.reset()
+
+    def reset(self):
+        self.x = self.initial
+        self.v = 0.0
+        self.p = (1e3, 0.0, 1e3)  # covariance (p00, p01, p11)
+        self.t = None
+        self.value = self.initial
+
+    def update(self, z, t: float | None = None):
+        if self.x is None or self.t is None or t is None:
+            self.x, self.v, self.t = float(z), 0.0, t
+            self.p = (self.r, 0.0, 1e3)
+            self.value = self.x
+            return self.value
+        dt = t - self.t
+        if dt <= 0:
+            return self.value
+        self.t = t
+
+        # predict
+        p00, p01, p11 = self.p
+        x = self.x + self.v * dt
+        q = self.q
+        p00 = p00 + 2 * dt * p01 + dt * dt * p11 + q * dt ** 3 / 3.0
+        p01 = p01 + dt * p11 + q * dt ** 2 / 2.0
+        p11 = p11 + q * dt
+
+        # update
+        s = p00 + self.r
+        k0 = p00 / s
+        k1 = p01 / s
+        y = z - x
+        self.x = x + k0 * y
+        self.v = self.v + k1 * y
+        self.p = (p00 - k0 * p00, p01 - k0 * p01, p11 - k1 * p01)
+
+        self.value = self.x + self.v * self.predict_s
+        return self.value
+
+
+def make_steering_filter(cfg):
+    """Build the steering-angle filter selected by ``cfg.steering_filter``."""
+    kind = (cfg.steering_filter or "ema").lower()
+    if kind == "one_euro":
+        return OneEuroFilter(
+            min_cutoff=cfg.one_euro_min_cutoff,
+            beta=cfg.one_euro_beta,
+            d_cutoff=cfg.one_euro_d_cutoff,
+            initial=0.0,
+        )
+    if kind == "kalman":
+        return KalmanFilter(
+            process_noise=cfg.kalman_process_noise,
+            measurement_noise=cfg.kalman_measurement_noise,
+            predict_s=cfg.kalman_predict_s,
+            initial=0.0,
+        )
+    if kind == "ema":
+        return LowPassFilter(alpha=cfg.smoothing_alpha_angle, initial=0.0)
+    raise ValueError(f"Unknown steering_filter '{cfg.steering_filter}'. Choose from: ema, one_euro, kalman")
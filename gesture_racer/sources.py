@@ -0,0 +1,361 @@
+"""Frame sources with hand tracking attached.
+
+``open_tracking(cfg)`` returns an object with ``read() -> (frame, t, hands)``
+used by the main loop:
+
+- :class:`TrackedCamera` - one camera and one ``HandTracker`` on the calling
+  thread (the default).
+- :class:`MultiCameraTracker` - several sources (``cfg.camera_sources``), each
+  captured and tracked by its own :class:`SourceWorker` thread. OpenCV capture
+  and MediaPipe inference release the GIL, so workers run on separate cores
+  without copying frames between processes. The first source drives the
+  display; the others contribute hands through :func:`fuse_hands`. Results
+  are fused around the newest capture among all sources, so a stalled source
+  (the first one included) only drops out instead of holding the others up.
+
+Both open the camera while the tracker warms up on a helper thread
+(``HandTracker.start``); frames arrive without hands until ``ready``.
+
+``set_idle(period_s, scale)`` slows a source down for idle mode
+(:mod:`gesture_racer.idle`): one fresh frame per ``period_s``, tracked at
+``scale`` resolution. ``set_idle(0.0)`` returns to camera rate.
+
+With ``cfg.motion_gate_enabled`` each source skips inference while its hands
+hold still (:mod:`gesture_racer.motion_gate`).
+"""
+
+import copy
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from gesture_racer.camera import Camera
+from gesture_racer.hand_tracking import HandTracker
+from gesture_racer.metrics import RollingStats
+from gesture_racer.motion_gate import make_gate
+from gesture_racer.threads import pin_current_thread
+from gesture_racer.timing import sleep_until
+
+
+def _parse_source(source):
+    if isinstance(source, str) and source.isdigit():
+        return int(source)
+    return source
+
+
+def camera_kwargs(cfg) -> dict:
+    return {
+        "flip": cfg.frame_flip,
+        "width": cfg.camera_width,
+        "height": cfg.camera_height,
+        "fps": cfg.camera_fps,
+        "fourcc": cfg.camera_fourcc,
+        "buffer_size": cfg.camera_buffer_size,
+    }
+
+
+def _report_mode(camera: Camera, name: str, frame=None):
+    problems = camera.mismatches if frame is None else camera.check_frame(frame)
+    for msg in problems:
+        print(f"{name}: {msg}")
+
+
+def _track(tracker, frame, scale: float = 1.0, gate=None):
+    if gate is not None:
+        return gate.process(frame, lambda f: _track(tracker, f, scale))
+    if scale >= 1.0:
+        return tracker.process(frame)
+    small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    hands = tracker.process(small)
+    # points are normalized; only the pixel wrist position refers to the smaller frame
+    for hand in hands:
+        hand.x = int(hand.x / scale)
+        hand.y = int(hand.y / scale)
+    return hands
+
+
+class _IdleCapture:
+    """Idle-mode capture pacing shared by the single- and multi-source paths."""
+
+    def __init__(self):
+        self.period_s = 0.0
+        self.scale = 1.0
+        self._next = 0.0
+
+    def set(self, period_s: float, scale: float = 1.0):
+        self.period_s = period_s
+        self.scale = scale if period_s > 0 else 1.0
+        self._next = time.perf_counter() + period_s
+
+    def read(self, camera: Camera):
+        if self.period_s <= 0:
+            return camera.read()
+        # the OS sleep is coarse but nothing here needs better than a few ms
+        sleep_until(self._next, spin_s=0.0)
+        self._next = max(self._next + self.period_s, time.perf_counter())
+        return camera.read(fresh=True)
+
+
+def tracker_kwargs(cfg, max_num_hands: int | None = None) -> dict:
+    return {
+        "model_complexity": cfg.model_complexity,
+        "max_num_hands": max_num_hands or cfg.max_num_hands,
+        "min_detection_confidence": cfg.min_detection_confidence,
+        "min_tracking_confidence": cfg.min_tracking_confidence,
+    }
+
+
+class TrackedCamera:
+    """One camera, tracked synchronously."""
+
+    def __init__(self, cfg, max_num_hands: int | None = None, source=None):
+        self.cfg = cfg
+        self.source = cfg.camera_index if source is None else _parse_source(source)
+        self.tracker = HandTracker(**tracker_kwargs(cfg, max_num_hands))
+        self.camera = None
+        self._checked = False  # first frame compared with the requested size
+        self._idle = _IdleCapture()
+        self.gate = make_gate(cfg)
+
+    def __enter__(self):
+        self.tracker.start()
+        try:
+            self.camera = Camera(index=self.source, **camera_kwargs(self.cfg))
+        except Exception:
+            self.tracker.__exit__(None, None, None)
+            raise
+        _report_mode(self.camera, f"Camera {self.source}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracker.__exit__(exc_type, exc, tb)
+        if self.camera is not None:
+            self.camera.release()
+
+    @property
+    def ready(self) -> bool:
+        return self.tracker.ready
+
+    def set_idle(self, period_s: float, scale: float = 1.0):
+        self._idle.set(period_s, scale)
+
+    def read(self):
+        frame = self._idle.read(self.camera)
+        t = time.perf_counter()
+        if not self._checked:
+            _report_mode(self.camera, f"Camera {self.source}", frame)
+            self._checked = True
+        return frame, t, _track(self.tracker, frame, self._idle.scale, self.gate)
+
+    def stats(self) -> dict:
+        return self.gate.stats() if self.gate is not None else {}
+
+
+class SourceWorker(threading.Thread):
+    """Captures and tracks one source, publishing only its newest result."""
+
+    def __init__(self, index: int, source, cfg, max_num_hands: int | None = None):
+        super().__init__(name=f"source-{index}", daemon=True)
+        self.index = index
+        self.source = _parse_source(source)
+        self.cfg = cfg
+        self.max_num_hands = max_num_hands
+        # (seq, capture time, frame, hands); replaced atomically
+        self.latest = (0, 0.0, None, [])
+        self.new_result = threading.Event()
+        self.frame_interval = RollingStats(120)
+        self.errors = 0
+        self.last_error: Exception | None = None
+        self.tracker = HandTracker(**tracker_kwargs(cfg, max_num_hands))
+        self.idle = _IdleCapture()
+        self.gate = make_gate(cfg)
+        self._running = True
+
+    @property
+    def ready(self) -> bool:
+        return self.tracker.ready
+
+    def run(self):
+        pin_current_thread("sources")
+        tracker = self.tracker.start()
+        try:
+            camera = Camera(index=self.source, **camera_kwargs(self.cfg))
+        except Exception as exc:
+            self.errors += 1
+            self.last_error = exc
+            tracker.__exit__(None, None, None)
+            return
+        _report_mode(camera, f"Source {self.index}")
+        seq = 0
+        last_t = None
+        try:
+            while self._running:
+                try:
+                    frame = self.idle.read(camera)
+                except RuntimeError as exc:
+                    # unplugged / end of file: keep the last result, retry slowly
+                    self.errors += 1
+                    self.last_error = exc
+                    time.sleep(0.1)
+                    continue
+                t = time.perf_counter()
+                hands = _track(tracker, frame, self.idle.scale, self.gate)
+                seq += 1
+                self.latest = (seq, t, frame, hands)
+                self.new_result.set()
+                if last_t is not None and not self.idle.period_s:
+                    self.frame_interval.add(t - last_t)
+                last_t = t
+        finally:
+            tracker.__exit__(None, None, None)
+            camera.release()
+
+    def stop(self):
+        self._running = False
+
+
+def _mapped_points(hand, transform):
+    pts = hand.points
+    if transform is None or pts is None:
+        return pts
+    sx, sy, ox, oy = transform
+    mapped = pts.copy()
+    mapped[:, 0] = pts[:, 0] * sx + ox
+    mapped[:, 1] = pts[:, 1] * sy + oy
+    return mapped
+
+
+def fuse_hands(candidates, frame_width: int, frame_height: int, merge_radius: float = 0.08):
+    """Keep the most confident detection of each physical hand.
+
+    ``candidates`` is a list of ``(hand, mapped_points)`` in the primary
+    view's normalized coordinates. Detections with the same label whose
+    wrists are within ``merge_radius`` are treated as the same hand.
+    """
+    ordered = sorted(
+        (c for c in candidates if c[1] is not None),
+        key=lambda c: getattr(c[0], "score", 0.0),
+        reverse=True,
+    )
+    kept = []
+    for hand, pts in ordered:
+        wrist = pts[0, :2]
+        duplicate = any(
+            k.label == hand.label and float(np.hypot(*(k.points[0, :2] - wrist))) <= merge_radius
+            for k in kept
+        )
+        if duplicate:
+            continue
+        fused = copy.copy(hand)
+        fused.points = pts
+        fused.landmarks = hand.landmarks if pts is hand.points else None
+        fused.x = int(pts[0, 0] * frame_width)
+        fused.y = int(pts[0, 1] * frame_height)
+        kept.append(fused)
+    return kept
+
+
+class MultiCameraTracker:
+    """Parallel per-source trackers fused into one hand list per primary frame."""
+
+    def __init__(self, cfg, max_num_hands: int | None = None, sources=None):
+        self.cfg = cfg
+        sources = list(sources if sources is not None else cfg.camera_sources)
+        self.workers = [SourceWorker(i, s, cfg, max_num_hands) for i, s in enumerate(sources)]
+        transforms = list(cfg.camera_source_transforms)
+        self.transforms = [transforms[i] if i < len(transforms) else None for i in range(len(sources))]
+        self.max_skew_s = cfg.multicam_max_skew_ms / 1000.0
+        self.merge_radius = cfg.multicam_merge_radius
+        self.skew = [RollingStats(120) for _ in sources]
+        # every worker signals this one event, so a read wakes on whichever source delivers
+        self._new_result = threading.Event()
+        for w in self.workers:
+            w.new_result = self._new_result
+        self._last_seqs = [0] * len(sources)
+
+    def __enter__(self):
+        for w in self.workers:
+            w.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for w in self.workers:
+            w.stop()
+        for w in self.workers:
+            w.join(timeout=1.0)
+
+    def set_idle(self, period_s: float, scale: float = 1.0):
+        for w in self.workers:
+            w.idle.set(period_s, scale)
+
+    @property
+    def ready(self) -> bool:
+        # a source that died (no camera) must not hold the others in "initializing"
+        return all(w.ready or not w.is_alive() for w in self.workers)
+
+    def read(self, timeout: float = 1.0):
+        """Newest fused result; paced by the first source unless it falls behind."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            self._new_result.clear()
+            snapshots = [w.latest for w in self.workers]
+            fresh = [snap[0] != last for snap, last in zip(snapshots, self._last_seqs)]
+            t_ref = max((snap[1] for snap in snapshots if snap[0]), default=None)
+            primary_seq, primary_t, primary_frame, _ = snapshots[0]
+            if fresh[0] and primary_frame is not None:
+                break
+            # the primary is behind the newest capture by more than the skew window: go on without it
+            if any(fresh) and (not primary_seq or t_ref - primary_t > self.max_skew_s):
+                break
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            self._new_result.wait(remaining)
+
+        frame = primary_frame
+        if frame is None:
+            frame = next((snap[2] for snap in snapshots if snap[2] is not None), None)
+            if frame is None:
+                errors = "; ".join(str(w.last_error) for w in self.workers if w.last_error is not None)
+                raise RuntimeError(f"Error: no source produced frames ({errors or 'timed out'}).")
+            frame = np.zeros_like(frame)
+        elif not fresh[0]:
+            # primary stalled: its last frame already carries our overlay, show a blank one
+            # while the other sources keep steering
+            frame = np.zeros_like(frame)
+        self._last_seqs = [snap[0] for snap in snapshots]
+
+        h, w = frame.shape[:2]
+        candidates = []
+        if any(fresh):  # nothing new anywhere within the timeout: every source is stale
+            for i, (wseq, t, _, hands) in enumerate(snapshots):
+                if not wseq:
+                    continue
+                skew = t - t_ref
+                self.skew[i].add(skew)
+                # stale or stalled sources, the primary included, do not hold anything up; they sit out
+                if -skew > self.max_skew_s:
+                    continue
+                for hand in hands:
+                    candidates.append((hand, _mapped_points(hand, self.transforms[i])))
+        return frame, t_ref, fuse_hands(candidates, w, h, self.merge_radius)
+
+    def stats(self) -> dict:
+        out = {}
+        for i, w in enumerate(self.workers):
+            interval = w.frame_interval.mean
+            out[f"cam{i}_fps"] = 1.0 / interval if interval else 0.0
+            out[f"cam{i}_skew_ms"] = self.skew[i].percentile(50) * 1000.0
+            out[f"cam{i}_errors"] = w.errors
+            if w.gate is not None:
+                out[f"cam{i}_gate_skip_ratio"] = w.gate.stats()["gate_skip_ratio"]
+        return out
+
+
+def open_tracking(cfg, max_num_hands: int | None = None):
+    if len(cfg.camera_sources) > 1:
+        return MultiCameraTracker(cfg, max_num_hands)
+    source = cfg.camera_sources[0] if cfg.camera_sources else None
+    return TrackedCamera(cfg, max_num_hands, source=source)
@@ -0,0 +1,34 @@
+"""Startup milestones, measured from when ``main.py`` started running."""
+
+import time
+
+
+class StartupTimer:
+    """Records the first time each milestone is reached.
+
+    Milestones used by the app: ``camera_open``, ``first_frame``,
+    ``tracker_ready`` and ``first_gesture`` (first frame with a hand).
+    """
+
+    def __init__(self, t0: float | None = None, clock=time.perf_counter):
+        self.clock = clock
+        self.t0 = clock() if t0 is None else t0
+        self.marks: dict[str, float] = {}
+
+    def mark(self, name: str, t: float | None = None) -> bool:
+        """Record ``name`` once; returns True the first time."""
+        if name in self.marks:
+            return False
+        self.marks[name] = (self.clock() if t is None else t) - self.t0
+        return True
+
+    def elapsed_ms(self, name: str) -> float | None:
+        s = self.marks.get(name)
+        return None if s is None else s * 1000.0
+
+    def stats(self) -> dict:
+        return {f"startup_{name}_ms": s * 1000.0 for name, s in self.marks.items()}
+
+    def report(self) -> str:
+        parts = [f"{name.replace('_', ' ')} {s * 1000.0:.0f} ms" for name, s in sorted(self.marks.items(), key=lambda kv: kv[1])]
+        return "Startup: " + (" | ".join(parts) if parts else "no milestones")
@@ -0,0 +1,127 @@
+from collections import deque
+from dataclasses import dataclass, replace
+
+from gesture_racer.gestures import GestureOutput
+
+
+@dataclass
+class TransitionEvent:
+    t: float
+    channel: str  # 'move' | 'turn'
+    old: str
+    new: str
+
+
+class EventRateMeter:
+    """Events per second over a sliding time window."""
+
+    def __init__(self, window_s: float = 2.0):
+        self.window_s = window_s
+        self._times = deque()
+        self.total = 0
+
+    def add(self, t: float, n: int = 1):
+        for _ in range(n):
+            self._times.append(t)
+        self.total += n
+
+    def rate(self, now: float) -> float:
+        while self._times and self._times[0] < now - self.window_s:
+            self._times.popleft()
+        return len(self._times) / self.window_s
+
+
+class GestureStateMachine:
+    """Stabilizes ``decide_actions`` output before it reaches the keyboard.
+
+    Each channel (move, turn) only changes state when its input crosses an
+    *enter* threshold and only falls back after crossing a looser *exit*
+    threshold; a state must also be held for a minimum dwell time before it
+    may change again. Every committed change is emitted as a
+    :class:`TransitionEvent`. Raw transitions (what the controller would have
+    seen without this layer) are counted alongside so the reduction in input
+    events can be measured live or on a replayed session.
+    """
+
+    def __init__(
+        self,
+        turn_enter_deg: float = 12.0,
+        turn_exit_deg: float = 8.0,
+        brake_enter_px: float = 100.0,
+        brake_exit_px: float = 120.0,
+        move_min_dwell_s: float = 0.1,
+        turn_min_dwell_s: float = 0.06,
+        history: int = 256,
+    ):
+        self.turn_enter_deg = turn_enter_deg
+        self.turn_exit_deg = turn_exit_deg
+        self.brake_enter_px = brake_enter_px
+        self.brake_exit_px = brake_exit_px
+        self.move_min_dwell_s = move_min_dwell_s
+        self.turn_min_dwell_s = turn_min_dwell_s
+
+        self.move = "stop"
+        self.turn = "straight"
+        self._move_since = None
+        self._turn_since = None
+        self._raw = None  # last raw (move, turn)
+
+        self.events = deque(maxlen=history)
+        self.event_rate = EventRateMeter()
+        self.raw_event_rate = EventRateMeter()
+
+    def set_thresholds(self, turn_deadband_deg: float, hysteresis_deg: float):
+        self.turn_enter_deg = turn_deadband_deg
+        self.turn_exit_deg = max(0.0, turn_deadband_deg - hysteresis_deg)
+
+    def _move_candidate(self, actions: GestureOutput) -> str:
+        if actions.move not in ("brake", "forward") or actions.hand_distance is None:
+            return actions.move
+        # two hands: hysteresis on hand distance
+        threshold = self.brake_exit_px if self.move == "brake" else self.brake_enter_px
+        return "brake" if actions.hand_distance < threshold else "forward"
+
+    def _turn_candidate(self, move: str, angle: float) -> str:
+        if move != "forward":
+            return "straight"
+        if self.turn == "right" and angle > self.turn_exit_deg:
+            return "right"
+        if self.turn == "left" and angle < -self.turn_exit_deg:
+            return "left"
+        if angle > self.turn_enter_deg:
+            return "right"
+        if angle < -self.turn_enter_deg:
+            return "left"
+        return "straight"
+
+    def _commit(self, channel: str, new: str, since_attr: str, dwell_s: float, t: float) -> list:
+        old = getattr(self, channel)
+        since = getattr(self, since_attr)
+        if new == old or (since is not None and t - since < dwell_s):
+            return []
+        setattr(self, channel, new)
+        setattr(self, since_attr, t)
+        ev = TransitionEvent(t, channel, old, new)
+        self.events.append(ev)
+        self.event_rate.add(t)
+        return [ev]
+
+    def update(self, actions: GestureOutput, t: float) -> tuple[GestureOutput, list[TransitionEvent]]:
+        raw = (actions.move, actions.turn)
+        if self._raw is not None:
+            self.raw_event_rate.add(t, sum(a != b for a, b in zip(raw, self._raw)))
+        self._raw = raw
+
+        emitted = self._commit("move", self._move_candidate(actions), "_move_since", self.move_min_dwell_s, t)
+        angle = actions.steering_angle or 0.0
+        # leaving "forward" straightens the wheel immediately, regardless of dwell
+        turn_dwell = self.turn_min_dwell_s if self.move == "forward" else 0.0
+        emitted += self._commit("turn", self._turn_candidate(self.move, angle), "_turn_since", turn_dwell, t)
+
+        stable = replace(actions, move=self.move, turn=self.turn)
+        if self.move != "forward":
+            stable.steering_angle = 0.0
+        return stable, emitted
+
+    def rates(self, now: float) -> dict:
+        return {"events_per_s": self.event_rate.rate(now), "raw_events_per_s": self.raw_event_rate.rate(now)}
@@ -0,0 +1,92 @@
+"""Thread counts and CPU affinity for OpenCV, MediaPipe and our own threads.
+
+OpenCV's ``parallel_for`` pool (``GaussianBlur``, ``addWeighted``,
+``cvtColor``, ``resize``), MediaPipe's inference threads and our threads all
+size themselves to every core, so on a 4-core laptop they oversubscribe and
+the frame loop waits for the scheduler. :func:`configure_threads` applies
+``cfg.cv2_num_threads`` and ``cfg.inference_threads`` and records
+``cfg.cpu_affinity``; each thread then calls :func:`pin_current_thread` with
+its stage name when it starts:
+
+- ``loop``: the main frame loop (pipeline, overlay, display).
+- ``tracker``: the thread that creates the MediaPipe graph. Threads inherit
+  the affinity of the thread that starts them, so MediaPipe's inference
+  threads stay on these cores.
+- ``sources``: :class:`~gesture_racer.sources.SourceWorker` capture threads.
+- ``input``: input dispatch and PWM threads.
+- ``recorder``: the HUD video encoder.
+
+Threads inherit their creator's CPUs, and the main thread pins itself as
+``loop`` before it starts the others, so once any stage is pinned, a thread
+whose stage has no entry goes back to the CPUs the process started with
+instead of sharing the loop's. ``{"loop": [0]}`` pins only the loop.
+
+``inference_threads`` is only a hint: the legacy ``mp.solutions.hands`` API
+takes no thread count, so it is passed through the usual environment
+variables, which must be set before mediapipe is imported (it is imported
+lazily, when the tracker opens). Pinning the ``tracker`` stage is the limit
+that always holds. Affinity is Linux-only (``os.sched_setaffinity``);
+elsewhere it is ignored with a note.
+"""
+
+import os
+import sys
+
+import cv2
+
+STAGES = ("loop", "tracker", "sources", "input", "recorder")
+INFERENCE_ENV = ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS", "TFLITE_NUM_THREADS")
+
+_affinity: dict[str, list[int]] = {}
+_process_cpus: set[int] | None = None  # mask before any pinning, for unconfigured stages
+
+
+def configure_threads(cfg) -> list[str]:
+    """Apply thread counts and remember the affinity map; returns notes worth printing."""
+    global _process_cpus
+    notes = []
+    if _process_cpus is None and hasattr(os, "sched_getaffinity"):
+        _process_cpus = os.sched_getaffinity(0)
+    if cfg.cv2_num_threads >= 0:
+        cv2.setNumThreads(cfg.cv2_num_threads)
+    if cfg.inference_threads > 0:
+        if "mediapipe" in sys.modules:
+            notes.append("inference_threads: mediapipe is already imported, the hint has no effect")
+        for var in INFERENCE_ENV:
+            os.environ[var] = str(cfg.inference_threads)
+    unknown = set(cfg.cpu_affinity) - set(STAGES)
+    if unknown:
+        notes.append(f"cpu_affinity: unknown stages {sorted(unknown)} (known: {', '.join(STAGES)})")
+    _affinity.clear()
+    _affinity.update({stage: list(cpus) for stage, cpus in cfg.cpu_affinity.items() if stage in STAGES and cpus})
+    if _affinity and not hasattr(os, "sched_setaffinity"):
+        notes.append("cpu_affinity: not supported on this platform, ignored")
+        _affinity.clear()
+    return notes
+
+
+def pin_current_thread(stage: str) -> bool:
+    """Restrict the calling thread to ``stage``'s CPUs; True if the stage has its own.
+
+    With affinity in use, a stage without an entry is reset to the process's
+    original CPUs rather than keeping the mask inherited from its creator.
+    """
+    if not _affinity:
+        return False
+    cpus = _affinity.get(stage) or _process_cpus
+    if not cpus:
+        return False
+    try:
+        # pid 0 is the calling thread on Linux, not the whole process
+        os.sched_setaffinity(0, cpus)
+    except (OSError, ValueError) as exc:
+        print(f"cpu_affinity[{stage}] = {sorted(cpus)}: {exc}")
+        return False
+    return stage in _affinity
+
+
+def thread_stats() -> dict:
+    return {
+        "cv2_threads": cv2.getNumThreads(),
+        "cpus_available": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+    }
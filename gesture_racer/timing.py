@@ -0,0 +1,77 @@
+import time
+
+from gesture_racer.metrics import RollingStats
+
+
+def sleep_until(deadline: float, spin_s: float = 0.0015, clock=time.perf_counter) -> float:
+    """Wait until ``clock() >= deadline`` and return the actual wake time.
+
+    ``time.sleep`` alone can overshoot by a scheduler quantum (1-15 ms depending
+    on the OS), so we sleep until ``spin_s`` before the deadline and busy-wait
+    the remainder.
+    """
+    now = clock()
+    remaining = deadline - now - spin_s
+    if remaining > 0:
+        time.sleep(remaining)
+    now = clock()
+    while now < deadline:
+        now = clock()
+    return now
+
+
+class FramePacer:
+    """Holds the frame loop to a target rate (``fps_cap``; 0 = uncapped).
+
+    Call :meth:`wait` once at the end of every frame. With a cap it waits for
+    the next slot with :func:`sleep_until` (OS sleep, then a short spin), so
+    intervals do not depend on how long ``cv2.waitKey`` or the scheduler
+    happen to sleep. A frame that ends after its slot is an overrun: the
+    schedule restarts from now instead of bursting to catch up. Frame
+    intervals are kept either way, so uncapped runs report jitter too.
+    """
+
+    def __init__(self, fps_cap: float = 0.0, spin_s: float = 0.0015, clock=time.perf_counter):
+        self.period = 1.0 / fps_cap if fps_cap > 0 else 0.0
+        self.spin_s = spin_s
+        self.clock = clock
+        self.interval = RollingStats(512)  # seconds between successive wait() returns
+        self.frames = 0
+        self.overruns = 0
+        self._next: float | None = None
+        self._last: float | None = None
+
+    def reset(self):
+        """Forget the schedule (e.g. after the loop ran slowly on purpose)."""
+        self._next = self._last = None
+
+    def wait(self) -> float:
+        now = self.clock()
+        if self.period:
+            if self._next is None or now > self._next:
+                if self._next is not None:
+                    self.overruns += 1
+                self._next = now
+            else:
+                now = sleep_until(self._next, self.spin_s, self.clock)
+            self._next += self.period
+        if self._last is not None:
+            self.interval.add(now - self._last)
+        self._last = now
+        self.frames += 1
+        return now
+
+    def stats(self) -> dict:
+        target = self.period or self.interval.percentile(50)
+        errors = sorted(abs(x - target) for x in self.interval.samples)
+        p95 = errors[min(len(errors) - 1, int(0.95 * (len(errors) - 1) + 0.5))] if errors else 0.0
+        return {
+            "pace_interval_ms_p50": self.interval.percentile(50) * 1000.0,
+            "pace_jitter_ms_p95": p95 * 1000.0,
+            "pace_overruns": self.overruns,
+            "pace_overrun_pct": 100.0 * self.overruns / self.frames if self.frames else 0.0,
+        }
+
+    def chip(self) -> str:
+        s = self.stats()
+        return f"Pace: {s['pace_interval_ms_p50']:.1f}ms | jitter {s['pace_jitter_ms_p95']:.1f}ms p95 | overruns {s['pace_overrun_pct']:.0f}%"
@@ -0,0 +1,95 @@
+"""Precomputed vertex arrays for the static parts of the HUD.
+
+Everything here is cached per resolution/size and returned as read-only
+int32/float64 NumPy arrays, ready for a single ``cv2.polylines`` call.
+Per-frame motion (parallax, rotation) is applied as a vectorized transform
+on top of the cached vertices instead of rebuilding geometry in Python loops.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    arr.setflags(write=False)
+    return arr
+
+
+@lru_cache(maxsize=16)
+def hex_grid(w: int, h: int, cell: int) -> np.ndarray:
+    """Honeycomb outlines covering a ``w`` x ``h`` frame, shape (N, 6, 2).
+
+    The grid starts one horizontal period and one vertical period
+    (two rows) before the origin so it can be shifted by any parallax
+    offset modulo its period without exposing an empty strip.
+    """
+    r = cell // 2
+    k = int(0.866 * r)
+    offsets = np.array(
+        [(r, 0), (r // 2, k), (-(r // 2), k), (-r, 0), (-(r // 2), -k), (r // 2, -k)],
+        dtype=np.int32,
+    )
+    ys = np.arange(-2 * cell, h + cell, cell, dtype=np.int32)
+    xs = np.arange(-cell, w + cell, cell, dtype=np.int32)
+    gx, gy = np.meshgrid(xs, ys)
+    gx = gx + ((gy // cell) % 2) * r
+    centers = np.stack([gx.ravel(), gy.ravel()], axis=1)
+    return _frozen(centers[:, None, :] + offsets[None, :, :])
+
+
+def hex_grid_shifted(w: int, h: int, cell: int, dx: int, dy: int) -> np.ndarray:
+    """Hex outlines translated by a parallax offset (wrapped to the grid period)."""
+    base = hex_grid(w, h, cell)
+    shift = np.array([int(dx) % cell, int(dy) % (2 * cell)], dtype=np.int32)
+    return base + shift
+
+
+@lru_cache(maxsize=16)
+def grid_lines(w: int, h: int, spacing: int) -> np.ndarray:
+    """Vertical and horizontal background grid lines, shape (N, 2, 2)."""
+    xs = np.arange(0, w, spacing, dtype=np.int32)
+    ys = np.arange(0, h, spacing, dtype=np.int32)
+    vert = np.stack([np.stack([xs, np.zeros_like(xs)], 1), np.stack([xs, np.full_like(xs, h)], 1)], 1)
+    horiz = np.stack([np.stack([np.zeros_like(ys), ys], 1), np.stack([np.full_like(ys, w), ys], 1)], 1)
+    return _frozen(np.concatenate([vert, horiz], axis=0))
+
+
+@lru_cache(maxsize=16)
+def scanlines(w: int, h: int, spacing: int) -> np.ndarray:
+    """Horizontal scanlines, shape (N, 2, 2)."""
+    ys = np.arange(0, h, spacing, dtype=np.int32)
+    return _frozen(np.stack([np.stack([np.zeros_like(ys), ys], 1), np.stack([np.full_like(ys, w), ys], 1)], 1))
+
+
+@lru_cache(maxsize=8)
+def unit_ring(count: int) -> np.ndarray:
+    """Unit (cos, sin) directions for ``count`` evenly spaced ticks, shape (count, 2)."""
+    a = np.radians(np.arange(count) * (360.0 / count))
+    return _frozen(np.stack([np.cos(a), np.sin(a)], axis=1))
+
+
+def rotate(vecs: np.ndarray, angle_deg: float) -> np.ndarray:
+    """Rotate an (N, 2) array of vectors by ``angle_deg`` (image coordinates)."""
+    a = math.radians(angle_deg)
+    c, s = math.cos(a), math.sin(a)
+    rot = np.array([[c, s], [-s, c]])
+    return vecs @ rot
+
+
+def tick_segments(cx: int, cy: int, r1: int, r2: int, count: int, angle_deg: float) -> np.ndarray:
+    """Radial tick segments around (cx, cy) rotated by ``angle_deg``, shape (count, 2, 2)."""
+    dirs = rotate(unit_ring(count), angle_deg)
+    inner = (dirs * r1).astype(np.int32)
+    outer = (dirs * r2).astype(np.int32)
+    center = np.array([cx, cy], dtype=np.int32)
+    return np.stack([inner + center, outer + center], axis=1)
+
+
+@lru_cache(maxsize=32)
+def arc(cx: int, cy: int, radius: int, start_deg: int, end_deg: int, step_deg: int = 3) -> np.ndarray:
+    """Open polyline approximating a circular arc, shape (M, 2)."""
+    a = np.radians(np.arange(start_deg, end_deg + step_deg, step_deg, dtype=np.float64).clip(max=end_deg))
+    pts = np.stack([cx + radius * np.cos(a), cy + radius * np.sin(a)], axis=1)
+    return _frozen(np.rint(pts).astype(np.int32))
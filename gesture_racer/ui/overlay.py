@@ -1,10 +1,16 @@
 import math
+import time
 import cv2
 from typing import List, Tuple
 from gesture_racer.interaction import compute_grip
 
+from . import geometry
 from .theme import Theme
 
+# Animation ticks per second. Effects were tuned at ~30 FPS; driving them from
+# the wall clock keeps the same look at any display rate.
+ANIM_RATE = 30.0
+
 
 class Overlay:
     def __init__(
@@ -19,6 +25,7 @@ class Overlay:
         grid_alpha: float = 0.06,
         scan_alpha: float = 0.10,
         hex_alpha: float = 0.06,
+        clock=time.perf_counter,
     ):
         self.theme = theme
         self.alpha_scale = max(0.0, min(1.0, alpha_scale))
@@ -31,12 +38,20 @@ class Overlay:
 
         self.font_main = cv2.FONT_HERSHEY_SIMPLEX
         self.font_small = cv2.FONT_HERSHEY_SIMPLEX
-        self.frame_no = 0
-        self.trails = {"Left": [], "Right": []}
-        self.max_trail_len = trail_len
+        self.frame_no = 0  # draw calls
+        self.clock = clock
+        self.anim_time = 0.0  # seconds since the first draw
+        self.tick = 0         # int(anim_time * ANIM_RATE), for palette cycling
+        self._t_start = None
+        self._t_last = None
+        self._last_emit_tick = -1
+        self.trails = {"Left": [], "Right": []}  # (x, y, t) per label
+        self.max_trail_len = trail_len  # in animation ticks (and points)
         # simple particle system
         self.particles = []  # list of dicts: {x,y,vx,vy,life,color}
         self.max_particles = particle_max
+        # wheel arc polylines grouped by color, keyed by (cx, cy, radius)
+        self._arc_cache = {}
 
     def _panel(self, frame, x, y, w, h, color, alpha=0.35):
         overlay = frame.copy()
@@ -61,41 +76,24 @@ class Overlay:
         # text
         cv2.putText(frame, text, (x + pad_x, y + th + pad_y - 2), self.font_small, 0.6, color_text, 1, cv2.LINE_AA)
 
+    def _blur(self, frame):
+        frame[:] = cv2.GaussianBlur(frame, (self.blur_ksize, self.blur_ksize), self.blur_sigma)
+
     def _scanlines(self, frame, alpha=0.08, spacing=4):
         h, w, _ = frame.shape
         overlay = frame.copy()
         color = tuple(int(c * 0.6) for c in self.theme.bg_panel)
-        for gy in range(0, h, spacing):
-            cv2.line(overlay, (0, gy), (w, gy), color, 1)
+        cv2.polylines(overlay, geometry.scanlines(w, h, spacing), False, color, 1)
         a = alpha * self.alpha_scale
         cv2.addWeighted(overlay, a, frame, 1 - a, 0, frame)
 
     def _hex_grid(self, frame, cell=60, parallax=(0, 0), alpha=0.08):
-        # draw honeycomb-like grid with slight parallax
+        # draw honeycomb-like grid with slight parallax (cached vertices, one polylines call)
         h, w, _ = frame.shape
         overlay = frame.copy()
         color = tuple(int(c * 0.8) for c in self.theme.bg_panel)
         dx, dy = parallax
-        dx = int(dx)
-        dy = int(dy)
-        r = cell // 2
-        for y in range(0, h + cell, cell):
-            for x in range(0, w + cell, cell):
-                cx = x + ((y // cell) % 2) * r + dx
-                cy = y + dy
-                pts = [
-                    (cx + r, cy),
-                    (cx + r // 2, cy + int(0.866 * r)),
-                    (cx - r // 2, cy + int(0.866 * r)),
-                    (cx - r, cy),
-                    (cx - r // 2, cy - int(0.866 * r)),
-                    (cx + r // 2, cy - int(0.866 * r)),
-                ]
-                # draw hex outline
-                for i in range(6):
-                    p1 = pts[i]
-                    p2 = pts[(i + 1) % 6]
-                    cv2.line(overlay, p1, p2, color, 1)
+        cv2.polylines(overlay, geometry.hex_grid_shifted(w, h, cell, dx, dy), True, color, 1)
         a = alpha * self.alpha_scale
         cv2.addWeighted(overlay, a, frame, 1 - a, 0, frame)
 
@@ -117,34 +115,42 @@ class Overlay:
             # glow effect by multiple lines
             # gradient glow using palette
             for i, t in enumerate((6, 4, 2)):
-                cv2.line(frame, (cx, cy), (end_x, end_y), self._palette_color(i + self.frame_no), t)
+                cv2.line(frame, (cx, cy), (end_x, end_y), self._palette_color(i + self.tick), t)
 
-        # Futuristic arcs
-        for i in range(4):
-            color = self._palette_color(i)
-            cv2.ellipse(frame, (cx, cy), (radius + 20 + i * 10, radius + 20 + i * 10), 0, 30, 150, color, 1)
-            cv2.ellipse(frame, (cx, cy), (radius + 20 + i * 10, radius + 20 + i * 10), 0, 210, 330, color, 1)
+        # Futuristic arcs, batched per palette color
+        for color, polys in self._arc_batches(cx, cy, radius):
+            cv2.polylines(frame, polys, False, color, 1)
 
         # Pulsing ring based on frame and angle intensity
         intensity = min(1.0, abs(angle_deg or 0) / 60.0)
-        pulse = int(8 + 6 * abs(math.sin(self.frame_no * 0.08)))
-        cv2.circle(frame, (cx, cy), radius + 8, self._palette_color(int(self.frame_no / 2)), pulse)
+        pulse = int(8 + 6 * abs(math.sin(self.anim_time * ANIM_RATE * 0.08)))
+        cv2.circle(frame, (cx, cy), radius + 8, self._palette_color(self.tick // 2), pulse)
 
-        # Rotating ticks for futuristic feel
+        # Rotating ticks for futuristic feel (cached unit ring, rotated per frame)
         tick_overlay = frame.copy()
         tick_count = 24
-        angle_offset = (self.frame_no % 360) * 1.2
-        for i in range(tick_count):
-            a = math.radians(angle_offset + i * (360 / tick_count))
-            r1 = radius + 8
-            r2 = radius + 24
-            x1 = cx + int(r1 * math.cos(a))
-            y1 = cy + int(r1 * math.sin(a))
-            x2 = cx + int(r2 * math.cos(a))
-            y2 = cy + int(r2 * math.sin(a))
-            cv2.line(tick_overlay, (x1, y1), (x2, y2), self._palette_color(i), 1)
+        angle_offset = (self.anim_time * ANIM_RATE % 360) * 1.2
+        segs = geometry.tick_segments(cx, cy, radius + 8, radius + 24, tick_count, angle_offset)
+        n_colors = len(self.theme.palette or (self.theme.wheel_indicator,))
+        for i in range(min(n_colors, tick_count)):
+            cv2.polylines(tick_overlay, segs[i::n_colors], False, self._palette_color(i), 1)
         cv2.addWeighted(tick_overlay, 0.25 * self.alpha_scale, frame, 1 - 0.25 * self.alpha_scale, 0, frame)
 
+    def _arc_batches(self, cx, cy, radius):
+        """Arc polylines for the wheel grouped by palette color, cached per geometry."""
+        key = (cx, cy, radius)
+        batches = self._arc_cache.get(key)
+        if batches is None:
+            groups = {}
+            for i in range(4):
+                r = radius + 20 + i * 10
+                polys = groups.setdefault(self._palette_color(i), [])
+                polys.append(geometry.arc(cx, cy, r, 30, 150))
+                polys.append(geometry.arc(cx, cy, r, 210, 330))
+            batches = list(groups.items())
+            self._arc_cache = {key: batches}
+        return batches
+
     def _hand_handle(self, frame, x, y, label, cx, cy, intensity, angle_offset_rad=0.0):
         """Draw a ring and a small interactive 'handle' attached to the wrist.
 
@@ -160,7 +166,7 @@ class Overlay:
         # Ring around wrist
         ring_overlay = frame.copy()
         for i, t in enumerate((4, 2)):
-            cv2.circle(ring_overlay, (x, y), r_ring + i * 2, self._palette_color(self.frame_no + i), t)
+            cv2.circle(ring_overlay, (x, y), r_ring + i * 2, self._palette_color(self.tick + i), t)
         cv2.addWeighted(ring_overlay, 0.45, frame, 0.55, 0, frame)
 
         # Handle bar (radial)
@@ -171,7 +177,7 @@ class Overlay:
 
         handle_overlay = frame.copy()
         for i, t in enumerate((6, 4, 2)):
-            cv2.line(handle_overlay, (sx, sy), (ex, ey), self._palette_color(self.frame_no + i), t)
+            cv2.line(handle_overlay, (sx, sy), (ex, ey), self._palette_color(self.tick + i), t)
         # small side spokes for grip effect
         spoke_len = max(6, int(8 * (0.5 + intensity)))
         for delta in (-0.35, 0.35):
@@ -180,24 +186,28 @@ class Overlay:
             py = y + int((r_ring + r_handle - 8) * math.sin(aa))
             qx = px + int(spoke_len * math.cos(aa + math.pi / 2))
             qy = py + int(spoke_len * math.sin(aa + math.pi / 2))
-            cv2.line(handle_overlay, (px, py), (qx, qy), self._palette_color(self.frame_no + 3), 2)
+            cv2.line(handle_overlay, (px, py), (qx, qy), self._palette_color(self.tick + 3), 2)
         cv2.addWeighted(handle_overlay, 0.35, frame, 0.65, 0, frame)
 
     def draw(self, frame, hands, actions, show_debug=True, extra_chips: List[str] | None = None, draw_handles: bool = True, grip_threshold_px: int = 28):
         h, w, _ = frame.shape
         self.frame_no += 1
+        now = self.clock()
+        if self._t_start is None:
+            self._t_start = self._t_last = now
+        # elapsed animation ticks since the last draw (capped so a stall does not teleport particles)
+        step = min(now - self._t_last, 0.25) * ANIM_RATE
+        self._t_last = now
+        self.anim_time = now - self._t_start
+        self.tick = int(self.anim_time * ANIM_RATE)
 
         # Optional background blur to reduce busy visuals
         if self.blur_enabled:
-            blurred = cv2.GaussianBlur(frame, (self.blur_ksize, self.blur_ksize), self.blur_sigma)
-            frame[:] = blurred
+            self._blur(frame)
 
         # Background grid + scanlines + hexes for futuristic vibe
         grid_color = tuple(int(c * 0.6) for c in self.theme.bg_panel)
-        for gx in range(0, w, 80):
-            cv2.line(frame, (gx, 0), (gx, h), grid_color, 1)
-        for gy in range(0, h, 80):
-            cv2.line(frame, (0, gy), (w, gy), grid_color, 1)
+        cv2.polylines(frame, geometry.grid_lines(w, h, 80), False, grid_color, 1)
         # parallax from steering
         parallax = (int(actions.steering_angle or 0), 0)
         self._hex_grid(frame, cell=70, parallax=parallax, alpha=self.hex_alpha)
@@ -238,33 +248,41 @@ class Overlay:
         # gradient segments
         seg_w = 40
         for i in range(0, bar_w, seg_w):
-            color = self._palette_color(i // seg_w + self.frame_no)
+            color = self._palette_color(i // seg_w + self.tick)
             cv2.rectangle(bar_overlay, (w - 260 + i, 22), (min(w - 260 + i + seg_w, w - 40), 40), color, -1)
         cv2.addWeighted(bar_overlay, 0.4 * self.alpha_scale, frame, 1 - 0.4 * self.alpha_scale, 0, frame)
         cv2.rectangle(frame, (w - 260, 22), (w - 40, 40), self.theme.bg_panel, 2)
         cv2.putText(frame, "Steer", (w - 330, 38), self.font_small, 0.6, self.theme.text_muted, 1, cv2.LINE_AA)
 
-        # Particle effects emitted from center based on intensity
-        if intensity > 0.1 and len(self.particles) < self.max_particles:
+        # Particle effects emitted from center based on intensity: one burst per animation
+        # tick, back-dated so slow display rates show the same cloud as fast ones
+        bursts = min(self.tick - self._last_emit_tick, 6) if self._last_emit_tick >= 0 else 1
+        self._last_emit_tick = self.tick
+        if intensity > 0.1:
             emit_count = int(4 + 8 * intensity)
-            for i in range(emit_count):
-                ang = math.radians(i * (360 / max(1, emit_count)))
-                speed = 2 + 3 * intensity
-                vx = speed * math.cos(ang)
-                vy = speed * math.sin(ang)
-                self.particles.append({
-                    'x': cx, 'y': cy,
-                    'vx': vx, 'vy': vy,
-                    'life': 18,
-                    'color': self._palette_color(self.frame_no + i)
-                })
+            speed = 2 + 3 * intensity
+            for burst in range(bursts):
+                if len(self.particles) >= self.max_particles:
+                    break
+                # ticks this burst has already travelled before the update below adds `step`
+                age = bursts - 1 - burst + 1 - step
+                for i in range(emit_count):
+                    ang = math.radians(i * (360 / max(1, emit_count)))
+                    vx = speed * math.cos(ang)
+                    vy = speed * math.sin(ang)
+                    self.particles.append({
+                        'x': cx + vx * age, 'y': cy + vy * age,
+                        'vx': vx, 'vy': vy,
+                        'life': 18 - age,
+                        'color': self._palette_color(self.tick + i)
+                    })
         # update and draw particles
         part_overlay = frame.copy()
         survived = []
         for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['life'] -= 1
+            p['x'] += p['vx'] * step
+            p['y'] += p['vy'] * step
+            p['life'] -= step
             if 0 < p['life']:
                 survived.append(p)
                 size = max(1, int(4 * (p['life'] / 18)))
@@ -286,15 +304,16 @@ class Overlay:
             cv2.putText(frame, label, (x - 20, y - 15), self.font_small, 0.5, color, 1, cv2.LINE_AA)
             # trails
             trail = self.trails.get(label, [])
-            trail.append((x, y))
-            if len(trail) > self.max_trail_len:
+            trail.append((x, y, now))
+            horizon = now - self.max_trail_len / ANIM_RATE
+            while len(trail) > self.max_trail_len or (len(trail) > 1 and trail[0][2] < horizon):
                 trail.pop(0)
             self.trails[label] = trail
             if len(trail) > 1:
                 trail_overlay = frame.copy()
                 for i in range(1, len(trail)):
-                    p1 = trail[i - 1]
-                    p2 = trail[i]
+                    p1 = trail[i - 1][:2]
+                    p2 = trail[i][:2]
                     c = self._palette_color(i)
                     cv2.line(trail_overlay, p1, p2, c, max(1, 4 - i // 3))
                 cv2.addWeighted(trail_overlay, 0.2 * self.alpha_scale, frame, 1 - 0.2 * self.alpha_scale, 0, frame)
@@ -308,7 +327,7 @@ class Overlay:
                     is_grip, grip_strength = False, 0.0
                 self._hand_handle(frame, x, y, label, cx, cy, max(intensity, grip_strength), angle_offset_rad=delta)
                 if is_grip:
-                    cv2.putText(frame, "Grip", (x + 18, y - 18), self.font_small, 0.6, self._palette_color(self.frame_no), 1, cv2.LINE_AA)
+                    cv2.putText(frame, "Grip", (x + 18, y - 18), self.font_small, 0.6, self._palette_color(self.tick), 1, cv2.LINE_AA)
 
         if len(hands) == 2:
             if isinstance(hands[0], tuple):
@@ -319,7 +338,7 @@ class Overlay:
                 p2 = (hands[1].x, hands[1].y)
             # neon glow line between hands (multi-color)
             for i, t in enumerate((6, 3, 1)):
-                cv2.line(frame, p1, p2, self._palette_color(i + self.frame_no), t)
+                cv2.line(frame, p1, p2, self._palette_color(i + self.tick), t)
 
         # Center reticle
         cv2.circle(frame, (cx, cy), 4, self.theme.accent, -1)
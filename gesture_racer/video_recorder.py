@@ -0,0 +1,160 @@
+"""Records the rendered HUD to a video file without stalling the loop.
+
+``submit(frame, t)`` only puts the frame on a bounded queue; when the
+encoder falls behind the frame is dropped (and counted) instead of blocking.
+An encoder thread (``VideoWriter.write`` releases the GIL) writes frames on a
+constant-rate timeline: each frame lands in slot ``round((t - t0) * fps)``, so
+gaps are filled by repeating the previous frame and bursts are thinned, and
+the file plays back at real speed. A fill is capped at ``max_fill_s``: a
+longer gap (a stall, a pause) is cut out of the timeline instead, so the file
+never balloons with one repeated frame. A ``<path>.timestamps.csv`` sidecar
+maps every encoded frame to its original capture time and the seconds cut
+just before it.
+
+Frames must not be modified after ``submit``.
+"""
+
+import os
+import queue
+import threading
+import time
+
+import cv2
+
+from gesture_racer.metrics import RollingStats
+from gesture_racer.threads import pin_current_thread
+
+_STOP = object()
+
+
+class HudRecorder:
+    def __init__(self, path: str, fps: float = 30.0, fourcc: str = "mp4v", queue_size: int = 8, max_fill_s: float = 1.0):
+        self.path = path
+        self.fps = fps
+        self.max_fill = max(1, int(round(max_fill_s * fps)))  # slots one frame may repeat over
+        self.fourcc = fourcc
+        self.timestamps_path = os.path.splitext(path)[0] + ".timestamps.csv"
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.submitted = 0
+        self.dropped = 0        # queue full: encoder lagging
+        self.encoded = 0        # distinct frames written
+        self.written = 0        # frames in the file, including repeats
+        self.skipped = 0        # frames sharing a slot with a later one
+        self.cuts = 0           # gaps longer than max_fill_s cut from the timeline
+        self.encode_time = RollingStats(240)
+        self.errors = 0
+        self.last_error: Exception | None = None
+        self._writer = None
+        self._start = None      # first capture time, for the sidecar
+        self._t0 = None         # slot origin; moves forward on every cut
+        self._next_slot = 0
+        self._abort = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="hud-recorder", daemon=True)
+        self._thread.start()
+
+    # --- loop side -----------------------------------------------------
+    def submit(self, frame, t: float) -> bool:
+        """Queue a frame; returns False (and counts a drop) if the encoder is behind."""
+        self.submitted += 1
+        try:
+            self._queue.put_nowait((frame, t))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self, timeout: float = 5.0):
+        """Finish queued frames and close the file.
+
+        After ``timeout`` the encoder drops whatever is still queued, so the
+        file is always finalized.
+        """
+        if not self._thread.is_alive():
+            return
+        deadline = time.perf_counter() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self._abort.set()
+            self._queue.put(_STOP)  # the aborted encoder empties the queue without writing
+        self._thread.join(max(0.0, deadline - time.perf_counter()))
+        if self._thread.is_alive():
+            self._abort.set()
+            self._thread.join()
+
+    # --- encoder thread ------------------------------------------------
+    def _open(self, frame):
+        h, w = frame.shape[:2]
+        writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (w, h))
+        if not writer.isOpened():
+            raise RuntimeError(f"Error: could not open video writer for '{self.path}' ({self.fourcc}).")
+        return writer
+
+    def _run(self):
+        pin_current_thread("recorder")
+        pending = None  # newest frame waiting for its slot to close
+        try:
+            with open(self.timestamps_path, "w") as stamps:
+                stamps.write("frame,slot,capture_time_s,cut_before_s\n")
+                while True:
+                    item = self._queue.get()
+                    if item is _STOP:
+                        break
+                    if self._abort.is_set():
+                        self.dropped += 1
+                        continue
+                    frame, t = item
+                    try:
+                        if self._writer is None:
+                            self._writer = self._open(frame)
+                            self._start = self._t0 = t
+                        slot = int(round((t - self._t0) * self.fps))
+                        cut = 0.0
+                        if pending is not None and slot - pending[2] > self.max_fill:
+                            # hold the last frame for max_fill slots, then drop the rest of the gap
+                            excess = slot - pending[2] - self.max_fill
+                            cut = excess / self.fps
+                            self._t0 += cut
+                            slot -= excess
+                            self.cuts += 1
+                        if pending is not None and slot > pending[2]:
+                            self._emit(stamps, *pending, repeat_until=slot)
+                        elif pending is not None:
+                            self.skipped += 1
+                            cut += pending[3]  # keep the cut on the row that gets written
+                        pending = (frame, t, max(slot, self._next_slot), cut)
+                    except Exception as exc:
+                        self.errors += 1
+                        self.last_error = exc
+                if pending is not None and self._writer is not None:
+                    self._emit(stamps, *pending, repeat_until=pending[2] + 1)
+        finally:
+            if self._writer is not None:
+                self._writer.release()
+
+    def _emit(self, stamps, frame, t, slot, cut, repeat_until):
+        t0 = time.perf_counter()
+        for s in range(slot, repeat_until):
+            if self._abort.is_set():
+                break
+            self._writer.write(frame)
+            self.written += 1
+        stamps.write(f"{self.encoded},{slot},{t - self._start:.6f},{cut:.6f}\n")
+        self.encoded += 1
+        self._next_slot = repeat_until
+        self.encode_time.add(time.perf_counter() - t0)
+
+    # --- stats -----------------------------------------------------------
+    def stats(self) -> dict:
+        mean = self.encode_time.mean
+        return {
+            "rec_submitted": self.submitted,
+            "rec_encoded": self.encoded,
+            "rec_written": self.written,
+            "rec_dropped": self.dropped,
+            "rec_skipped": self.skipped,
+            "rec_cuts": self.cuts,
+            "rec_queue": self._queue.qsize(),
+            "rec_encode_fps": 1.0 / mean if mean else 0.0,
+            "rec_errors": self.errors,
+        }
@@ -1,63 +1,25 @@
 import cv2
 import mediapipe as mp
-import ctypes
 import sys
 
-# ----------------- WINDOWS KEY CONTROL SETUP -----------------
-KEYEVENTF_SCANCODE = 0x0008
-KEYEVENTF_KEYUP = 0x0002
-INPUT_KEYBOARD = 1
-
-# --- Key scan codes ---
-KEYS = {
-    "w": 0x11,  # Forward
-    "a": 0x1E,  # Left
-    "s": 0x1F,  # Backward
-    "d": 0x20,  # Right
-}
-
-# --- ctypes structures ---
-PUL = ctypes.POINTER(ctypes.c_ulong)
-
-
-class KeyBdInput(ctypes.Structure):
-    _fields_ = [
-        ("wVk", ctypes.c_ushort),
-        ("wScan", ctypes.c_ushort),
-        ("dwFlags", ctypes.c_ulong),
-        ("time", ctypes.c_ulong),
-        ("dwExtraInfo", PUL),
-    ]
-
+from gesture_racer.input_backends import ScanCodeBackend
 
-class Input_I(ctypes.Union):
-    _fields_ = [("ki", KeyBdInput)]
-
-
-class Input(ctypes.Structure):
-    _fields_ = [("type", ctypes.c_ulong), ("ii", Input_I)]
-
-
-def _send_input(scan_code, flags):
-    """Internal: Sends a low-level keyboard event"""
-    extra = ctypes.c_ulong(0)
-    ki = KeyBdInput(0, scan_code, flags, 0, ctypes.pointer(extra))
-    ii_ = Input_I()
-    ii_.ki = ki
-    command = Input(ctypes.c_ulong(INPUT_KEYBOARD), ii_)
-    ctypes.windll.user32.SendInput(1, ctypes.pointer(command), ctypes.sizeof(command))
+# ----------------- WINDOWS KEY CONTROL SETUP -----------------
+# Movement keys sent as hardware scan codes via SendInput (see gesture_racer.input_backends)
+KEYS = ("w", "a", "s", "d")
+_backend = ScanCodeBackend()
 
 
 def press_key(key: str):
     """Press and hold a key"""
     if key.lower() in KEYS:
-        _send_input(KEYS[key.lower()], KEYEVENTF_SCANCODE)
+        _backend.press(key.lower())
 
 
 def release_key(key: str):
     """Release a pressed key"""
     if key.lower() in KEYS:
-        _send_input(KEYS[key.lower()], KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP)
+        _backend.release(key.lower())
 
 
 def release_all():
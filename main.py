@@ -1,18 +1,74 @@
-import cv2
 import time
 
-from gesture_racer.config import DEFAULT_CONFIG
-from gesture_racer.camera import Camera
-from gesture_racer.hand_tracking import HandTracker, HandData
-from gesture_racer.input_controller import InputController
-from gesture_racer.gestures import decide_actions
+STARTUP_T0 = time.perf_counter()  # taken before the heavier imports below
+
+import argparse
+import cv2
+from dataclasses import replace
+
+from gesture_racer.config import AppConfig, DEFAULT_CONFIG
+from gesture_racer.hand_tracking import HandData
+from gesture_racer.sources import open_tracking
+from gesture_racer.pipeline import PlayerPipeline
+from gesture_racer.players import group_hands
 from gesture_racer.ui.theme import get_theme
 from gesture_racer.ui.overlay import Overlay
 from gesture_racer.smoothing import LowPassFilter
+from gesture_racer.session import SessionRecorder
+from gesture_racer.metrics import MetricsExporter
+from gesture_racer.startup import StartupTimer
+from gesture_racer.profiling import SamplingProfiler
+from gesture_racer.memory import MemoryMonitor
+from gesture_racer.video_recorder import HudRecorder
+from gesture_racer.idle import IdleMode, draw_idle_hud
+from gesture_racer.timing import FramePacer
+from gesture_racer.threads import configure_threads, pin_current_thread, thread_stats
 
+# pollKey (OpenCV >= 4.5.3) pumps window events without waitKey's minimum sleep, which is
+# well over 1 ms on some systems; the loop rate is FramePacer's job
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
+
+def run(
+    cfg: AppConfig | None = None,
+    record_session: str | None = None,
+    metrics_out: str | None = None,
+    startup: StartupTimer | None = None,
+    profile_frames: int = 0,
+    profile_out: str | None = None,
+    record_video: str | None = None,
+):
+    cfg = cfg or DEFAULT_CONFIG
+    startup = startup or StartupTimer()
+    # before the tracker opens: mediapipe reads its thread hints when it is imported
+    for note in configure_threads(cfg):
+        print(note)
+    pin_current_thread("loop")
+    profiler = SamplingProfiler(interval_s=cfg.profile_interval_ms / 1000.0)
+    if profile_frames:
+        profiler.start(profile_frames, profile_out)
+    memory = MemoryMonitor(cfg.memory_tracemalloc).start() if cfg.memory_monitor else None
+    idle = IdleMode(cfg.idle_after_s, cfg.idle_detect_interval_s, cfg.idle_scale) if cfg.idle_after_s > 0 else None
+    pacer = FramePacer(cfg.fps_cap, cfg.pacing_spin_ms / 1000.0)
+
+    def mark(stage: str):
+        profiler.mark(stage)
+        if memory is not None:
+            memory.mark(stage)
+
+    def end_frame():
+        if idle is None or not idle.idle:
+            # idle frames are paced by the source
+            mark("pace")
+            pacer.wait()
+        mark("other")
+        if memory is not None:
+            memory.frame_done()
+        if idle is not None:
+            idle.frame_done()
+        if profiler.frame_done():
+            print(f"{profiler.summary} (details in {profiler.last_path})")
 
-def run():
-    cfg = DEFAULT_CONFIG
     theme_names = ["neo_green", "ocean_blue", "sunset_orange", "cyber_purple", "holo_flux", "dark_stealth", "dark_crimson", "dark_cyan"]
     try:
         theme_idx = max(0, theme_names.index(cfg.theme_name))
@@ -31,12 +87,28 @@ def run():
         scan_alpha=cfg.scanlines_alpha,
         hex_alpha=cfg.hex_alpha,
     )
-    controller = InputController(cfg.movement_keys)
+    # One pipeline (filters, hysteresis, key map) per driver
+    num_players = max(1, cfg.num_players)
+    if num_players == 1:
+        players = [PlayerPipeline(cfg, cfg.movement_keys, name="P1")]
+    else:
+        players = [
+            PlayerPipeline(cfg, cfg.player_key_maps[i % len(cfg.player_key_maps)], name=f"P{i + 1}")
+            for i in range(num_players)
+        ]
+    max_num_hands = max(cfg.max_num_hands, 2 * num_players) if num_players > 1 else cfg.max_num_hands
 
-    camera = Camera(index=cfg.camera_index, flip=cfg.frame_flip)
-    angle_filter = LowPassFilter(alpha=cfg.smoothing_alpha_angle, initial=0.0)
     fps_filter = LowPassFilter(alpha=0.2, initial=0.0)
+    display_fps_filter = LowPassFilter(alpha=0.2, initial=0.0)
     last_time = time.time()
+    last_display = last_time
+    display_period = 1.0 / cfg.display_hz if cfg.display_hz > 0 else 0.0
+    next_display = 0.0
+    last_motion = None  # (events, time), shown for a second even if they fired between HUD frames
+
+    recorder = SessionRecorder(record_session) if record_session else None
+    exporter = MetricsExporter(metrics_out) if metrics_out else None
+    video = HudRecorder(record_video, cfg.record_fps, cfg.record_fourcc, cfg.record_queue_size) if record_video else None
 
     # Live-tunable parameters
     steering_gain = cfg.steering_gain
@@ -45,40 +117,111 @@ def run():
     advanced_mode = cfg.advanced_ui
 
     try:
-        with HandTracker(
-            model_complexity=cfg.model_complexity,
-            max_num_hands=cfg.max_num_hands,
-            min_detection_confidence=cfg.min_detection_confidence,
-            min_tracking_confidence=cfg.min_tracking_confidence,
-        ) as tracker:
+        # the camera opens while the hand tracker warms up in the background
+        with open_tracking(cfg, max_num_hands) as source:
+            startup.mark("camera_open")
             while True:
-                frame = camera.read()
-
-                hands: list[HandData] = tracker.process(frame)
-                hands_tuples = [(h.x, h.y, h.label) for h in hands]
-
-                actions = decide_actions(
-                    hands_tuples,
-                    brake_distance_px=cfg.brake_distance_px,
-                    tilt_threshold=cfg.turn_tilt_threshold,
-                    steering_gain=steering_gain,
-                    max_steering_deg=cfg.max_steering_deg,
-                    turn_deadband_deg=turn_deadband_deg,
-                )
+                mark("tracker")
+                frame, frame_time, hands = source.read()
+                hands: list[HandData]
+                mark("decide")
+                tracking_ready = source.ready
+                if tracking_ready:
+                    startup.mark("tracker_ready")
+                if hands and startup.mark("first_gesture"):
+                    print(startup.report())
+                if idle is not None and tracking_ready:
+                    if idle.update(len(hands), frame_time):
+                        source.set_idle(idle.period, idle.scale)
+                        pacer.reset()
+                    if idle.idle:
+                        # nobody there: a dimmed frame a few times a second, no pipeline or overlay
+                        idle_frame = draw_idle_hud(frame)
+                        if video is not None:
+                            # keeps the recording's timeline continuous across idle periods
+                            video.submit(idle_frame, frame_time)
+                        mark("display")
+                        cv2.imshow("Gesture Racer", idle_frame)
+                        key = _poll_key() & 0xFF
+                        end_frame()
+                        now = time.time()
+                        if exporter is not None and exporter.due(now):
+                            exporter.write(now, {**source.stats(), **idle.stats()})
+                        if key == ord('q'):
+                            break
+                        continue
+                if recorder is not None:
+                    recorder.write(frame_time, frame.shape[1], frame.shape[0], hands)
+                groups = group_hands(hands, num_players, frame.shape[1], cfg.player_grouping)
+                for player, player_hands in zip(players, groups):
+                    player.process(player_hands, frame_time, frame.shape[1], frame.shape[0], steering_gain, turn_deadband_deg)
+                # The HUD wheel follows player 1; every player's hands are drawn
+                actions = players[0].actions
+                hands = [h for player in players for h in player.hands]
+                if actions.events:
+                    last_motion = (", ".join(actions.events), frame_time)
 
-                # Apply keyboard actions
-                # Smooth steering angle for more fluid visualization
-                actions.steering_angle = angle_filter.update(actions.steering_angle)
-                controller.apply_actions(actions.move, actions.turn)
+                # control-loop FPS (tracking + input), independent of the display rate
+                now = time.time()
+                fps_filter.update(1.0 / max(1e-6, now - last_time))
+                last_time = now
+
+                # The HUD is drawn and shown at display_hz; tracking and input keep the camera's pace
+                display_now = time.perf_counter()
+                if display_now < next_display:
+                    end_frame()
+                    continue
+                next_display = max(next_display + display_period, display_now)
+                display_fps_filter.update(1.0 / max(1e-6, now - last_display))
+                last_display = now
 
                 # Draw UI overlay
-                extra = [
+                mark("overlay")
+                extra = [] if tracking_ready else ["Initializing hand tracking..."]
+                extra += [
                     f"Gain: {steering_gain:.2f}",
                     f"Deadband: {turn_deadband_deg:.0f}°",
-                    f"Smooth: {smoothing_alpha:.2f}",
+                    f"Smooth: {smoothing_alpha:.2f}" if (cfg.steering_filter or "ema").lower() == "ema" else f"Filter: {cfg.steering_filter}",
                     f"Theme: {theme_names[theme_idx]}",
-                    f"FPS: {fps_filter.value:.0f}",
+                    f"FPS: {fps_filter.value:.0f} | HUD {display_fps_filter.value:.0f}",
+                    pacer.chip(),
                 ]
+                if num_players > 1:
+                    for player in players:
+                        extra.append(f"{player.name}: {player.actions.move} / {player.actions.turn}")
+                controller = players[0].controller
+                input_stats = controller.dispatch_stats()
+                event_rates = players[0].event_rates(frame_time)
+                if event_rates:
+                    extra.append(f"Events/s: {event_rates['raw_events_per_s']:.1f} -> {event_rates['events_per_s']:.1f}")
+                if last_motion is not None and frame_time - last_motion[1] < 1.0:
+                    extra.append(f"Motion: {last_motion[0]}")
+                if actions.poses:
+                    extra.append("Pose: " + ", ".join(actions.poses))
+                if controller.dispatcher is not None:
+                    extra.append(f"Input: {input_stats['latency_ms_p95']:.1f}ms p95")
+                if controller.pwm is not None:
+                    extra.append(
+                        f"PWM: {input_stats['pwm_duty'] * 100:.0f}% | jitter {input_stats['pwm_jitter_ms_p95']:.2f}ms p95"
+                    )
+                source_stats = source.stats()
+                if len(cfg.camera_sources) > 1:
+                    extra.append("Cams: " + " | ".join(
+                        f"{source_stats[f'cam{i}_fps']:.0f}fps {source_stats[f'cam{i}_skew_ms']:+.0f}ms"
+                        for i in range(len(cfg.camera_sources))
+                    ))
+                if "gate_skip_ratio" in source_stats:
+                    extra.append(f"Gate: skip {source_stats['gate_skip_ratio'] * 100:.0f}%")
+                if input_stats["errors"]:
+                    extra.append(f"Input errors: {input_stats['errors']}")
+                if memory is not None:
+                    extra.append(memory.chip())
+                if video is not None:
+                    extra.append(f"REC {video.encoded} | dropped {video.dropped}")
+                if profiler.active:
+                    extra.append(f"Profiling: {profiler.frames}/{profiler.frames + profiler.frames_left}")
+                elif profiler.summary:
+                    extra.append(profiler.summary)
                 overlay.draw(
                     frame,
                     hands,
@@ -89,14 +232,24 @@ def run():
                     grip_threshold_px=cfg.grip_threshold_px,
                 )
 
+                if video is not None:
+                    video.submit(frame, frame_time)
+                mark("display")
                 cv2.imshow("Gesture Racer", frame)
-                key = cv2.waitKey(1) & 0xFF
-                # update FPS after display
-                now = time.time()
-                dt = max(1e-6, now - last_time)
-                last_time = now
-                fps = 1.0 / dt
-                fps_filter.update(fps)
+                key = _poll_key() & 0xFF
+                startup.mark("first_frame")
+                end_frame()
+                if exporter is not None and exporter.due(now):
+                    metrics = {"fps": fps_filter.value, "display_fps": display_fps_filter.value, **event_rates, **input_stats, **source_stats, **startup.stats(), **pacer.stats(), **thread_stats()}
+                    if video is not None:
+                        metrics.update(video.stats())
+                    if idle is not None:
+                        metrics.update(idle.stats())
+                    if memory is not None:
+                        metrics.update(memory.stats())
+                        metrics["overlay_particles"] = len(overlay.particles)
+                        metrics["overlay_trail_points"] = sum(len(t) for t in overlay.trails.values())
+                    exporter.write(now, metrics)
                 if key == ord('q'):
                     break
                 elif key == ord('t'):
@@ -160,18 +313,77 @@ def run():
                 elif key == ord('h'):
                     # toggle debug chips
                     cfg.show_debug = not cfg.show_debug
+                elif key == ord('p'):
+                    # profile the next frames (press again to stop early)
+                    if profiler.active:
+                        profiler.stop()
+                        print(f"{profiler.summary} (details in {profiler.last_path})")
+                    else:
+                        profiler.start(cfg.profile_frames, profile_out)
                 elif key == ord('r'):
                     # reset tuning
                     steering_gain = cfg.steering_gain
                     turn_deadband_deg = cfg.turn_deadband_deg
                     smoothing_alpha = cfg.smoothing_alpha_angle
-                    angle_filter.alpha = smoothing_alpha
+                    for player in players:
+                        player.reset_filter()
 
     finally:
-        controller.release_all()
-        camera.release()
+        if "first_gesture" not in startup.marks:
+            print(startup.report())
+        if profiler.active:
+            profiler.stop()
+            print(f"{profiler.summary} (details in {profiler.last_path})")
+        if memory is not None:
+            memory.stop()
+        for player in players:
+            player.close()
+        if recorder is not None:
+            recorder.close()
+        if video is not None:
+            video.close()
+            stats = video.stats()
+            print(f"Recorded {stats['rec_encoded']} frames to {record_video} ({stats['rec_dropped']} dropped)")
+        if exporter is not None:
+            exporter.close()
         cv2.destroyAllWindows()
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gesture Racer - hand-gesture steering")
+    parser.add_argument("--record-session", metavar="PATH", help="write per-frame hand detections as JSON lines")
+    parser.add_argument("--record-video", metavar="PATH", help="record the HUD (e.g. demo.mp4) on a background thread")
+    parser.add_argument("--metrics-out", metavar="PATH", help="append a JSON line of live metrics every second")
+    parser.add_argument("--sources", help="comma-separated camera indices or video paths; the first is displayed")
+    parser.add_argument("--fps-cap", type=float, metavar="HZ", help="cap the frame loop rate (0 = uncapped)")
+    parser.add_argument("--players", type=int, help="number of drivers sharing the camera")
+    parser.add_argument("--grouping", choices=["zones", "cluster"], help="how hands are split between players")
+    parser.add_argument("--profile-frames", type=int, default=0, metavar="N", help="sample-profile the first N frames")
+    parser.add_argument("--memory", action="store_true", help="show memory/GC chips and export them with --metrics-out")
+    parser.add_argument("--profile-out", metavar="PATH", help="profile report path (default profile-<time>.txt)")
+    args = parser.parse_args(argv)
+
+    cfg = DEFAULT_CONFIG
+    if args.players:
+        cfg = replace(cfg, num_players=args.players)
+    if args.fps_cap is not None:
+        cfg = replace(cfg, fps_cap=args.fps_cap)
+    if args.sources:
+        cfg = replace(cfg, camera_sources=[s.strip() for s in args.sources.split(",") if s.strip()])
+    if args.grouping:
+        cfg = replace(cfg, player_grouping=args.grouping)
+    if args.memory:
+        cfg = replace(cfg, memory_monitor=True)
+    run(
+        cfg,
+        record_session=args.record_session,
+        metrics_out=args.metrics_out,
+        startup=StartupTimer(STARTUP_T0),
+        profile_frames=args.profile_frames,
+        profile_out=args.profile_out,
+        record_video=args.record_video,
+    )
+
+
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import numpy as np
+
+from gesture_racer.aio import GesturePipeline
+
+
+class SlowSource:
+    """Frames without hands; the first one only arrives after ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def read(self):
+        time.sleep(self.delay)
+        return np.zeros((48, 64, 3), dtype=np.uint8), time.perf_counter(), []
+
+
+def test_aclose_wakes_a_waiting_consumer():
+    async def scenario():
+        pipeline = GesturePipeline(source=SlowSource(0.3))
+        await pipeline.start()
+
+        async def consume():
+            return [output async for output in pipeline]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)  # consumer is waiting for the first frame
+        await pipeline.aclose()
+        return await asyncio.wait_for(consumer, timeout=2.0)
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_aclose_twice():
+    async def scenario():
+        async with GesturePipeline(source=SlowSource(0.0)) as pipeline:
+            await pipeline.aclose()
+
+    asyncio.run(scenario())
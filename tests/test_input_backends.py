@@ -0,0 +1,17 @@
+import pytest
+
+from gesture_racer.input_backends import InputBackend, NullBackend, RecordingBackend
+
+
+def test_incomplete_backend_fails_when_built():
+    class PressOnly(InputBackend):
+        def press(self, key: str):
+            pass
+
+    with pytest.raises(TypeError):
+        PressOnly()
+
+
+def test_builtin_backends_are_complete():
+    NullBackend().press("w")
+    RecordingBackend().release("w")
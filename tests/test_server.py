@@ -0,0 +1,47 @@
+from gesture_racer.client import GestureClient
+from gesture_racer.gestures import GestureOutput
+from gesture_racer.server import GestureServer
+
+ADDRESS = "udp://127.0.0.1:0"
+
+
+def _pair():
+    server = GestureServer(ADDRESS)
+    port = server.sock.getsockname()[1]
+    client = GestureClient(f"udp://127.0.0.1:{port}")
+    server.poll_subscriptions()
+    assert server.subscribers
+    return server, client
+
+
+def test_two_players_no_false_loss():
+    server, client = _pair()
+    try:
+        output = GestureOutput(move="forward", turn="straight", steering_angle=0.0, debug="")
+        for _ in range(10):
+            for player in (0, 1):
+                server.publish(output, player=player)
+        packets = [client.recv(timeout=1.0) for _ in range(20)]
+        assert all(p is not None for p in packets)
+        assert client.received == 20
+        assert client.lost == 0
+        assert [p.seq for p in packets if p.player == 1] == list(range(1, 11))
+    finally:
+        client.close()
+        server.close()
+
+
+def test_real_gap_is_counted_per_player():
+    server, client = _pair()
+    try:
+        output = GestureOutput(move="stop", turn="straight", steering_angle=0.0, debug="")
+        server.publish(output, player=1)
+        server.seqs[1] += 2  # two packets for player 1 that never went out
+        server.publish(output, player=1)
+        server.publish(output, player=0)
+        for _ in range(3):
+            assert client.recv(timeout=1.0) is not None
+        assert client.lost == 2
+    finally:
+        client.close()
+        server.close()
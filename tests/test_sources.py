@@ -0,0 +1,63 @@
+import time
+from dataclasses import replace
+from types import SimpleNamespace
+
+import numpy as np
+
+from gesture_racer.config import DEFAULT_CONFIG
+from gesture_racer.sources import MultiCameraTracker
+
+
+def _hand(label: str, x: float):
+    pts = np.zeros((21, 3), dtype=np.float32)
+    pts[:, 0], pts[:, 1] = x, 0.5
+    return SimpleNamespace(x=int(x * 640), y=240, label=label, score=1.0, landmarks=None, points=pts)
+
+
+def _tracker():
+    # workers are never started: each test writes their ``latest`` by hand
+    cfg = replace(DEFAULT_CONFIG, camera_sources=[0, 1], multicam_max_skew_ms=50.0)
+    return MultiCameraTracker(cfg)
+
+
+def test_frozen_primary_does_not_block_or_steer():
+    tracker = _tracker()
+    primary, secondary = tracker.workers
+    frame = np.full((480, 640, 3), 7, dtype=np.uint8)
+    t_frozen = time.perf_counter()
+    primary.latest = (1, t_frozen, frame, [_hand("Left", 0.3)])
+    secondary.latest = (1, t_frozen, frame.copy(), [_hand("Right", 0.7)])
+    _, _, hands = tracker.read(timeout=1.0)
+    assert sorted(h.label for h in hands) == ["Left", "Right"]
+
+    # the primary freezes; the secondary keeps delivering
+    for seq in range(2, 5):
+        secondary.latest = (seq, t_frozen + 0.1 * seq, frame.copy(), [_hand("Right", 0.7)])
+        t0 = time.perf_counter()
+        out_frame, t_ref, hands = tracker.read(timeout=1.0)
+        assert time.perf_counter() - t0 < 0.2
+        assert t_ref == t_frozen + 0.1 * seq
+        assert not out_frame.any()  # blank instead of the primary's already drawn frame
+        assert [h.label for h in hands] == ["Right"]  # the primary's stale hand sits out
+
+
+def test_healthy_primary_paces_and_fuses():
+    tracker = _tracker()
+    primary, secondary = tracker.workers
+    frame = np.full((480, 640, 3), 7, dtype=np.uint8)
+    t = time.perf_counter()
+    secondary.latest = (1, t - 0.01, frame.copy(), [_hand("Right", 0.7)])
+    primary.latest = (1, t, frame, [_hand("Left", 0.3)])
+    out_frame, t_ref, hands = tracker.read(timeout=1.0)
+    assert out_frame is frame and t_ref == t
+    assert sorted(h.label for h in hands) == ["Left", "Right"]
+
+
+def test_everything_stalled_releases_hands():
+    tracker = _tracker()
+    primary, _ = tracker.workers
+    frame = np.full((480, 640, 3), 7, dtype=np.uint8)
+    primary.latest = (1, time.perf_counter(), frame, [_hand("Left", 0.3)])
+    tracker.read(timeout=0.1)
+    _, _, hands = tracker.read(timeout=0.05)
+    assert hands == []
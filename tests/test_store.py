@@ -0,0 +1,42 @@
+import pytest
+
+from gesture_racer.bench.common import BenchResult
+from gesture_racer.bench import store
+
+
+def _save(directory, bench, name, value):
+    return store.save_run([BenchResult(name, [value] * 30)], bench, str(directory))
+
+
+def test_default_base_is_previous_run_of_same_bench(tmp_path, capsys):
+    old = _save(tmp_path, "overlay", "overlay.default", 1.0)
+    _save(tmp_path, "tracker", "tracker.c0", 5.0)
+    _save(tmp_path, "overlay", "overlay.default", 1.0)
+    rows = store.main(["--results-dir", str(tmp_path), "compare"])
+    assert [r["name"] for r in rows] == ["overlay.default"]
+    assert f"base {old}" in capsys.readouterr().out
+
+
+def test_no_common_names_is_an_error(tmp_path):
+    a = _save(tmp_path, "overlay", "overlay.default", 1.0)
+    b = _save(tmp_path, "tracker", "tracker.c0", 1.0)
+    with pytest.raises(SystemExit, match="nothing compared"):
+        store.main(["--results-dir", str(tmp_path), "compare", a, b])
+    with pytest.raises(SystemExit, match="no earlier 'tracker' run"):
+        store.main(["--results-dir", str(tmp_path), "compare"])
+
+
+def test_one_run_per_side_is_inconclusive(tmp_path, capsys):
+    base = _save(tmp_path, "overlay", "overlay.default", 1.0)
+    new = _save(tmp_path, "overlay", "overlay.default", 2.0)
+    rows = store.main(["--results-dir", str(tmp_path), "compare", base, new])
+    assert rows[0]["verdict"] == "inconclusive"
+    assert "inconclusive" in capsys.readouterr().out
+
+
+def test_regression_needs_two_runs_per_side(tmp_path):
+    base = [_save(tmp_path, "overlay", "overlay.default", 1.0) for _ in range(2)]
+    new = [_save(tmp_path, "overlay", "overlay.default", 2.0) for _ in range(2)]
+    with pytest.raises(SystemExit) as exc:
+        store.main(["--results-dir", str(tmp_path), "compare", ",".join(base), ",".join(new)])
+    assert exc.value.code == 1
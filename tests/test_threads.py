@@ -0,0 +1,33 @@
+import os
+from dataclasses import replace
+
+import pytest
+
+from gesture_racer import threads
+from gesture_racer.config import DEFAULT_CONFIG
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux-only affinity")
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(threads, "_process_cpus", None)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2, 3})
+    monkeypatch.setattr(os, "sched_setaffinity", lambda pid, cpus: recorded.append(set(cpus)))
+    yield recorded
+    threads._affinity.clear()
+
+
+def test_unconfigured_stage_returns_to_process_cpus(calls):
+    threads.configure_threads(replace(DEFAULT_CONFIG, cpu_affinity={"loop": [0]}))
+    assert threads.pin_current_thread("loop") is True
+    assert threads.pin_current_thread("tracker") is False
+    assert calls == [{0}, {0, 1, 2, 3}]
+
+
+def test_no_affinity_leaves_threads_alone(calls):
+    threads.configure_threads(replace(DEFAULT_CONFIG, cpu_affinity={}))
+    assert threads.pin_current_thread("loop") is False
+    assert threads.pin_current_thread("input") is False
+    assert calls == []
@@ -0,0 +1,49 @@
+import csv
+import time
+
+import numpy as np
+
+from gesture_racer.video_recorder import HudRecorder
+
+
+def test_long_gap_is_cut_not_filled(tmp_path):
+    rec = HudRecorder(str(tmp_path / "hud.mp4"), fps=30.0, max_fill_s=1.0)
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    for t in (0.0, 0.033, 600.0, 600.033):
+        rec.submit(frame, t)
+    t0 = time.perf_counter()
+    rec.close()
+    assert time.perf_counter() - t0 < 5.0
+    assert rec.errors == 0
+    assert rec.cuts == 1
+    assert rec.written <= 4 + 30
+    with open(rec.timestamps_path) as f:
+        rows = list(csv.DictReader(f))
+    assert [float(r["capture_time_s"]) for r in rows] == [0.0, 0.033, 600.0, 600.033]
+    assert float(rows[2]["cut_before_s"]) > 590.0
+
+
+class _SlowWriter:
+    def __init__(self):
+        self.released = False
+
+    def write(self, frame):
+        time.sleep(0.05)
+
+    def release(self):
+        self.released = True
+
+
+def test_close_is_bounded_and_releases_the_writer(tmp_path):
+    rec = HudRecorder(str(tmp_path / "hud.mp4"), fps=30.0, queue_size=8)
+    writer = _SlowWriter()
+    rec._open = lambda frame: writer
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    for i in range(40):
+        rec.submit(frame, i / 30.0)
+        time.sleep(0.002)
+    t0 = time.perf_counter()
+    rec.close(timeout=0.3)
+    assert time.perf_counter() - t0 < 1.0
+    assert not rec._thread.is_alive()
+    assert writer.released